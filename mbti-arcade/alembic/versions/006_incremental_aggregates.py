@@ -0,0 +1,59 @@
+"""incremental aggregate running sums
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+RUNNING_SUM_COLUMNS = (
+    "weight_total",
+    "ei_wsum",
+    "sn_wsum",
+    "tf_wsum",
+    "jp_wsum",
+    "ei_wsq",
+    "sn_wsq",
+    "tf_wsq",
+    "jp_wsq",
+)
+
+
+def upgrade() -> None:
+    # Existing aggregates keep NULL running sums and are rebuilt lazily on
+    # their next read or submit.
+    with op.batch_alter_table("aggregates") as batch_op:
+        for column in RUNNING_SUM_COLUMNS:
+            batch_op.add_column(sa.Column(column, sa.Float(), nullable=True))
+
+    op.create_table(
+        "aggregate_raters",
+        sa.Column("session_id", sa.String(length=36), nullable=False),
+        sa.Column("rater_hash", sa.String(length=64), nullable=False),
+        sa.Column("weight", sa.Float(), nullable=False),
+        sa.Column("ei_norm", sa.Float(), nullable=False),
+        sa.Column("sn_norm", sa.Float(), nullable=False),
+        sa.Column("tf_norm", sa.Float(), nullable=False),
+        sa.Column("jp_norm", sa.Float(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["session_id"], ["sessions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("session_id", "rater_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("aggregate_raters")
+    with op.batch_alter_table("aggregates") as batch_op:
+        for column in reversed(RUNNING_SUM_COLUMNS):
+            batch_op.drop_column(column)
@@ -0,0 +1,40 @@
+"""aggregate staleness versions
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "responses_version",
+                sa.Integer(),
+                nullable=False,
+                server_default="0",
+            )
+        )
+
+    with op.batch_alter_table("aggregates") as batch_op:
+        batch_op.add_column(sa.Column("version", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("aggregates") as batch_op:
+        batch_op.drop_column("version")
+
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.drop_column("responses_version")
@@ -0,0 +1,39 @@
+"""relation aggregate dirty marker on sessions
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "relations_dirty",
+                sa.Boolean(),
+                nullable=False,
+                server_default=sa.false(),
+            )
+        )
+
+    # Rows written before this revision were only refreshed on read; let the
+    # first owner read recompute them once.
+    sessions = sa.table("sessions", sa.column("relations_dirty", sa.Boolean()))
+    op.execute(sessions.update().values(relations_dirty=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.drop_column("relations_dirty")
@@ -0,0 +1,51 @@
+"""secondary indexes for hot lookup paths
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns).  relation_aggregates(session_id, relation) is
+# already served by the uq_relation_per_session unique index.
+INDEXES = (
+    ("ix_participants_session_submitted", "participants", ["session_id", "answers_submitted_at"]),
+    ("ix_responses_other_participant_id", "responses_other", ["participant_id"]),
+    ("ix_audit_events_session_created", "audit_events", ["session_id", "created_at", "id"]),
+    (
+        "ix_couple_responses_session_participant_kind",
+        "couple_responses",
+        ["session_id", "participant_id", "kind"],
+    ),
+)
+
+
+def upgrade() -> None:
+    # The couple tables are created by the application on startup, so they
+    # may not exist yet on a database migrated purely through Alembic.
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    for name, table, columns in INDEXES:
+        if table not in tables:
+            continue
+        if name in {index["name"] for index in inspector.get_indexes(table)}:
+            continue
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    for name, table, _ in reversed(INDEXES):
+        if table in tables and name in {index["name"] for index in inspector.get_indexes(table)}:
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,64 @@
+"""respondent counters on sessions
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "respondent_count",
+                sa.Integer(),
+                nullable=False,
+                server_default="0",
+            )
+        )
+        batch_op.add_column(
+            sa.Column("last_submitted_at", sa.DateTime(timezone=True), nullable=True)
+        )
+
+    sessions = sa.table(
+        "sessions",
+        sa.column("id", sa.String()),
+        sa.column("respondent_count", sa.Integer()),
+        sa.column("last_submitted_at", sa.DateTime(timezone=True)),
+    )
+    participants = sa.table(
+        "participants",
+        sa.column("session_id", sa.String()),
+        sa.column("answers_submitted_at", sa.DateTime(timezone=True)),
+    )
+    submitted = sa.and_(
+        participants.c.session_id == sessions.c.id,
+        participants.c.answers_submitted_at.isnot(None),
+    )
+    op.execute(
+        sessions.update().values(
+            respondent_count=sa.select(sa.func.count())
+            .where(submitted)
+            .scalar_subquery(),
+            last_submitted_at=sa.select(sa.func.max(participants.c.answers_submitted_at))
+            .where(submitted)
+            .scalar_subquery(),
+        )
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.drop_column("last_submitted_at")
+        batch_op.drop_column("respondent_count")
@@ -0,0 +1,113 @@
+"""keep participant answers only in participant_answers
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+responses_other = sa.table(
+    "responses_other",
+    sa.column("session_id", sa.String()),
+    sa.column("rater_hash", sa.String()),
+    sa.column("participant_id", sa.Integer()),
+    sa.column("question_id", sa.Integer()),
+    sa.column("value", sa.Integer()),
+    sa.column("relation_tag", sa.String()),
+    sa.column("created_at", sa.DateTime(timezone=True)),
+    sa.column("updated_at", sa.DateTime(timezone=True)),
+)
+participant_answers = sa.table(
+    "participant_answers",
+    sa.column("participant_id", sa.Integer()),
+    sa.column("question_id", sa.Integer()),
+    sa.column("value", sa.Integer()),
+    sa.column("created_at", sa.DateTime(timezone=True)),
+    sa.column("updated_at", sa.DateTime(timezone=True)),
+)
+participants = sa.table(
+    "participants",
+    sa.column("id", sa.Integer()),
+    sa.column("session_id", sa.String()),
+    sa.column("relation", sa.String()),
+)
+
+
+def _participant_hash(participant_id) -> sa.ColumnElement:
+    return sa.literal("participant:") + sa.cast(participant_id, sa.String())
+
+
+def upgrade() -> None:
+    # Rows submitted on behalf of a registered participant duplicate its
+    # participant_answers set.  Copy over anything missing, then drop them.
+    participant_copy = sa.and_(
+        responses_other.c.participant_id.isnot(None),
+        responses_other.c.rater_hash == _participant_hash(responses_other.c.participant_id),
+        sa.exists().where(participants.c.id == responses_other.c.participant_id),
+    )
+    already_answered = sa.exists().where(
+        participant_answers.c.participant_id == responses_other.c.participant_id,
+        participant_answers.c.question_id == responses_other.c.question_id,
+    )
+    op.execute(
+        participant_answers.insert().from_select(
+            ["participant_id", "question_id", "value", "created_at", "updated_at"],
+            sa.select(
+                responses_other.c.participant_id,
+                responses_other.c.question_id,
+                responses_other.c.value,
+                responses_other.c.created_at,
+                responses_other.c.updated_at,
+            ).where(participant_copy, ~already_answered),
+        )
+    )
+    op.execute(responses_other.delete().where(participant_copy))
+
+
+def downgrade() -> None:
+    already_copied = sa.exists().where(
+        responses_other.c.session_id == participants.c.session_id,
+        responses_other.c.rater_hash == _participant_hash(participants.c.id),
+        responses_other.c.question_id == participant_answers.c.question_id,
+    )
+    op.execute(
+        responses_other.insert().from_select(
+            [
+                "session_id",
+                "rater_hash",
+                "participant_id",
+                "question_id",
+                "value",
+                "relation_tag",
+                "created_at",
+                "updated_at",
+            ],
+            sa.select(
+                participants.c.session_id,
+                _participant_hash(participants.c.id),
+                participants.c.id,
+                participant_answers.c.question_id,
+                participant_answers.c.value,
+                # Enum names are stored; relation tags use the lowercase values.
+                sa.func.lower(participants.c.relation),
+                participant_answers.c.created_at,
+                participant_answers.c.updated_at,
+            )
+            .select_from(
+                participant_answers.join(
+                    participants, participants.c.id == participant_answers.c.participant_id
+                )
+            )
+            .where(~already_copied),
+        )
+    )
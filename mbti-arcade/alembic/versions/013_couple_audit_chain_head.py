@@ -0,0 +1,73 @@
+"""store the audit chain head on couple_sessions and digest versions on audit_events
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "013"
+down_revision = "012"
+branch_labels = None
+depends_on = None
+
+couple_sessions = sa.table(
+    "couple_sessions",
+    sa.column("id", sa.String()),
+    sa.column("last_audit_hash", sa.String()),
+)
+audit_events = sa.table(
+    "audit_events",
+    sa.column("id", sa.Integer()),
+    sa.column("session_id", sa.String()),
+    sa.column("hash", sa.String()),
+    sa.column("created_at", sa.DateTime(timezone=True)),
+)
+
+
+def _couple_tables_exist() -> bool:
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    return {"couple_sessions", "audit_events"} <= tables
+
+
+def upgrade() -> None:
+    if not _couple_tables_exist():
+        return
+    columns = {col["name"] for col in sa.inspect(op.get_bind()).get_columns("couple_sessions")}
+    if "last_audit_hash" not in columns:
+        with op.batch_alter_table("couple_sessions") as batch:
+            batch.add_column(sa.Column("last_audit_hash", sa.String(length=64), nullable=True))
+
+    latest = (
+        sa.select(audit_events.c.hash)
+        .where(audit_events.c.session_id == couple_sessions.c.id)
+        .order_by(audit_events.c.created_at.desc(), audit_events.c.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    op.execute(couple_sessions.update().values(last_audit_hash=latest))
+
+    # Existing events keep NULL: their digests hashed a timestamp that was
+    # never stored, so verify_chain checks only their links.
+    event_columns = {col["name"] for col in sa.inspect(op.get_bind()).get_columns("audit_events")}
+    if "digest_version" not in event_columns:
+        with op.batch_alter_table("audit_events") as batch:
+            batch.add_column(sa.Column("digest_version", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    if not _couple_tables_exist():
+        return
+    event_columns = {col["name"] for col in sa.inspect(op.get_bind()).get_columns("audit_events")}
+    if "digest_version" in event_columns:
+        with op.batch_alter_table("audit_events") as batch:
+            batch.drop_column("digest_version")
+    columns = {col["name"] for col in sa.inspect(op.get_bind()).get_columns("couple_sessions")}
+    if "last_audit_hash" in columns:
+        with op.batch_alter_table("couple_sessions") as batch:
+            batch.drop_column("last_audit_hash")
@@ -0,0 +1,60 @@
+"""one decision packet per session and digest
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "014"
+down_revision = "013"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "uq_decision_packet_sha"
+COLUMNS = ["session_id", "packet_sha256"]
+
+decision_packets = sa.table(
+    "decision_packets",
+    sa.column("id", sa.Integer()),
+    sa.column("session_id", sa.String()),
+    sa.column("packet_sha256", sa.String()),
+)
+
+
+def _existing_keys() -> set[str] | None:
+    """Index and unique-constraint names on decision_packets, if it exists."""
+
+    inspector = sa.inspect(op.get_bind())
+    if "decision_packets" not in inspector.get_table_names():
+        return None
+    names = {index["name"] for index in inspector.get_indexes("decision_packets")}
+    names.update(
+        constraint["name"]
+        for constraint in inspector.get_unique_constraints("decision_packets")
+    )
+    return names
+
+
+def upgrade() -> None:
+    keys = _existing_keys()
+    if keys is None or INDEX_NAME in keys:
+        return
+
+    # Keep the oldest row of any digest stored twice before enforcing one.
+    oldest = sa.select(sa.func.min(decision_packets.c.id)).group_by(
+        decision_packets.c.session_id, decision_packets.c.packet_sha256
+    )
+    op.execute(decision_packets.delete().where(decision_packets.c.id.not_in(oldest)))
+    op.create_index(INDEX_NAME, "decision_packets", COLUMNS, unique=True)
+
+
+def downgrade() -> None:
+    keys = _existing_keys()
+    if keys is not None and INDEX_NAME in keys:
+        op.drop_index(INDEX_NAME, table_name="decision_packets")
@@ -0,0 +1,52 @@
+"""fingerprint couple answers so unchanged results are not recomputed
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+# (table, column).  All start NULL; the next compute_result of a session
+# fills them from the answers it reads.
+COLUMNS = (
+    ("couple_sessions", "responses_fingerprint"),
+    ("couple_participants", "answers_fingerprint"),
+    ("couple_results", "input_fingerprint"),
+    ("couple_results", "packet_sha256"),
+)
+
+
+def _existing_columns() -> dict[str, set[str]]:
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    return {
+        table: {column["name"] for column in inspector.get_columns(table)}
+        for table in {table for table, _ in COLUMNS}
+        if table in tables
+    }
+
+
+def upgrade() -> None:
+    existing = _existing_columns()
+    for table, column in COLUMNS:
+        if table in existing and column not in existing[table]:
+            with op.batch_alter_table(table) as batch:
+                batch.add_column(sa.Column(column, sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    existing = _existing_columns()
+    for table, column in reversed(COLUMNS):
+        if column in existing.get(table, set()):
+            with op.batch_alter_table(table) as batch:
+                batch.drop_column(column)
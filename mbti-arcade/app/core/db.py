@@ -5,20 +5,46 @@ from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel, create_engine
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./mbti.db")
+from app.utils.db_pool import InstrumentedQueuePool, instrument_engine, pool_options
+from app.utils.sqlite_pragmas import install_sqlite_pragmas
+
+# "separate" keeps Pair/Response/Friend in their own database (mbti.db by
+# default); "shared" stores them in the main database behind its engine.
+LEGACY_DB_MODE = os.getenv("LEGACY_DB_MODE", "separate").strip().lower()
+if LEGACY_DB_MODE not in {"separate", "shared"}:
+    raise ValueError(f"LEGACY_DB_MODE must be 'separate' or 'shared', got {LEGACY_DB_MODE!r}")
 
 
 def _is_testing() -> bool:
     return os.getenv("TESTING") == "1" or "pytest" in sys.modules
 
 
-_engine_kwargs: dict[str, object] = {"echo": False, "pool_pre_ping": True}
-if DATABASE_URL.startswith("sqlite"):
-    _engine_kwargs["connect_args"] = {"check_same_thread": False}
-    if _is_testing() and ":memory:" in DATABASE_URL:
-        _engine_kwargs["poolclass"] = StaticPool
+def _create_legacy_engine(url: str):
+    engine_kwargs: dict[str, object] = {"echo": False}
+    pool_kwargs = pool_options("CORE_DB")
+    if url.startswith("sqlite"):
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+        if _is_testing() and ":memory:" in url:
+            engine_kwargs["poolclass"] = StaticPool
+    if ":memory:" in url:
+        # One shared in-memory connection: pool sizing does not apply.
+        pool_kwargs = {"pool_pre_ping": pool_kwargs["pool_pre_ping"]}
+    else:
+        engine_kwargs["poolclass"] = InstrumentedQueuePool
+    engine_kwargs.update(pool_kwargs)
+
+    legacy_engine = create_engine(url, **engine_kwargs)
+    install_sqlite_pragmas(legacy_engine)
+    instrument_engine("core", legacy_engine)
+    return legacy_engine
+
+
+if LEGACY_DB_MODE == "shared":
+    from app.database import DATABASE_URL, engine
+else:
+    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./mbti.db")
+    engine = _create_legacy_engine(DATABASE_URL)
 
-engine = create_engine(DATABASE_URL, **_engine_kwargs)
 SessionLocal = sessionmaker(engine, expire_on_commit=False)
 
 
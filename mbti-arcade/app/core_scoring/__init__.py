@@ -4,6 +4,8 @@ The module keeps pure computations isolated from persistence so that
 FastAPI handlers, Celery tasks, or offline scripts can import the same
 logic.  All helpers operate on in-memory dictionaries to make unit
 testing straightforward and to support deterministic decision packets.
+Complete answer sets are scored through the position-indexed arrays in
+:mod:`app.core_scoring.compiled`.
 """
 
 from __future__ import annotations
@@ -58,6 +60,11 @@ class MissingResponsesError(ScoringValidationError):
     """Raised when an answer set is incomplete for the required scales."""
 
 
+# The compiled spec is built from the metadata above, so import it only once
+# that is defined.
+from .compiled import COMPILED, ArrayScores, score_arrays  # noqa: E402
+
+
 # === Core helpers ============================================================
 
 
@@ -69,18 +76,15 @@ def score_item(code: str, value: int) -> float:
     the positive pole.
     """
 
+    position = COMPILED.positions.get(code)
+    if position is not None:
+        return COMPILED.normalize(position, value)
+
+    # Codes outside the questionnaire score as plain 0..4 items.
     if value is None:
         raise ScoringValidationError(f"value is required for item {code}")
-    upper_bound = 10 if code == "SF1" else 4
-    if value < 0 or value > upper_bound:
-        raise ScoringValidationError(
-            f"value for {code} must be within 0..{upper_bound}, received {value}"
-        )
-    if code in REV_ITEMS:
-        return float(4 - value)
-    if code == "SF1":
-        # SF1는 0–10 점수를 0–4 척도로 정규화한다.
-        return float(value) * 0.4
+    if value < 0 or value > 4:
+        raise ScoringValidationError(f"value for {code} must be within 0..4, received {value}")
     return float(value)
 
 
@@ -109,7 +113,11 @@ def scale_mean(codes: Sequence[str], answers: Dict[str, int]) -> float:
 def compute_scale_means(answers: Dict[str, int]) -> Dict[str, float]:
     """Compute average scores for each scale from the raw answers."""
 
-    return {scale: scale_mean(codes, answers) for scale, codes in SCALES.items()}
+    values = COMPILED.pack(answers)
+    if values is None:
+        # Incomplete: the per-scale path reports which items are missing.
+        return {scale: scale_mean(codes, answers) for scale, codes in SCALES.items()}
+    return COMPILED.by_scale(COMPILED.scale_means(values))
 
 
 @dataclass(frozen=True)
@@ -128,6 +136,22 @@ def compute_deltas(
 ) -> DeltaBundle:
     """Return absolute deltas per item and averaged per scale for both partners."""
 
+    packed = [
+        COMPILED.pack(answers)
+        for answers in (answers_a_self, answers_a_guess, answers_b_self, answers_b_guess)
+    ]
+    if all(values is not None for values in packed):
+        a_self, a_guess, b_self, b_guess = packed
+        items_a = COMPILED.item_deltas(a_guess, b_self)
+        items_b = COMPILED.item_deltas(b_guess, a_self)
+        return DeltaBundle(
+            delta_items_a=COMPILED.by_code(items_a),
+            delta_items_b=COMPILED.by_code(items_b),
+            delta_scales_a=COMPILED.by_scale(COMPILED.scale_averages(items_a)),
+            delta_scales_b=COMPILED.by_scale(COMPILED.scale_averages(items_b)),
+        )
+
+    # Partial answer sets only compare the items both sides answered.
     # Item-level deltas (absolute difference between guess and the other person's self).
     delta_items_a = {
         code: abs(float(answers_a_guess.get(code, 0)) - float(answers_b_self.get(code, 0)))
@@ -337,9 +361,61 @@ def summarize_gap(delta_scales_a: Dict[str, float], delta_scales_b: Dict[str, fl
     }
 
 
+# === Full couple result ======================================================
+
+
+def score_couple(
+    a_self: Dict[str, int],
+    a_guess: Dict[str, int],
+    b_self: Dict[str, int],
+    b_guess: Dict[str, int],
+) -> dict:
+    """Score four complete answer sets into the fields of a couple result.
+
+    Keys match the ``couple_results`` columns: ``scales``, ``deltas``,
+    ``flags``, ``insights``, ``top_delta_items`` and ``gap_summary``.
+    """
+
+    packed = [COMPILED.pack(answers) for answers in (a_self, a_guess, b_self, b_guess)]
+    if any(values is None for values in packed):
+        raise MissingResponsesError("all four answer sets must cover every item")
+    scores = score_arrays(*packed)
+
+    scales_a_self = COMPILED.by_scale(scores.scale_means_a_self)
+    scales_b_self = COMPILED.by_scale(scores.scale_means_b_self)
+    delta_scales_a = COMPILED.by_scale(scores.scale_deltas_a)
+    delta_scales_b = COMPILED.by_scale(scores.scale_deltas_b)
+
+    combined_scales = {
+        scale: (scales_a_self[scale] + scales_b_self[scale]) / 2 for scale in scales_a_self
+    }
+    raw_self_combined = {code: min(a_self[code], b_self[code]) for code in COMPILED.codes}
+    flags = flag_rules(combined_scales, raw_self_combined)
+
+    return {
+        "scales": {
+            "A": {"self": scales_a_self, "guess": COMPILED.by_scale(scores.scale_means_a_guess)},
+            "B": {"self": scales_b_self, "guess": COMPILED.by_scale(scores.scale_means_b_guess)},
+        },
+        "deltas": {
+            "items_a": COMPILED.by_code(scores.item_deltas_a),
+            "items_b": COMPILED.by_code(scores.item_deltas_b),
+            "scales_a": delta_scales_a,
+            "scales_b": delta_scales_b,
+        },
+        "flags": flags,
+        "insights": build_insights(delta_scales_a, delta_scales_b, flags),
+        "top_delta_items": scores.top_items,
+        "gap_summary": summarize_gap(delta_scales_a, delta_scales_b),
+    }
+
+
 __all__ = [
     "SCALES",
     "REV_ITEMS",
+    "COMPILED",
+    "ArrayScores",
+    "score_arrays",
     "ScoringValidationError",
     "MissingResponsesError",
     "score_item",
@@ -352,4 +428,5 @@ __all__ = [
     "build_insights",
     "gap_grade",
     "summarize_gap",
+    "score_couple",
 ]
@@ -0,0 +1,233 @@
+"""Array form of the couple questionnaire for the scoring hot path.
+
+``COMPILED`` fixes every item code to a position (scale order, then item
+order, matching ``SCALES``) and stores the per-item normalisation as
+``offset + coef * value`` together with each item's scale position.  Answer
+sets become fixed-length int sequences, so scoring a couple is one loop over
+48 positions with no per-item code checks or dict lookups.
+
+The dict helpers in :mod:`app.core_scoring` pack complete answer sets and
+delegate here; the results are bit-for-bit the same floats.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Sequence, Tuple
+
+from . import REV_ITEMS, SCALES, ScoringValidationError
+
+# SF1 is answered on 0..10 and scaled onto the 0..4 range of every other item.
+WIDE_ITEMS: Mapping[str, Tuple[int, float]] = {"SF1": (10, 0.4)}
+DEFAULT_UPPER_BOUND = 4
+
+
+@dataclass(frozen=True)
+class CompiledQuestionnaire:
+    """Position-indexed view of ``SCALES`` and the item scoring rules."""
+
+    codes: Tuple[str, ...]
+    scales: Tuple[str, ...]
+    positions: Mapping[str, int]
+    item_scale: array
+    scale_sizes: Tuple[int, ...]
+    upper_bounds: array
+    offsets: array
+    coefs: array
+    # (upper bound, scale position, offset, coef) per position, for the loop
+    # in ``score_arrays``.
+    layout: Tuple[Tuple[int, int, float, float], ...]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def pack(self, answers: Mapping[str, int]) -> List[int] | None:
+        """Answers in position order, or ``None`` when any item is missing."""
+
+        try:
+            return [answers[code] for code in self.codes]
+        except KeyError:
+            return None
+
+    def by_scale(self, values: Sequence[float]) -> Dict[str, float]:
+        return dict(zip(self.scales, values))
+
+    def by_code(self, values: Sequence[float]) -> Dict[str, float]:
+        return dict(zip(self.codes, values))
+
+    def normalize(self, position: int, value: int) -> float:
+        if value is None:
+            raise ScoringValidationError(f"value is required for item {self.codes[position]}")
+        upper = self.upper_bounds[position]
+        if value < 0 or value > upper:
+            raise ScoringValidationError(
+                f"value for {self.codes[position]} must be within 0..{upper}, received {value}"
+            )
+        return self.offsets[position] + self.coefs[position] * value
+
+    def scale_means(self, values: Sequence[int]) -> List[float]:
+        self._check_length(values)
+        sums = [0.0] * len(self.scales)
+        for position, ((upper, scale, offset, coef), value) in enumerate(zip(self.layout, values)):
+            if value is None or not 0 <= value <= upper:
+                self.normalize(position, value)  # raises with the item code
+            sums[scale] += offset + coef * value
+        return [total / size for total, size in zip(sums, self.scale_sizes)]
+
+    def item_deltas(self, guess: Sequence[int], other_self: Sequence[int]) -> List[float]:
+        self._check_length(guess)
+        self._check_length(other_self)
+        return [float(abs(g - s)) for g, s in zip(guess, other_self)]
+
+    def scale_averages(self, item_values: Sequence[float]) -> List[float]:
+        sums = [0.0] * len(self.scales)
+        for scale, value in zip(self.item_scale, item_values):
+            sums[scale] += value
+        return [total / size for total, size in zip(sums, self.scale_sizes)]
+
+    def top_items(
+        self, deltas_a: Sequence[float], deltas_b: Sequence[float], limit: int
+    ) -> List[str]:
+        # nsmallest on the negated value keeps ties in position order, like
+        # the stable sort in ``rank_top_delta_items``.
+        combined = [max(a, b) for a, b in zip(deltas_a, deltas_b)]
+        best = heapq.nsmallest(limit, range(len(combined)), key=lambda i: -combined[i])
+        return [self.codes[position] for position in best]
+
+    def _check_length(self, values: Sequence[object]) -> None:
+        if len(values) != len(self.codes):
+            raise ScoringValidationError(
+                f"expected {len(self.codes)} answers, received {len(values)}"
+            )
+
+
+def compile_questionnaire(
+    scales: Mapping[str, Sequence[str]] = SCALES,
+    reverse_items: frozenset[str] | set[str] = REV_ITEMS,
+) -> CompiledQuestionnaire:
+    codes: List[str] = []
+    item_scale = array("b")
+    upper_bounds = array("b")
+    offsets = array("d")
+    coefs = array("d")
+    for scale_position, scale_codes in enumerate(scales.values()):
+        for code in scale_codes:
+            codes.append(code)
+            item_scale.append(scale_position)
+            upper, coef = WIDE_ITEMS.get(code, (DEFAULT_UPPER_BOUND, 1.0))
+            upper_bounds.append(upper)
+            # Reverse-coded items score as 4 - value.
+            if code in reverse_items:
+                offsets.append(4.0)
+                coefs.append(-1.0)
+            else:
+                offsets.append(0.0)
+                coefs.append(coef)
+    return CompiledQuestionnaire(
+        codes=tuple(codes),
+        scales=tuple(scales),
+        positions=MappingProxyType({code: position for position, code in enumerate(codes)}),
+        item_scale=item_scale,
+        scale_sizes=tuple(len(scale_codes) for scale_codes in scales.values()),
+        upper_bounds=upper_bounds,
+        offsets=offsets,
+        coefs=coefs,
+        layout=tuple(zip(upper_bounds, item_scale, offsets, coefs)),
+    )
+
+
+COMPILED = compile_questionnaire()
+
+
+class ArrayScores(NamedTuple):
+    """Output of :func:`score_arrays`, indexed like ``COMPILED``."""
+
+    scale_means_a_self: List[float]
+    scale_means_a_guess: List[float]
+    scale_means_b_self: List[float]
+    scale_means_b_guess: List[float]
+    item_deltas_a: List[float]
+    item_deltas_b: List[float]
+    scale_deltas_a: List[float]
+    scale_deltas_b: List[float]
+    top_items: List[str]
+
+
+def score_arrays(
+    a_self: Sequence[int],
+    a_guess: Sequence[int],
+    b_self: Sequence[int],
+    b_guess: Sequence[int],
+    *,
+    limit: int = 5,
+    spec: CompiledQuestionnaire = COMPILED,
+) -> ArrayScores:
+    """Scale means, item and scale deltas and the top ``limit`` items in one pass.
+
+    Each argument holds one answer per position of ``spec``.  A's item delta
+    compares A's guess with B's self answer and vice versa.
+    """
+
+    for values in (a_self, a_guess, b_self, b_guess):
+        spec._check_length(values)
+
+    scale_count = len(spec.scales)
+    sums_a_self = [0.0] * scale_count
+    sums_a_guess = [0.0] * scale_count
+    sums_b_self = [0.0] * scale_count
+    sums_b_guess = [0.0] * scale_count
+    sums_delta_a = [0.0] * scale_count
+    sums_delta_b = [0.0] * scale_count
+    item_deltas_a: List[float] = []
+    item_deltas_b: List[float] = []
+
+    for position, ((upper, scale, offset, coef), as_value, ag_value, bs_value, bg_value) in enumerate(
+        zip(spec.layout, a_self, a_guess, b_self, b_guess)
+    ):
+        if not (
+            0 <= as_value <= upper
+            and 0 <= ag_value <= upper
+            and 0 <= bs_value <= upper
+            and 0 <= bg_value <= upper
+        ):
+            for value in (as_value, ag_value, bs_value, bg_value):
+                spec.normalize(position, value)  # raises with the item code
+        sums_a_self[scale] += offset + coef * as_value
+        sums_a_guess[scale] += offset + coef * ag_value
+        sums_b_self[scale] += offset + coef * bs_value
+        sums_b_guess[scale] += offset + coef * bg_value
+        delta_a = float(abs(ag_value - bs_value))
+        delta_b = float(abs(bg_value - as_value))
+        item_deltas_a.append(delta_a)
+        item_deltas_b.append(delta_b)
+        sums_delta_a[scale] += delta_a
+        sums_delta_b[scale] += delta_b
+
+    sizes = spec.scale_sizes
+
+    def means(sums: List[float]) -> List[float]:
+        return [total / size for total, size in zip(sums, sizes)]
+
+    return ArrayScores(
+        scale_means_a_self=means(sums_a_self),
+        scale_means_a_guess=means(sums_a_guess),
+        scale_means_b_self=means(sums_b_self),
+        scale_means_b_guess=means(sums_b_guess),
+        item_deltas_a=item_deltas_a,
+        item_deltas_b=item_deltas_b,
+        scale_deltas_a=means(sums_delta_a),
+        scale_deltas_b=means(sums_delta_b),
+        top_items=spec.top_items(item_deltas_a, item_deltas_b, limit),
+    )
+
+
+__all__ = [
+    "COMPILED",
+    "ArrayScores",
+    "CompiledQuestionnaire",
+    "compile_questionnaire",
+    "score_arrays",
+]
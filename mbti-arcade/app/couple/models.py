@@ -11,6 +11,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -37,6 +38,10 @@ class CoupleSession(Base, TimestampMixin):
     stage1_snapshot: Mapped[dict | None] = mapped_column(JSON, default=None)
     expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     last_computed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Hash of the newest audit event; the chain head for the next append.
+    last_audit_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # Hash over both participants' answer fingerprints; None until both are known.
+    responses_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     participants: Mapped[list["CoupleParticipant"]] = relationship(
         back_populates="session", cascade="all, delete-orphan"
@@ -69,6 +74,8 @@ class CoupleParticipant(Base, TimestampMixin):
     access_token: Mapped[str] = mapped_column(
         String(64), default=lambda: uuid4().hex, unique=True, nullable=False
     )
+    # Hash of this participant's self and guess answers, set on every upsert.
+    answers_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     session: Mapped[CoupleSession] = relationship(back_populates="participants")
     responses: Mapped[list["CoupleResponse"]] = relationship(
@@ -86,6 +93,12 @@ class CoupleResponse(Base, TimestampMixin):
             "kind",
             name="uq_response_unique",
         ),
+        Index(
+            "ix_couple_responses_session_participant_kind",
+            "session_id",
+            "participant_id",
+            "kind",
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -114,12 +127,19 @@ class CoupleResult(Base, TimestampMixin):
     insights: Mapped[list[dict] | None] = mapped_column(JSON, nullable=True)
     top_delta_items: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
     gap_summary: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # What this result was computed from, and the packet that records it.
+    input_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    packet_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     session: Mapped[CoupleSession] = relationship(back_populates="result")
 
 
 class DecisionPacket(Base, TimestampMixin):
     __tablename__ = "decision_packets"
+    __table_args__ = (
+        # One row per digest: an unchanged recompute reuses its packet.
+        UniqueConstraint("session_id", "packet_sha256", name="uq_decision_packet_sha"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     session_id: Mapped[str] = mapped_column(String(36), ForeignKey("couple_sessions.id"))
@@ -134,6 +154,10 @@ class DecisionPacket(Base, TimestampMixin):
 
 class AuditEvent(Base, TimestampMixin):
     __tablename__ = "audit_events"
+    __table_args__ = (
+        # Per-session walk in created order (chain verification).
+        Index("ix_audit_events_session_created", "session_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     session_id: Mapped[str | None] = mapped_column(
@@ -145,6 +169,8 @@ class AuditEvent(Base, TimestampMixin):
     payload: Mapped[dict | None] = mapped_column(JSON)
     prev_hash: Mapped[str | None] = mapped_column(String(64))
     hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # NULL on events written before the digest covered only stored columns.
+    digest_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
     code_ref: Mapped[str | None] = mapped_column(String(64))
 
     session: Mapped[CoupleSession | None] = relationship(back_populates="audit_events")
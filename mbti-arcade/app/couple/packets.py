@@ -0,0 +1,197 @@
+"""Canonical encoding and storage for couple decision packets.
+
+A packet records every input and output of one ``compute_result`` run.  The
+four answer maps and the item deltas are stored as one hex digit per question
+code in sorted code order, rather than as dicts keyed by code; the inputs then
+take a few hundred bytes.  The outputs keep their scale dicts, flags and
+insights as-is, so a whole packet is still around 3.4 kB (about 5.2 kB when
+decoded).  ``packet_sha256`` is the digest of that canonical encoding, so
+recomputing an unchanged session gives the same digest.
+
+When ``DECISION_PACKET_DIR`` is set, payloads are written to a
+content-addressed directory and the ``decision_packets`` row keeps only the
+format tag and ``storage_url``.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Sequence
+from urllib.parse import unquote, urlparse
+
+log = logging.getLogger("perception_gap.couple")
+
+PACKET_FORMAT = "packet.v2"
+ANSWER_KEYS = ("a_self", "a_guess", "b_self", "b_guess")
+ITEM_DELTA_KEYS = ("items_a", "items_b")
+
+
+def pack_values(mapping: Mapping[str, float], codes: Sequence[str]) -> str:
+    """One hex digit per code; values must be whole numbers from 0 to 15."""
+
+    digits = []
+    for code in codes:
+        value = mapping[code]
+        if value != int(value) or not 0 <= value <= 15:
+            raise ValueError(f"{code}={value!r} cannot be packed")
+        digits.append(format(int(value), "x"))
+    return "".join(digits)
+
+
+def unpack_values(packed: str, codes: Sequence[str]) -> Dict[str, int]:
+    return {code: int(digit, 16) for code, digit in zip(codes, packed)}
+
+
+def canonical_bytes(payload: Mapping[str, object]) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def encode_packet(
+    *,
+    answers: Mapping[str, Mapping[str, int]],
+    k_state: Mapping[str, object],
+    stage1_snapshot: Mapping[str, object] | None,
+    outputs: Mapping[str, object],
+    code_ref: str,
+    model_id: str,
+) -> tuple[dict, str]:
+    """Return the compact payload for one result and its SHA-256 digest."""
+
+    codes = sorted(answers[ANSWER_KEYS[0]])
+    deltas = dict(outputs.get("deltas") or {})
+    for key in ITEM_DELTA_KEYS:
+        if key in deltas:
+            deltas[key] = pack_values(deltas[key], codes)
+    payload = {
+        "format": PACKET_FORMAT,
+        "codes": codes,
+        "inputs": {
+            **{key: pack_values(answers[key], codes) for key in ANSWER_KEYS},
+            "k_state": dict(k_state),
+            "stage1_snapshot": stage1_snapshot,
+        },
+        "outputs": {**outputs, "deltas": deltas},
+        "code_ref": code_ref,
+        "model_id": model_id,
+    }
+    return payload, sha256(canonical_bytes(payload)).hexdigest()
+
+
+def decode_packet(payload: Mapping[str, object]) -> dict:
+    """Expand packed answer and delta strings back into dicts keyed by code.
+
+    Payloads written before the compact format are returned unchanged.
+    """
+
+    if payload.get("format") != PACKET_FORMAT:
+        return dict(payload)
+    codes = payload["codes"]
+    inputs = dict(payload["inputs"])
+    for key in ANSWER_KEYS:
+        inputs[key] = unpack_values(inputs[key], codes)
+    outputs = dict(payload["outputs"])
+    deltas = dict(outputs.get("deltas") or {})
+    for key in ITEM_DELTA_KEYS:
+        if key in deltas:
+            unpacked = unpack_values(deltas[key], codes)
+            deltas[key] = {code: float(value) for code, value in unpacked.items()}
+    outputs["deltas"] = deltas
+    decoded = {key: value for key, value in payload.items() if key not in {"format", "codes"}}
+    decoded.update(inputs=inputs, outputs=outputs)
+    return decoded
+
+
+class PacketBlobStore:
+    """Content-addressed directory of packet payloads, one file per digest.
+
+    Files live at ``<root>/<digest[:2]>/<digest>.json``; writing a digest that
+    is already present is a no-op, so identical packets share one file.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def put(self, digest: str, data: bytes) -> str:
+        path = self.path_for(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(data)
+                os.replace(tmp_name, path)
+            except OSError:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+                raise
+        return path.resolve().as_uri()
+
+    def digests(self) -> Iterable[str]:
+        return (path.stem for path in self.root.glob("*/*.json"))
+
+
+def offload_payload(payload: dict, digest: str) -> tuple[dict, str | None]:
+    """The ``(payload, storage_url)`` to store on a ``decision_packets`` row.
+
+    With a blob store configured the payload moves there and the row keeps
+    only the format tag; otherwise, or if the write fails, it stays inline.
+    """
+
+    store = packet_blob_store
+    if store is None:
+        return payload, None
+    try:
+        storage_url = store.put(digest, canonical_bytes(payload))
+    except OSError as exc:
+        log.warning(
+            "Decision packet offload failed",
+            extra={"packet_sha256": digest, "error": str(exc)},
+        )
+        return payload, None
+    return {"format": payload["format"]}, storage_url
+
+
+def read_packet_payload(payload: Mapping[str, object], storage_url: str | None) -> dict:
+    """The decoded payload of a ``decision_packets`` row, wherever it is kept."""
+
+    if storage_url:
+        path = Path(unquote(urlparse(storage_url).path))
+        payload = json.loads(path.read_bytes())
+    return decode_packet(payload)
+
+
+def _build_default_store() -> PacketBlobStore | None:
+    raw_dir = os.getenv("DECISION_PACKET_DIR", "").strip()
+    if not raw_dir:
+        return None
+    try:
+        return PacketBlobStore(Path(raw_dir).expanduser())
+    except OSError as exc:
+        # Packets stay inline in the table if the directory is unusable.
+        log.warning("Decision packet store unavailable", extra={"path": raw_dir, "error": str(exc)})
+        return None
+
+
+packet_blob_store = _build_default_store()
+
+
+__all__ = [
+    "PACKET_FORMAT",
+    "PacketBlobStore",
+    "canonical_bytes",
+    "decode_packet",
+    "encode_packet",
+    "offload_payload",
+    "pack_values",
+    "packet_blob_store",
+    "read_packet_payload",
+    "unpack_values",
+]
@@ -63,6 +63,9 @@ class ResponseUpsertRequest(BaseModel):
     stage: int = Field(default=2, ge=2, le=3)
     self_answers: List[AnswerPayload]
     guess_answers: List[AnswerPayload]
+    # replace: the payload is the full answer set.  merge: only the codes sent
+    # are written (autosave); unsent codes keep their saved value.
+    mode: str = Field(default="replace", pattern="^(replace|merge)$")
 
 
 class ResponseUpsertResponse(BaseModel):
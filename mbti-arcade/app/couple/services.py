@@ -4,22 +4,16 @@ from __future__ import annotations
 
 import json
 import os
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha256
 from typing import Dict, Iterable
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
-from app.core_scoring import (
-    DeltaBundle,
-    build_insights,
-    compute_deltas,
-    compute_scale_means,
-    flag_rules,
-    rank_top_delta_items,
-    summarize_gap,
-)
+from app.core_scoring import score_couple
+from app.couple import packets
 from app.couple.constants import QUESTION_REGISTRY
 from app.couple.models import (
     AuditEvent,
@@ -41,10 +35,13 @@ from app.couple.schemas import (
     SavedResponses,
     StageOneSnapshot,
 )
+from app.services.answer_store import replace_rows
 from app.utils.problem_details import ProblemDetailsException
 
 
 QUESTION_CODES = set(QUESTION_REGISTRY.keys())
+ANSWER_KINDS = ("self", "guess")
+MODEL_ID = "core_scoring.v1"
 
 
 def _ensure_question_codes(answers: Dict[str, int]) -> None:
@@ -59,6 +56,58 @@ def _ensure_question_codes(answers: Dict[str, int]) -> None:
         )
 
 
+@dataclass(frozen=True)
+class ChainVerification:
+    ok: bool
+    checked: int
+    broken_event_id: int | None = None
+    reason: str | None = None
+
+
+def _answers_fingerprint(self_answers: Dict[str, int], guess_answers: Dict[str, int]) -> str:
+    canonical = json.dumps(
+        {"self": self_answers, "guess": guess_answers}, sort_keys=True, separators=(",", ":")
+    )
+    return sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _session_fingerprint(participants: Iterable[CoupleParticipant]) -> str | None:
+    by_role = {participant.role: participant.answers_fingerprint for participant in participants}
+    if not (by_role.get("A") and by_role.get("B")):
+        return None
+    return sha256(f"A:{by_role['A']}|B:{by_role['B']}".encode("utf-8")).hexdigest()
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    # SQLite hands back naive datetimes; stored results must serialise the
+    # same way as freshly computed ones.
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+# Events without a digest_version hashed a timestamp that was never stored,
+# so only their prev_hash links can be checked.
+AUDIT_DIGEST_VERSION = 1
+
+
+def _audit_digest(
+    prev_hash: str | None, event_type: str, payload: dict | None, created_at: datetime
+) -> str:
+    """Chain digest of one audit event, computed only from persisted columns."""
+
+    body = json.dumps(
+        {
+            "event_type": event_type,
+            "payload": payload,
+            "ts": _as_utc(created_at).astimezone(timezone.utc).isoformat(),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return sha256(((prev_hash or "") + body).encode("utf-8")).hexdigest()
+
+
 def _resolve_code_ref() -> str:
     return (
         os.getenv("GIT_SHA")
@@ -105,7 +154,7 @@ class CoupleService:
             self.db.add(participant)
 
         self.db.flush()
-        self._log_event(
+        self.log_event(
             session,
             event_type="session.created",
             payload={
@@ -119,14 +168,14 @@ class CoupleService:
         return envelope
 
     def update_stage_one(self, session_id: str, snapshot: StageOneSnapshot) -> CoupleSessionEnvelope:
-        session = self._get_session(session_id)
+        session = self._get_session(session_id, for_update=True)
         session.k_value = snapshot.k
         session.k_visible = snapshot.visible and snapshot.k >= session.k_threshold
         if snapshot.k >= session.k_threshold and snapshot.visible:
             session.stage = max(session.stage, 2)
         session.stage1_snapshot = snapshot.model_dump()
         self.db.flush()
-        self._log_event(
+        self.log_event(
             session,
             event_type="stage1.updated",
             payload=session.stage1_snapshot,
@@ -143,8 +192,9 @@ class CoupleService:
     def upsert_responses(
         self, session_id: str, request: ResponseUpsertRequest
     ) -> ResponseUpsertResponse:
-        session = self._get_session(session_id)
-        participant = self._get_participant(session, request.access_token)
+        session, participant = self._resolve_participant(
+            session_id, request.access_token, for_update=True
+        )
 
         if request.stage < session.stage:
             raise ProblemDetailsException(
@@ -177,50 +227,52 @@ class CoupleService:
                     type_suffix="stage-order",
                 )
 
-        # Clear existing entries for idempotency.
-        self.db.query(CoupleResponse).filter(
-            CoupleResponse.session_id == session.id,
-            CoupleResponse.participant_id == participant.id,
-            CoupleResponse.kind == "self",
-        ).delete(synchronize_session=False)
-        self.db.query(CoupleResponse).filter(
-            CoupleResponse.session_id == session.id,
-            CoupleResponse.participant_id == participant.id,
-            CoupleResponse.kind == "guess",
-        ).delete(synchronize_session=False)
-
-        for code, value in self_answers.items():
-            self.db.add(
-                CoupleResponse(
-                    session_id=session.id,
-                    participant_id=participant.id,
-                    question_code=code,
-                    kind="self",
-                    value=value,
-                    stage=request.stage,
-                )
+        if request.mode == "merge":
+            written, self_answers, guess_answers = self._merge_answers(
+                session, participant, request.stage, self_answers, guess_answers
             )
-        for code, value in guess_answers.items():
-            self.db.add(
-                CoupleResponse(
-                    session_id=session.id,
-                    participant_id=participant.id,
-                    question_code=code,
-                    kind="guess",
-                    value=value,
-                    stage=request.stage,
+            if not written:
+                # Repeated autosave of unchanged answers: nothing to record.
+                return self._upsert_envelope(
+                    session, participant, request.stage, self_answers, guess_answers
                 )
+        else:
+            # Replace both answer sets in one delete and one bulk insert so
+            # the write stays idempotent.
+            replace_rows(
+                self.db,
+                CoupleResponse,
+                [
+                    CoupleResponse.session_id == session.id,
+                    CoupleResponse.participant_id == participant.id,
+                    CoupleResponse.kind.in_(ANSWER_KINDS),
+                ],
+                [
+                    {
+                        "session_id": session.id,
+                        "participant_id": participant.id,
+                        "question_code": code,
+                        "kind": kind,
+                        "value": value,
+                        "stage": request.stage,
+                    }
+                    for kind, answers in (("self", self_answers), ("guess", guess_answers))
+                    for code, value in answers.items()
+                ],
             )
 
         self._mark_completion(session, participant.role, self_answers, guess_answers)
+        participant.answers_fingerprint = _answers_fingerprint(self_answers, guess_answers)
+        session.responses_fingerprint = _session_fingerprint(session.participants)
         self.db.flush()
 
-        self._log_event(
+        self.log_event(
             session,
             event_type="responses.upserted",
             payload={
                 "role": participant.role,
                 "stage": request.stage,
+                "mode": request.mode,
                 "self_completed": session.a_self_completed if participant.role == "A" else session.b_self_completed,
                 "guess_completed": session.a_guess_completed if participant.role == "A" else session.b_guess_completed,
                 "k_value": session.k_value,
@@ -228,52 +280,29 @@ class CoupleService:
             },
         )
 
-        return ResponseUpsertResponse(
-            session_id=session.id,
-            role=participant.role,
-            stage=request.stage,
-            self_completed=self._is_complete(self_answers),
-            guess_completed=self._is_complete(guess_answers),
-            stage_progress={
-                "a_self_completed": session.a_self_completed,
-                "a_guess_completed": session.a_guess_completed,
-                "b_self_completed": session.b_self_completed,
-                "b_guess_completed": session.b_guess_completed,
-            },
+        return self._upsert_envelope(
+            session, participant, request.stage, self_answers, guess_answers
         )
 
     def fetch_responses(self, session_id: str, access_token: str) -> SavedResponses:
         session, participant = self._resolve_participant(session_id, access_token)
 
-        self_rows = self.db.scalars(
-            select(CoupleResponse)
-            .where(
-                CoupleResponse.session_id == session.id,
-                CoupleResponse.participant_id == participant.id,
-                CoupleResponse.kind == "self",
-            )
-        ).all()
-        guess_rows = self.db.scalars(
-            select(CoupleResponse)
-            .where(
-                CoupleResponse.session_id == session.id,
-                CoupleResponse.participant_id == participant.id,
-                CoupleResponse.kind == "guess",
-            )
-        ).all()
+        saved: Dict[str, Dict[str, int]] = {kind: {} for kind in ANSWER_KINDS}
+        for _, kind, code, value, _ in self._saved_rows(session, participant):
+            saved[kind][code] = value
 
         return SavedResponses(
             session_id=session.id,
             role=participant.role,
-            self_answers={row.question_code: row.value for row in self_rows},
-            guess_answers={row.question_code: row.value for row in guess_rows},
+            self_answers=saved["self"],
+            guess_answers=saved["guess"],
         )
 
     # ------------------------------------------------------------------
     # Result computation
     # ------------------------------------------------------------------
     def compute_result(self, session_id: str) -> CoupleResultEnvelope:
-        session = self._get_session(session_id)
+        session = self._get_session(session_id, for_update=True)
         if not (
             session.a_self_completed
             and session.a_guess_completed
@@ -287,27 +316,49 @@ class CoupleService:
                 type_suffix="stage-incomplete",
             )
 
-        responses = self.db.scalars(
-            select(CoupleResponse).where(CoupleResponse.session_id == session.id)
+        # Nothing that feeds the result changed since the last compute: serve
+        # the stored result and packet without reading responses.
+        input_key = self._result_input_key(session)
+        stored = session.result
+        if input_key is not None and stored is not None and stored.input_fingerprint == input_key:
+            packet = self.db.scalar(
+                select(DecisionPacket)
+                .where(
+                    DecisionPacket.session_id == session.id,
+                    DecisionPacket.packet_sha256 == stored.packet_sha256,
+                )
+                .limit(1)
+            )
+            if packet is not None:
+                return self._result_to_envelope(session, stored, packet)
+
+        # Roles come from the same joined query, so no per-row participant load.
+        responses = self.db.execute(
+            select(
+                CoupleParticipant.role,
+                CoupleResponse.kind,
+                CoupleResponse.question_code,
+                CoupleResponse.value,
+            )
+            .join(CoupleParticipant, CoupleResponse.participant_id == CoupleParticipant.id)
+            .where(CoupleResponse.session_id == session.id)
         ).all()
 
         a_self: Dict[str, int] = {}
         a_guess: Dict[str, int] = {}
         b_self: Dict[str, int] = {}
         b_guess: Dict[str, int] = {}
+        targets = {
+            ("A", "self"): a_self,
+            ("A", "guess"): a_guess,
+            ("B", "self"): b_self,
+            ("B", "guess"): b_guess,
+        }
 
-        for row in responses:
-            target = None
-            if row.participant.role == "A" and row.kind == "self":
-                target = a_self
-            elif row.participant.role == "A" and row.kind == "guess":
-                target = a_guess
-            elif row.participant.role == "B" and row.kind == "self":
-                target = b_self
-            elif row.participant.role == "B" and row.kind == "guess":
-                target = b_guess
+        for role, kind, question_code, value in responses:
+            target = targets.get((role, kind))
             if target is not None:
-                target[row.question_code] = row.value
+                target[question_code] = value
 
         for mapping, label in (
             (a_self, "A.self"),
@@ -325,43 +376,14 @@ class CoupleService:
                     errors={label: sorted(missing_codes)[:10]},
                 )
 
-        scales_a_self = compute_scale_means(a_self)
-        scales_a_guess = compute_scale_means(a_guess)
-        scales_b_self = compute_scale_means(b_self)
-        scales_b_guess = compute_scale_means(b_guess)
-
-        deltas: DeltaBundle = compute_deltas(a_self, a_guess, b_self, b_guess)
-        top_items = rank_top_delta_items(deltas.delta_items_a, deltas.delta_items_b)
-
-        combined_scales = {
-            scale: (scales_a_self[scale] + scales_b_self[scale]) / 2
-            for scale in scales_a_self
-        }
-        raw_self_combined = {
-            code: min(a_self.get(code, 4), b_self.get(code, 4))
-            for code in QUESTION_CODES
-        }
-
-        flags = flag_rules(combined_scales, raw_self_combined)
-        insights = build_insights(deltas.delta_scales_a, deltas.delta_scales_b, flags)
-        gap_summary = summarize_gap(deltas.delta_scales_a, deltas.delta_scales_b)
+        outputs = score_couple(a_self, a_guess, b_self, b_guess)
+        top_items = outputs["top_delta_items"]
+        gap_summary = outputs["gap_summary"]
 
         # Persist result snapshot.
         result = session.result or CoupleResult(session_id=session.id)
-        result.scales = {
-            "A": {"self": scales_a_self, "guess": scales_a_guess},
-            "B": {"self": scales_b_self, "guess": scales_b_guess},
-        }
-        result.deltas = {
-            "items_a": deltas.delta_items_a,
-            "items_b": deltas.delta_items_b,
-            "scales_a": deltas.delta_scales_a,
-            "scales_b": deltas.delta_scales_b,
-        }
-        result.flags = flags
-        result.insights = insights
-        result.top_delta_items = top_items
-        result.gap_summary = gap_summary
+        for field, value in outputs.items():
+            setattr(result, field, value)
         session.result = result
 
         session.stage = max(session.stage, 3)
@@ -377,7 +399,18 @@ class CoupleService:
             result=result,
         )
 
-        self._log_event(
+        # Sessions answered before fingerprints existed pick them up here.
+        answers_by_role = {"A": (a_self, a_guess), "B": (b_self, b_guess)}
+        for participant in session.participants:
+            if participant.role in answers_by_role:
+                participant.answers_fingerprint = _answers_fingerprint(
+                    *answers_by_role[participant.role]
+                )
+        session.responses_fingerprint = _session_fingerprint(session.participants)
+        result.input_fingerprint = self._result_input_key(session)
+        result.packet_sha256 = packet.packet_sha256
+
+        self.log_event(
             session,
             event_type="result.computed",
             payload={
@@ -399,8 +432,20 @@ class CoupleService:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _get_session(self, session_id: str) -> CoupleSession:
-        session = self.db.get(CoupleSession, session_id)
+    def _get_session(self, session_id: str, *, for_update: bool = False) -> CoupleSession:
+        """Load a session; ``for_update`` locks the row for the rest of the transaction.
+
+        Write paths lock so that both partners' requests serialise on the
+        session and each audit event extends the chain head the other wrote.
+        """
+
+        options = {}
+        if for_update:
+            # get() does not autoflush, and the reload would otherwise drop a
+            # chain head advanced earlier in this transaction.
+            self.db.flush()
+            options = {"with_for_update": True, "populate_existing": True}
+        session = self.db.get(CoupleSession, session_id, **options)
         if session is None:
             raise ProblemDetailsException(
                 status_code=404,
@@ -428,11 +473,129 @@ class CoupleService:
         return participant
 
     def _resolve_participant(
-        self, session_id: str, access_token: str
+        self, session_id: str, access_token: str, *, for_update: bool = False
     ) -> tuple[CoupleSession, CoupleParticipant]:
-        session = self._get_session(session_id)
-        participant = self._get_participant(session, access_token)
-        return session, participant
+        stmt = (
+            select(CoupleSession, CoupleParticipant)
+            .join(CoupleParticipant, CoupleParticipant.session_id == CoupleSession.id)
+            .where(
+                CoupleSession.id == session_id,
+                CoupleParticipant.access_token == access_token,
+            )
+        )
+        if for_update:
+            stmt = stmt.with_for_update(of=CoupleSession).execution_options(
+                populate_existing=True
+            )
+        row = self.db.execute(stmt).first()
+        if row is None:
+            # Only the failure path pays for telling a missing session (404)
+            # from a wrong token (403).
+            session = self._get_session(session_id)
+            self._get_participant(session, access_token)
+            raise AssertionError("unreachable: the join found no participant")
+        return row[0], row[1]
+
+    def _saved_rows(self, session: CoupleSession, participant: CoupleParticipant) -> list:
+        """``(id, kind, code, value, stage)`` of both answer kinds in one query."""
+
+        return self.db.execute(
+            select(
+                CoupleResponse.id,
+                CoupleResponse.kind,
+                CoupleResponse.question_code,
+                CoupleResponse.value,
+                CoupleResponse.stage,
+            ).where(
+                CoupleResponse.session_id == session.id,
+                CoupleResponse.participant_id == participant.id,
+                CoupleResponse.kind.in_(ANSWER_KINDS),
+            )
+        ).all()
+
+    def _merge_answers(
+        self,
+        session: CoupleSession,
+        participant: CoupleParticipant,
+        stage: int,
+        self_answers: Dict[str, int],
+        guess_answers: Dict[str, int],
+    ) -> tuple[int, Dict[str, int], Dict[str, int]]:
+        """Write only new or changed codes; return the count and merged sets."""
+
+        current = {
+            (kind, code): (row_id, value, row_stage)
+            for row_id, kind, code, value, row_stage in self._saved_rows(session, participant)
+        }
+        merged: Dict[str, Dict[str, int]] = {kind: {} for kind in ANSWER_KINDS}
+        for (kind, code), (_, value, _) in current.items():
+            merged[kind][code] = value
+
+        inserts: list[dict] = []
+        updates: list[dict] = []
+        for kind, answers in (("self", self_answers), ("guess", guess_answers)):
+            for code, value in answers.items():
+                merged[kind][code] = value
+                saved = current.get((kind, code))
+                if saved is None:
+                    inserts.append(
+                        {
+                            "session_id": session.id,
+                            "participant_id": participant.id,
+                            "question_code": code,
+                            "kind": kind,
+                            "value": value,
+                            "stage": stage,
+                        }
+                    )
+                elif saved[1:] != (value, stage):
+                    updates.append({"id": saved[0], "value": value, "stage": stage})
+
+        if updates:
+            self.db.execute(update(CoupleResponse), updates)
+        if inserts:
+            self.db.execute(insert(CoupleResponse), inserts)
+        return len(inserts) + len(updates), merged["self"], merged["guess"]
+
+    def _upsert_envelope(
+        self,
+        session: CoupleSession,
+        participant: CoupleParticipant,
+        stage: int,
+        self_answers: Dict[str, int],
+        guess_answers: Dict[str, int],
+    ) -> ResponseUpsertResponse:
+        return ResponseUpsertResponse(
+            session_id=session.id,
+            role=participant.role,
+            stage=stage,
+            self_completed=self._is_complete(self_answers),
+            guess_completed=self._is_complete(guess_answers),
+            stage_progress={
+                "a_self_completed": session.a_self_completed,
+                "a_guess_completed": session.a_guess_completed,
+                "b_self_completed": session.b_self_completed,
+                "b_guess_completed": session.b_guess_completed,
+            },
+        )
+
+    def _result_input_key(self, session: CoupleSession) -> str | None:
+        """Everything besides scoring code that the result and packet depend on."""
+
+        if session.responses_fingerprint is None:
+            return None
+        canonical = json.dumps(
+            {
+                "responses": session.responses_fingerprint,
+                "k_state": [session.k_threshold, session.k_value, session.k_visible],
+                "stage1_snapshot": session.stage1_snapshot,
+                "code_ref": self.code_ref,
+                "model_id": MODEL_ID,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return sha256(canonical.encode("utf-8")).hexdigest()
 
     def _answers_to_dict(self, answers: Iterable) -> Dict[str, int]:
         seen: Dict[str, int] = {}
@@ -497,24 +660,25 @@ class CoupleService:
             type_suffix="role-invalid",
         )
 
-    def _log_event(self, session: CoupleSession, event_type: str, payload: dict | None) -> None:
-        prev = self.db.scalar(
-            select(AuditEvent)
-            .where(AuditEvent.session_id == session.id)
-            .order_by(AuditEvent.created_at.desc(), AuditEvent.id.desc())
-        )
-        prev_hash = prev.hash if prev else None
-        body = json.dumps(
-            {
-                "event_type": event_type,
-                "payload": payload,
-                "ts": datetime.now(timezone.utc).isoformat(),
-            },
-            sort_keys=True,
-            default=str,
-        )
-        digest = sha256(((prev_hash or "") + body).encode("utf-8")).hexdigest()
+    # ------------------------------------------------------------------
+    # Audit chain
+    # ------------------------------------------------------------------
+    def log_event(self, session: CoupleSession, event_type: str, payload: dict | None) -> None:
+        """Append an event to ``session``'s audit chain and advance its head.
+
+        The session must have been loaded with the row lock (``for_update``)
+        so that concurrent writers cannot append to the same head.
+        """
+
+        # The session row carries the chain head, so appending needs no
+        # audit_events read and sees events added earlier in this request.
+        prev_hash = session.last_audit_hash
+        # The hashed timestamp is the stored created_at, so verify_chain can
+        # recompute the digest.
+        created_at = datetime.now(timezone.utc)
+        digest = _audit_digest(prev_hash, event_type, payload, created_at)
         event = AuditEvent(
+            created_at=created_at,
             session_id=session.id,
             req_id=self.request_id,
             actor=None,
@@ -522,34 +686,101 @@ class CoupleService:
             payload=payload,
             prev_hash=prev_hash,
             hash=digest,
+            digest_version=AUDIT_DIGEST_VERSION,
             code_ref=self.code_ref,
         )
         self.db.add(event)
+        session.last_audit_hash = digest
 
-    def _store_decision_packet(
+    def verify_chain(self, session_id: str, *, batch_size: int = 500) -> ChainVerification:
+        """Walk a session's audit events in created order and check each link.
+
+        Rows are streamed ``batch_size`` at a time and only the previous hash
+        is kept, so memory stays flat however long the chain is.  Every event
+        must point at its predecessor's hash, and the session's chain head
+        must point at the last one.  Events with a ``digest_version`` must
+        also match the digest recomputed from their type, payload and
+        ``created_at``; older events, which can only precede them, are
+        checked by their links alone.
+        """
+
+        session = self._get_session(session_id)
+        rows = self.db.execute(
+            select(
+                AuditEvent.id,
+                AuditEvent.prev_hash,
+                AuditEvent.hash,
+                AuditEvent.event_type,
+                AuditEvent.payload,
+                AuditEvent.created_at,
+                AuditEvent.digest_version,
+            )
+            .where(AuditEvent.session_id == session.id)
+            .order_by(AuditEvent.created_at, AuditEvent.id)
+            .execution_options(yield_per=batch_size)
+        )
+        previous: str | None = None
+        versioned = False
+        checked = 0
+        for event_id, prev_hash, digest, event_type, payload, created_at, version in rows:
+            if prev_hash != previous:
+                rows.close()
+                return ChainVerification(
+                    ok=False,
+                    checked=checked,
+                    broken_event_id=event_id,
+                    reason=f"prev_hash does not match the preceding event ({previous or 'none'})",
+                )
+            if version is None and versioned:
+                rows.close()
+                return ChainVerification(
+                    ok=False,
+                    checked=checked,
+                    broken_event_id=event_id,
+                    reason="event without a digest version follows a versioned event",
+                )
+            versioned = version is not None
+            if versioned and digest != _audit_digest(prev_hash, event_type, payload, created_at):
+                rows.close()
+                return ChainVerification(
+                    ok=False,
+                    checked=checked,
+                    broken_event_id=event_id,
+                    reason="hash does not match the event contents",
+                )
+            previous = digest
+            checked += 1
+
+        if session.last_audit_hash != previous:
+            return ChainVerification(
+                ok=False,
+                checked=checked,
+                broken_event_id=None,
+                reason="chain head does not match the last event",
+            )
+        return ChainVerification(ok=True, checked=checked)
+
+    def encode_result_packet(
         self,
         session: CoupleSession,
-        *,
-        a_self: Dict[str, int],
-        a_guess: Dict[str, int],
-        b_self: Dict[str, int],
-        b_guess: Dict[str, int],
+        answers: Dict[str, Dict[str, int]],
         result: CoupleResult,
-    ) -> DecisionPacket:
-        payload = {
-            "inputs": {
-                "a_self": a_self,
-                "a_guess": a_guess,
-                "b_self": b_self,
-                "b_guess": b_guess,
-                "k_state": {
-                    "threshold": session.k_threshold,
-                    "current": session.k_value,
-                    "visible": session.k_visible,
-                },
-                "stage1_snapshot": session.stage1_snapshot,
+    ) -> tuple[dict, str]:
+        """Canonical packet payload and digest for ``result`` of ``session``.
+
+        ``answers`` maps ``a_self``, ``a_guess``, ``b_self`` and ``b_guess``
+        to the answer sets the result was scored from.
+        """
+
+        return packets.encode_packet(
+            answers=answers,
+            k_state={
+                "threshold": session.k_threshold,
+                "current": session.k_value,
+                "visible": session.k_visible,
             },
-            "outputs": {
+            stage1_snapshot=session.stage1_snapshot,
+            outputs={
                 "scales": result.scales,
                 "deltas": result.deltas,
                 "flags": result.flags,
@@ -557,23 +788,76 @@ class CoupleService:
                 "top_delta_items": result.top_delta_items,
                 "gap_summary": result.gap_summary,
             },
+            code_ref=self.code_ref,
+            model_id=MODEL_ID,
+        )
+
+    def _store_decision_packet(
+        self,
+        session: CoupleSession,
+        *,
+        a_self: Dict[str, int],
+        a_guess: Dict[str, int],
+        b_self: Dict[str, int],
+        b_guess: Dict[str, int],
+        result: CoupleResult,
+    ) -> DecisionPacket:
+        payload, digest = self.encode_result_packet(
+            session,
+            {"a_self": a_self, "a_guess": a_guess, "b_self": b_self, "b_guess": b_guess},
+            result,
+        )
+        return self.store_packet(session, payload, digest)
+
+    def store_packet(self, session: CoupleSession, payload: dict, digest: str) -> DecisionPacket:
+        """The ``decision_packets`` row for ``digest``, inserting it if missing.
+
+        Recomputing an unchanged session yields the same digest, so the packet
+        that already records it is kept.  Concurrent writers of the same digest
+        meet on ``uq_decision_packet_sha`` and end up sharing one row.
+        """
+
+        stmt = select(DecisionPacket).where(
+            DecisionPacket.session_id == session.id,
+            DecisionPacket.packet_sha256 == digest,
+        )
+        existing = self.db.scalar(stmt)
+        if existing is not None:
+            return existing
+
+        row_payload, storage_url = packets.offload_payload(payload, digest)
+        values = {
+            "session_id": session.id,
+            "packet_sha256": digest,
+            "payload": row_payload,
+            "storage_url": storage_url,
             "code_ref": self.code_ref,
-            "model_id": "core_scoring.v1",
+            "model_id": MODEL_ID,
         }
-        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-        digest = sha256(canonical).hexdigest()
+        dialect = self.db.get_bind().dialect.name
+        if dialect in {"sqlite", "postgresql"}:
+            if dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+            self.db.execute(
+                dialect_insert(DecisionPacket)
+                .values(**values)
+                .on_conflict_do_nothing(index_elements=["session_id", "packet_sha256"])
+            )
+            return self.db.scalar(stmt)
 
-        packet = DecisionPacket(
-            session_id=session.id,
-            packet_sha256=digest,
-            payload=payload,
-            code_ref=self.code_ref,
-            model_id="core_scoring.v1",
-        )
+        packet = DecisionPacket(**values)
         self.db.add(packet)
         self.db.flush()
         return packet
 
+    def load_packet_payload(self, packet: DecisionPacket) -> dict:
+        """Inputs and outputs recorded by ``packet``, with answers keyed by code."""
+
+        return packets.read_packet_payload(packet.payload, packet.storage_url)
+
     def _session_to_envelope(self, session: CoupleSession) -> CoupleSessionEnvelope:
         return CoupleSessionEnvelope(
             session_id=session.id,
@@ -610,7 +894,7 @@ class CoupleService:
     ) -> CoupleResultEnvelope:
         descriptor = DecisionPacketDescriptor(
             packet_sha256=packet.packet_sha256,
-            created_at=packet.created_at,
+            created_at=_as_utc(packet.created_at),
             code_ref=packet.code_ref,
             model_id=packet.model_id,
         )
@@ -628,5 +912,5 @@ class CoupleService:
                 visible=session.k_visible,
             ),
             decision_packet=descriptor,
-            generated_at=session.last_computed_at or datetime.now(timezone.utc),
+            generated_at=_as_utc(session.last_computed_at) or datetime.now(timezone.utc),
         )
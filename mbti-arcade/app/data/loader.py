@@ -1,42 +1,84 @@
-
 from __future__ import annotations
 
+from dataclasses import asdict
+from typing import Dict, List
+
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
-from app.data.questionnaire_loader import get_question_seeds
-from app.models import Question
+from app.data.question_index import invalidate_question_index
+from app.data.questionnaire_loader import get_question_seeds, get_questionnaire_digest
+from app.models import AppMetadata, Question
+
+QUESTIONNAIRE_DIGEST_KEY = "questionnaire_digest"
+
+_SYNCED_FIELDS = ("dim", "sign", "context", "prompt_self", "prompt_other", "theme", "scenario")
+_QUESTION_COLUMNS = (
+    Question.id,
+    Question.code,
+    Question.dim,
+    Question.sign,
+    Question.context,
+    Question.prompt_self,
+    Question.prompt_other,
+    Question.theme,
+    Question.scenario,
+)
+
+
+def seed_questions(db: Session) -> bool:
+    """Bring the questions table in line with the questionnaire file.
+
+    The questionnaire digest is stored in ``app_metadata``; when it matches
+    this is a single primary-key lookup.  Otherwise only the rows that differ
+    are inserted or updated, in bulk.  Returns whether anything changed.
+    """
 
+    digest = get_questionnaire_digest()
+    marker = db.get(AppMetadata, QUESTIONNAIRE_DIGEST_KEY)
+    if marker is not None and marker.value == digest:
+        return False
 
-def seed_questions(db: Session) -> None:
-    seeds = get_question_seeds()
-    existing_by_code = {row.code: row for row in db.query(Question).all()}
+    existing_by_code = {row.code: row for row in db.query(*_QUESTION_COLUMNS).all()}
+    inserts: List[Dict[str, object]] = []
+    updates: List[Dict[str, object]] = []
+    renumbered = 0
 
-    for seed in seeds:
+    for seed in get_question_seeds():
         record = existing_by_code.get(seed.code)
         if record is None:
-            question = Question(
-                id=seed.id,
-                code=seed.code,
-                dim=seed.dim,
-                sign=seed.sign,
-                context=seed.context,
-                prompt_self=seed.prompt_self,
-                prompt_other=seed.prompt_other,
-                theme=seed.theme,
-                scenario=seed.scenario,
-            )
-            db.add(question)
+            inserts.append(asdict(seed))
             continue
 
-        # Ensure fields stay in sync with the source JSON.
-        record.dim = seed.dim
-        record.sign = seed.sign
-        record.context = seed.context
-        record.prompt_self = seed.prompt_self
-        record.prompt_other = seed.prompt_other
-        record.theme = seed.theme
-        record.scenario = seed.scenario
         if record.id != seed.id:
-            record.id = seed.id
+            # Renumbered question: the primary key itself moves, so it cannot
+            # go through the bulk update keyed on ``id``.
+            db.execute(
+                update(Question).where(Question.code == seed.code).values(asdict(seed))
+            )
+            renumbered += 1
+            continue
 
+        changes = {
+            field: getattr(seed, field)
+            for field in _SYNCED_FIELDS
+            if getattr(record, field) != getattr(seed, field)
+        }
+        if changes:
+            updates.append({"id": seed.id, **changes})
+
+    if updates:
+        db.execute(update(Question), updates)
+    if inserts:
+        db.execute(insert(Question), inserts)
+
+    if marker is None:
+        db.add(AppMetadata(key=QUESTIONNAIRE_DIGEST_KEY, value=digest))
+    else:
+        marker.value = digest
     db.commit()
+
+    changed = bool(inserts or updates or renumbered)
+    if changed:
+        invalidate_question_index()
+    return changed
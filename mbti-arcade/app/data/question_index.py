@@ -0,0 +1,104 @@
+"""Process-wide, read-only question lookup shared by the scoring paths."""
+from __future__ import annotations
+
+import hashlib
+import threading
+from array import array
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.data.questionnaire_loader import get_question_seeds
+from app.models import Question
+from app.schemas import DIMENSIONS
+
+MISSING_DIM = -1
+
+
+@dataclass(frozen=True)
+class QuestionIndex:
+    """Frozen ``question_id -> (dim, sign)`` lookup.
+
+    ``dim_sign`` is the mapping form used by existing callers.  ``dim_index``
+    and ``signs`` are dense arrays indexed by question id (``MISSING_DIM``
+    marks unknown ids) so the scoring loop avoids hashing and tuple unpacking.
+    """
+
+    digest: str
+    dim_sign: Mapping[int, Tuple[str, int]]
+    dim_index: array
+    signs: array
+
+    def __contains__(self, question_id: object) -> bool:
+        return question_id in self.dim_sign
+
+    def __len__(self) -> int:
+        return len(self.dim_sign)
+
+
+def _digest(rows: Iterable[Tuple[int, str, int]]) -> str:
+    hasher = hashlib.sha256()
+    for question_id, dim, sign in rows:
+        hasher.update(f"{question_id}:{dim}:{sign};".encode("ascii"))
+    return hasher.hexdigest()
+
+
+def build_question_index(rows: Iterable[Tuple[int, str, int]]) -> QuestionIndex:
+    ordered = sorted((int(qid), dim, int(sign)) for qid, dim, sign in rows)
+    size = ordered[-1][0] + 1 if ordered else 0
+    dim_index = array("b", [MISSING_DIM]) * size
+    signs = array("b", [0]) * size
+    positions = {dim: position for position, dim in enumerate(DIMENSIONS)}
+    for question_id, dim, sign in ordered:
+        dim_index[question_id] = positions[dim]
+        signs[question_id] = sign
+    return QuestionIndex(
+        digest=_digest(ordered),
+        dim_sign=MappingProxyType({qid: (dim, sign) for qid, dim, sign in ordered}),
+        dim_index=dim_index,
+        signs=signs,
+    )
+
+
+_lock = threading.Lock()
+_current: QuestionIndex | None = None
+
+
+def get_question_index(db: Session | None = None) -> QuestionIndex:
+    """Return the shared index, loading it on first use.
+
+    The index is built from the ``questions`` table when ``db`` is given and
+    from the questionnaire seeds otherwise.  It is only rebuilt after
+    :func:`invalidate_question_index`, which ``seed_questions`` calls when it
+    changes a row.
+    """
+
+    global _current
+    index = _current
+    if index is not None:
+        return index
+    with _lock:
+        if _current is None:
+            if db is not None:
+                rows = db.query(Question.id, Question.dim, Question.sign).all()
+            else:
+                rows = [(seed.id, seed.dim, seed.sign) for seed in get_question_seeds()]
+            _current = build_question_index(rows)
+        return _current
+
+
+def invalidate_question_index() -> None:
+    global _current
+    with _lock:
+        _current = None
+
+
+__all__ = [
+    "MISSING_DIM",
+    "QuestionIndex",
+    "build_question_index",
+    "get_question_index",
+    "invalidate_question_index",
+]
@@ -2,6 +2,7 @@
 """Utilities for loading the questionnaire seed dataset."""
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 from dataclasses import dataclass
@@ -203,6 +204,35 @@ def get_question_seeds() -> Sequence[QuestionSeed]:
     return tuple(seeds)
 
 
+@lru_cache(maxsize=1)
+def get_questionnaire_digest() -> str:
+    """Content hash of the normalised seeds, independent of JSON formatting."""
+
+    payload = [
+        [
+            seed.id,
+            seed.code,
+            seed.dim,
+            seed.sign,
+            seed.context,
+            seed.prompt_self,
+            seed.prompt_other,
+            seed.theme,
+            seed.scenario,
+        ]
+        for seed in get_question_seeds()
+    ]
+    encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_questionnaire_file_digest() -> str:
+    """Hash of the raw questionnaire file; cheap to compute, no validation."""
+
+    return hashlib.sha256(_resolve_questionnaire_path().read_bytes()).hexdigest()
+
+
 def get_question_lookup() -> Dict[int, QuestionSeed]:
     return {seed.id: seed for seed in get_question_seeds()}
 
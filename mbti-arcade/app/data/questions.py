@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Iterable, List
 
 from .questionnaire_loader import QuestionSeed, get_question_seeds
 
 
-QUESTION_SEEDS: tuple[QuestionSeed, ...] = tuple(get_question_seeds())
-CONTEXT_TO_SEEDS: Dict[str, List[QuestionSeed]] = {
-    context: [seed for seed in QUESTION_SEEDS if seed.context == context]
-    for context in {"common", "couple", "friend", "work", "partner", "family"}
-}
+@lru_cache(maxsize=1)
+def _context_to_seeds() -> Dict[str, List[QuestionSeed]]:
+    # Built on first use so importing this module does not parse the
+    # questionnaire file.
+    return {
+        context: [seed for seed in get_question_seeds() if seed.context == context]
+        for context in {"common", "couple", "friend", "work", "partner", "family"}
+    }
+
+
 MODE_TO_CONTEXTS: Dict[str, set[str]] = {
     "basic": {"common"},
     "friend": {"friend"},
@@ -29,7 +35,7 @@ INVITE_ORDINALS: range = range(1, 6)
 
 
 def iter_questions() -> Iterable[QuestionSeed]:
-    return iter(QUESTION_SEEDS)
+    return iter(get_question_seeds())
 
 
 def question_payload(seed: QuestionSeed) -> Dict[str, object]:
@@ -51,8 +57,9 @@ def questions_for_mode(mode: str) -> List[Dict[str, object]]:
     if normalized not in MODE_TO_CONTEXTS:
         raise ValueError(f"Unsupported mode: {mode}")
     contexts = MODE_TO_CONTEXTS[normalized]
+    by_context = _context_to_seeds()
     seeds: list[QuestionSeed] = [
-        seed for context in contexts for seed in CONTEXT_TO_SEEDS.get(context, [])
+        seed for context in contexts for seed in by_context.get(context, [])
     ]
     seeds.sort(key=lambda seed: seed.id)
     return [question_payload(seed) for seed in seeds]
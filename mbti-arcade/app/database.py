@@ -7,6 +7,9 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from app.utils.db_pool import InstrumentedQueuePool, instrument_engine, pool_options
+from app.utils.sqlite_pragmas import install_sqlite_pragmas
+
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./perception_gap.db")
 
 
@@ -15,13 +18,22 @@ def _is_testing() -> bool:
 
 
 _engine_kwargs: dict[str, object] = {"future": True}
+_pool_kwargs = pool_options("DB")
 if DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
     _engine_kwargs["connect_args"] = connect_args
     if _is_testing() and ":memory:" in DATABASE_URL:
         _engine_kwargs["poolclass"] = StaticPool
+if ":memory:" in DATABASE_URL:
+    # One shared in-memory connection: pool sizing does not apply.
+    _pool_kwargs = {"pool_pre_ping": _pool_kwargs["pool_pre_ping"]}
+else:
+    _engine_kwargs["poolclass"] = InstrumentedQueuePool
+_engine_kwargs.update(_pool_kwargs)
 
 engine = create_engine(DATABASE_URL, **_engine_kwargs)
+install_sqlite_pragmas(engine)
+instrument_engine("orm", engine)
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
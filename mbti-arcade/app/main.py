@@ -5,19 +5,19 @@ import time
 from datetime import datetime, timezone
 from email.utils import formatdate
 from http import HTTPStatus
-from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, Tuple
 from uuid import uuid4
 
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import Headers, URL
 from starlette.middleware.trustedhost import ENFORCE_DOMAIN_WILDCARD
 from starlette.responses import RedirectResponse
 from starlette.types import ASGIApp, Receive, Scope, Send
 from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import SQLModel
 
 try:
     from starlette.middleware.proxy_headers import ProxyHeadersMiddleware
@@ -131,10 +131,10 @@ from app.core.config import (
     sha256_hex,
 )
 from app.core.db import DATABASE_URL as CORE_DATABASE_URL
-from app.core.db import get_session as get_core_session
+from app.core.db import SessionLocal as CoreSessionLocal
 from app.core.db import init_db as init_core_db
 from app.data.loader import seed_questions
-from app.data.questionnaire_loader import get_question_lookup
+from app.data.question_index import get_question_index
 from app.data.questions import questions_for_mode, select_invite_other_questions
 from app.database import DATABASE_URL as ORM_DATABASE_URL
 from app.database import Base, engine, session_scope, get_db
@@ -154,6 +154,7 @@ from app.routers import sessions as sessions_router
 from app.routers import share as share_router
 from app.routers import invites as invites_router
 from app.observability import bind_request_id, configure_observability, reset_request_id
+from app.templating import templates
 from app.urling import build_invite_url
 from app.urling import build_owner_exchange_url
 from app.utils.problem_details import (
@@ -165,17 +166,26 @@ from app.utils.problem_details import (
     problem_response,
 )
 from app.models import (
-    OtherResponse,
     Participant,
-    ParticipantAnswer,
     ParticipantRelation,
     Session as SessionModel,
 )
 from app.utils.privacy import apply_noindex_headers, NOINDEX_VALUE
+from app.utils import startup_marker
 from app.utils.sqlite_schema_repair import repair_sqlite_schema_for_url
-from app.schemas import DIMENSIONS, ParticipantRegistrationRequest
-from app.services.aggregator import recalculate_relation_aggregates
-from app.services.scoring import compute_norms, norm_to_radar
+from app.schemas import (
+    DIMENSIONS,
+    ParticipantRegistrationRequest,
+    ParticipantRegistrationResponse,
+)
+from app.services.aggregator import (
+    apply_rater_answers,
+    participant_rater_hash,
+    recalculate_relation_aggregates,
+    record_participant_submission,
+)
+from app.services.answer_store import replace_participant_answers
+from app.services.scoring import ScoringError, compute_norms, norm_to_radar
 from app.routers.participants import register_participant
 
 try:  # pragma: no cover - optional dependency
@@ -191,9 +201,6 @@ app = FastAPI(
     version="0.9.0",
 )
 
-BASE_DIR = Path(__file__).resolve().parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-
 RELATION_LABELS: dict[str, str] = {
     "friend": "친구",
     "family": "가족",
@@ -227,27 +234,6 @@ RELATION_QUESTION_SET: dict[str, str] = {
 }
 
 
-def _escape_js(value: object) -> str:
-    if value is None:
-        return ""
-    text = str(value)
-    replacements = {
-        "\\": "\\\\",
-        "\n": "\\n",
-        "\r": "\\r",
-        "\t": "\\t",
-        "'": "\\'",
-        '"': '\\"',
-        "</": "<" + "\\/",
-        "\u2028": "\\u2028",
-        "\u2029": "\\u2029",
-    }
-    for search, replacement in replacements.items():
-        text = text.replace(search, replacement)
-    return text
-
-
-templates.env.filters.setdefault("escapejs", _escape_js)
 
 # Set up OpenTelemetry instrumentation if available.
 configure_observability(app)
@@ -289,10 +275,6 @@ def _build_questions(mode: str, *, perspective: str) -> list[dict[str, object]]:
     return questions
 
 
-_QUESTION_LOOKUP = get_question_lookup()
-_QUESTION_DIM_SIGN: Dict[int, Tuple[str, int]] = {
-    question_id: (seed.dim, seed.sign) for question_id, seed in _QUESTION_LOOKUP.items()
-}
 _DIMENSION_LETTERS: Dict[str, Tuple[str, str]] = {
     "EI": ("E", "I"),
     "SN": ("S", "N"),
@@ -386,7 +368,7 @@ def _score_answers(
     if not normalized_pairs:
         raise ValueError("No answers submitted")
 
-    norms = compute_norms(normalized_pairs, _QUESTION_DIM_SIGN)
+    norms = compute_norms(normalized_pairs, get_question_index())
     radar = norm_to_radar(norms)
 
     scores: Dict[str, int] = {}
@@ -553,14 +535,35 @@ async def generic_exception_handler(request: Request, exc: Exception):
     return internal_server_error(request)
 
 
+def _startup_state() -> dict[str, object] | None:
+    return startup_marker.startup_state(
+        [ORM_DATABASE_URL, CORE_DATABASE_URL], [Base.metadata, SQLModel.metadata]
+    )
+
+
 @app.on_event("startup")
 async def startup_event():
+    marker = startup_marker.marker_path(ORM_DATABASE_URL)
+    if (
+        marker is not None
+        and startup_marker.fast_start_enabled()
+        and startup_marker.marker_is_current(marker, _startup_state())
+    ):
+        # Same schema, questionnaire and database files as the last full
+        # pass; the question index loads on first use.
+        log.info("Startup repair and seeding skipped", extra={"marker": str(marker)})
+        return
+
     repair_sqlite_schema_for_url(ORM_DATABASE_URL)
-    repair_sqlite_schema_for_url(CORE_DATABASE_URL)
+    if CORE_DATABASE_URL != ORM_DATABASE_URL:
+        repair_sqlite_schema_for_url(CORE_DATABASE_URL)
     init_core_db()
     Base.metadata.create_all(bind=engine)
     with session_scope() as db:
         seed_questions(db)
+        get_question_index(db)
+    if marker is not None:
+        startup_marker.write_marker(marker, _startup_state())
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -601,6 +604,13 @@ async def mbti_friend(
     return response
 
 
+def _register_form_participant(
+    invite_token: str, payload: ParticipantRegistrationRequest
+) -> ParticipantRegistrationResponse:
+    with session_scope() as db:
+        return register_participant(invite_token=invite_token, payload=payload, db=db)
+
+
 @app.post("/mbti/friend", response_class=HTMLResponse)
 async def submit_friend(request: Request):
     form = await request.form()
@@ -644,12 +654,9 @@ async def _submit_friend_from_form(
             consent_display=False,
         )
 
-        with session_scope() as db:
-            registration = await register_participant(
-                invite_token=invite_token,
-                payload=registration_payload,
-                db=db,
-            )
+        registration = await run_in_threadpool(
+            _register_form_participant, invite_token, registration_payload
+        )
 
         responder_name = registration.display_name
 
@@ -708,6 +715,28 @@ async def mbti_test(
     )
 
 
+def _create_owner_session(owner_name: str, mbti_type: str) -> tuple[str, str]:
+    """Persist the owner's invite session; returns (invite_token, owner_token)."""
+
+    with session_scope() as db:
+        owner_token = generate_owner_token()
+        session = SessionModel(
+            id=generate_session_id(),
+            owner_id=None,
+            mode="friend",
+            invite_token=generate_invite_token(),
+            owner_token_hash=sha256_hex(owner_token),
+            is_anonymous=True,
+            expires_at=compute_expiry(72),
+            max_raters=50,
+            self_mbti=mbti_type,
+            snapshot_owner_name=owner_name,
+        )
+        db.add(session)
+        invite_token = session.invite_token
+    return invite_token, owner_token
+
+
 @app.post("/mbti/self-result", response_class=HTMLResponse)
 async def mbti_self_result(request: Request):
     form = await request.form()
@@ -732,22 +761,9 @@ async def mbti_self_result(request: Request):
 
     result = MBTI_SUMMARIES.get(mbti_type, _DEFAULT_SUMMARY)
 
-    with session_scope() as db:
-        owner_token = generate_owner_token()
-        session = SessionModel(
-            id=generate_session_id(),
-            owner_id=None,
-            mode="friend",
-            invite_token=generate_invite_token(),
-            owner_token_hash=sha256_hex(owner_token),
-            is_anonymous=True,
-            expires_at=compute_expiry(72),
-            max_raters=50,
-            self_mbti=mbti_type,
-            snapshot_owner_name=owner_name,
-        )
-        db.add(session)
-        invite_token = session.invite_token
+    invite_token, owner_token = await run_in_threadpool(
+        _create_owner_session, owner_name, mbti_type
+    )
 
     invite_url = build_invite_url(request, invite_token)
     owner_exchange_url = build_owner_exchange_url(request, owner_token=owner_token)
@@ -769,6 +785,105 @@ async def mbti_self_result(request: Request):
     return response
 
 
+def _record_participant_result(
+    *,
+    invite_token: str,
+    participant_id: int,
+    answer_pairs: list[tuple[int, int]],
+    mbti_type: str,
+    friend_name: str,
+    friend_mbti: str,
+) -> tuple[list[dict[str, Any]], dict[str, Any] | None, str | None]:
+    """Store an HTML quiz submission for a registered participant.
+
+    Blocking database work; ``mbti_result`` runs it in the threadpool.
+    Returns the relation summary, report metadata and burnout signal.
+    """
+
+    relation_summary: list[dict[str, Any]] = []
+    report_meta = None
+    burnout_signal = None
+    with session_scope() as db:
+        participant = db.get(Participant, participant_id)
+        session_record = (
+            db.query(SessionModel)
+            .filter(SessionModel.invite_token == invite_token)
+            .one_or_none()
+        )
+        if (
+            participant is not None
+            and session_record is not None
+            and participant.session_id == session_record.id
+        ):
+            rater_hash = participant_rater_hash(participant.id)
+            replace_participant_answers(db, participant.id, answer_pairs)
+
+            norms = compute_norms(answer_pairs, get_question_index(db))
+            now = datetime.now(timezone.utc)
+            participant.axes_payload = {
+                dim: round(norms.get(dim, 0.0), 6) for dim in DIMENSIONS
+            }
+            participant.perceived_type = mbti_type
+            record_participant_submission(session_record, participant, now)
+            participant.computed_at = now
+
+            db.flush()
+            try:
+                apply_rater_answers(
+                    db,
+                    session_record,
+                    rater_hash,
+                    answer_pairs,
+                    participant.relation.value,
+                )
+            except ScoringError:
+                # HTML-only sessions carry no self answers yet; the
+                # aggregate is rebuilt once the owner submits them.
+                pass
+
+            summary = recalculate_relation_aggregates(session_record.id, db)
+            unlocked = summary.total_respondents >= 3
+            relation_summary = [
+                {
+                    "relation": RELATION_LABELS.get(
+                        item.relation.value, item.relation.value
+                    ),
+                    "respondent_count": item.respondent_count,
+                    "top_type": item.top_type if unlocked else None,
+                    "pgi": round(item.pgi, 2)
+                    if unlocked and item.pgi is not None
+                    else None,
+                }
+                for item in summary.relations
+            ]
+
+            visible_pgi = [
+                item["pgi"]
+                for item in relation_summary
+                if item.get("pgi") is not None
+            ]
+            if visible_pgi:
+                avg_pgi = sum(visible_pgi) / len(visible_pgi)
+                if avg_pgi >= 60:
+                    burnout_signal = "관계별 인식 격차가 높아 지침/번아웃 위험 신호가 있습니다. 휴식과 경계 설정 대화를 권장합니다."
+                elif avg_pgi >= 40:
+                    burnout_signal = "관계별 인식 격차가 누적되고 있어 피로 신호를 점검해 보는 것이 좋습니다."
+                else:
+                    burnout_signal = "현재는 큰 소진 신호가 보이지 않지만, 주기적으로 인식 차이를 점검해 보세요."
+
+            report_meta = {
+                "owner_name": session_record.snapshot_owner_name
+                or friend_name
+                or "공유자",
+                "owner_mbti": friend_mbti or session_record.self_mbti,
+                "evaluator_mbti": mbti_type,
+                "respondent_count": summary.total_respondents,
+                "unlocked": unlocked,
+            }
+
+    return relation_summary, report_meta, burnout_signal
+
+
 @app.post("/mbti/result", response_class=HTMLResponse)
 async def mbti_result(request: Request):
     form = await request.form()
@@ -812,94 +927,15 @@ async def mbti_result(request: Request):
     )
 
     if participant_id and invite_token:
-        with session_scope() as db:
-            participant = db.get(Participant, participant_id)
-            session_record = (
-                db.query(SessionModel)
-                .filter(SessionModel.invite_token == invite_token)
-                .one_or_none()
-            )
-            if (
-                participant is not None
-                and session_record is not None
-                and participant.session_id == session_record.id
-            ):
-                rater_hash = f"participant:{participant.id}"
-                db.query(ParticipantAnswer).filter(
-                    ParticipantAnswer.participant_id == participant.id
-                ).delete()
-                db.query(OtherResponse).filter(
-                    OtherResponse.session_id == session_record.id,
-                    OtherResponse.rater_hash == rater_hash,
-                ).delete()
-
-                for question_id, answer_value in answer_pairs:
-                    db.add(
-                        ParticipantAnswer(
-                            participant_id=participant.id,
-                            question_id=question_id,
-                            value=answer_value,
-                        )
-                    )
-                    db.add(
-                        OtherResponse(
-                            session_id=session_record.id,
-                            rater_hash=rater_hash,
-                            participant_id=participant.id,
-                            question_id=question_id,
-                            value=answer_value,
-                            relation_tag=participant.relation.value,
-                        )
-                    )
-
-                norms = compute_norms(answer_pairs, _QUESTION_DIM_SIGN)
-                now = datetime.now(timezone.utc)
-                participant.axes_payload = {
-                    dim: round(norms.get(dim, 0.0), 6) for dim in DIMENSIONS
-                }
-                participant.perceived_type = mbti_type
-                participant.answers_submitted_at = now
-                participant.computed_at = now
-
-                summary = recalculate_relation_aggregates(session_record.id, db)
-                unlocked = summary.total_respondents >= 3
-                relation_summary = [
-                    {
-                        "relation": RELATION_LABELS.get(
-                            item.relation.value, item.relation.value
-                        ),
-                        "respondent_count": item.respondent_count,
-                        "top_type": item.top_type if unlocked else None,
-                        "pgi": round(item.pgi, 2)
-                        if unlocked and item.pgi is not None
-                        else None,
-                    }
-                    for item in summary.relations
-                ]
-
-                visible_pgi = [
-                    item["pgi"]
-                    for item in relation_summary
-                    if item.get("pgi") is not None
-                ]
-                if visible_pgi:
-                    avg_pgi = sum(visible_pgi) / len(visible_pgi)
-                    if avg_pgi >= 60:
-                        burnout_signal = "관계별 인식 격차가 높아 지침/번아웃 위험 신호가 있습니다. 휴식과 경계 설정 대화를 권장합니다."
-                    elif avg_pgi >= 40:
-                        burnout_signal = "관계별 인식 격차가 누적되고 있어 피로 신호를 점검해 보는 것이 좋습니다."
-                    else:
-                        burnout_signal = "현재는 큰 소진 신호가 보이지 않지만, 주기적으로 인식 차이를 점검해 보세요."
-
-                report_meta = {
-                    "owner_name": session_record.snapshot_owner_name
-                    or friend_name
-                    or "공유자",
-                    "owner_mbti": friend_mbti or session_record.self_mbti,
-                    "evaluator_mbti": mbti_type,
-                    "respondent_count": summary.total_respondents,
-                    "unlocked": unlocked,
-                }
+        relation_summary, report_meta, burnout_signal = await run_in_threadpool(
+            _record_participant_result,
+            invite_token=invite_token,
+            participant_id=participant_id,
+            answer_pairs=answer_pairs,
+            mbti_type=mbti_type,
+            friend_name=friend_name,
+            friend_mbti=friend_mbti,
+        )
 
     response = templates.TemplateResponse(
         "mbti/result.html",
@@ -929,6 +965,13 @@ async def mbti_friend_result_redirect(request: Request, token: str):
     return RedirectResponse(url=invite_url, status_code=307)
 
 
+def _load_pair(pair_id: str):
+    from app.core.models_db import Pair
+
+    with CoreSessionLocal() as session:
+        return session.get(Pair, pair_id)
+
+
 @app.post("/mbti/result/{token}", response_class=HTMLResponse)
 async def mbti_friend_result(request: Request, token: str):
     """친구 테스트 결과 제출 (토큰 기반)"""
@@ -940,11 +983,7 @@ async def mbti_friend_result(request: Request, token: str):
         raise HTTPException(status_code=403, detail="Invalid or expired token")
 
     # 데이터베이스에서 친구 정보 가져오기
-    from app.core.db import get_session
-    from app.core.models_db import Pair
-
-    session = next(get_session())
-    pair = session.get(Pair, pair_id)
+    pair = await run_in_threadpool(_load_pair, pair_id)
     if not pair:
         raise HTTPException(status_code=404, detail="Pair not found")
 
@@ -1080,7 +1119,6 @@ async def mbti_share_success(
 def invite_public(
     request: Request,
     token: str,
-    session=Depends(get_core_session),
     db: OrmSession = Depends(get_db),
 ):
     session_record = (
@@ -1131,7 +1169,9 @@ def invite_public(
         apply_noindex_headers(response)
         return response
 
-    return quiz_router.render_invite_page(request, token, session)
+    # Legacy pair links only: the core session is opened when needed.
+    with CoreSessionLocal() as session:
+        return quiz_router.render_invite_page(request, token, session)
 
 
 @app.post("/i/{token}", response_class=HTMLResponse)
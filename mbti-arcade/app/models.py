@@ -9,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
@@ -87,6 +88,15 @@ class Session(Base, TimestampMixin):
     self_mbti: Mapped[str | None] = mapped_column(String(4))
     snapshot_owner_name: Mapped[str | None] = mapped_column(String(120))
     snapshot_owner_avatar: Mapped[str | None] = mapped_column(String(255))
+    # Bumped on every answer submission; aggregates record the version they
+    # were computed from so reads can detect staleness without recomputing.
+    responses_version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Set when a change can affect relation_aggregates without recomputing them.
+    relations_dirty: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Participants with submitted answers, kept in step with
+    # ``Participant.answers_submitted_at`` so status polls skip the count.
+    respondent_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_submitted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     owner: Mapped[User | None] = relationship(back_populates="sessions")
     self_responses: Mapped[List["SelfResponse"]] = relationship(
@@ -120,6 +130,13 @@ class Question(Base):
     scenario: Mapped[str] = mapped_column(String(120), nullable=False)
 
 
+class AppMetadata(Base, TimestampMixin):
+    __tablename__ = "app_metadata"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[str] = mapped_column(String(255), nullable=False)
+
+
 class SelfResponse(Base, TimestampMixin):
     __tablename__ = "responses_self"
 
@@ -139,6 +156,7 @@ class OtherResponse(Base, TimestampMixin):
     __tablename__ = "responses_other"
     __table_args__ = (
         UniqueConstraint("session_id", "rater_hash", "question_id", name="uq_other"),
+        Index("ix_responses_other_participant_id", "participant_id"),
     )
 
     session_id: Mapped[str] = mapped_column(
@@ -185,12 +203,42 @@ class Aggregate(Base, TimestampMixin):
     jp_sigma: Mapped[float | None] = mapped_column(Float)
     n: Mapped[int] = mapped_column(Integer, default=0)
     gap_score: Mapped[float | None] = mapped_column(Float)
+    version: Mapped[int | None] = mapped_column(Integer)
+    # Running sums maintained by the incremental aggregate engine.
+    # ``weight_total`` stays NULL until the sums have been initialised.
+    weight_total: Mapped[float | None] = mapped_column(Float)
+    ei_wsum: Mapped[float | None] = mapped_column(Float)
+    sn_wsum: Mapped[float | None] = mapped_column(Float)
+    tf_wsum: Mapped[float | None] = mapped_column(Float)
+    jp_wsum: Mapped[float | None] = mapped_column(Float)
+    ei_wsq: Mapped[float | None] = mapped_column(Float)
+    sn_wsq: Mapped[float | None] = mapped_column(Float)
+    tf_wsq: Mapped[float | None] = mapped_column(Float)
+    jp_wsq: Mapped[float | None] = mapped_column(Float)
 
     session: Mapped[Session] = relationship(back_populates="aggregate")
 
 
+class AggregateRater(Base, TimestampMixin):
+    __tablename__ = "aggregate_raters"
+
+    session_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("sessions.id", ondelete="CASCADE"), primary_key=True
+    )
+    rater_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    weight: Mapped[float] = mapped_column(Float, nullable=False)
+    ei_norm: Mapped[float] = mapped_column(Float, nullable=False)
+    sn_norm: Mapped[float] = mapped_column(Float, nullable=False)
+    tf_norm: Mapped[float] = mapped_column(Float, nullable=False)
+    jp_norm: Mapped[float] = mapped_column(Float, nullable=False)
+
+
 class Participant(Base, TimestampMixin):
     __tablename__ = "participants"
+    __table_args__ = (
+        # Respondent counts and "last submitted" lookups per session.
+        Index("ix_participants_session_submitted", "session_id", "answers_submitted_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     session_id: Mapped[str] = mapped_column(
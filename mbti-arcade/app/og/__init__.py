@@ -1,5 +1,6 @@
 """Minimal OG image rendering utilities."""
 
+from .cache import RenderCache, share_card_cache, share_card_key
 from .renderer import render_share_card
 
-__all__ = ["render_share_card"]
+__all__ = ["RenderCache", "render_share_card", "share_card_cache", "share_card_key"]
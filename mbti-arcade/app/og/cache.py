@@ -0,0 +1,164 @@
+"""Render cache for OG share cards.
+
+Cards are keyed by everything that is drawn on them, so the ETag can be
+computed and ``If-None-Match`` answered before any pixel is touched.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from app.models import Session
+from app.services.aggregator import AggregateResult
+
+from .renderer import encoding_tag
+
+log = logging.getLogger("perception_gap.og")
+
+# Bump when the card layout changes so cached images and ETags roll over.
+RENDER_VERSION = 1
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+class ShareCardKey(NamedTuple):
+    session_id: str
+    mode: str
+    n: int
+    gap_bucket: str
+    updated_at: str
+
+    @property
+    def etag(self) -> str:
+        raw = "|".join((str(RENDER_VERSION), encoding_tag(), *map(str, self)))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _gap_bucket(gap_score: float | None) -> str:
+    # Matches the one-decimal precision printed on the card.
+    return "locked" if gap_score is None else f"{gap_score:.1f}"
+
+
+def share_card_key(session: Session, aggregate: AggregateResult) -> ShareCardKey:
+    updated_at: Optional[datetime] = session.updated_at
+    return ShareCardKey(
+        session_id=session.id,
+        mode=session.mode,
+        n=aggregate.n,
+        gap_bucket=_gap_bucket(aggregate.gap_score),
+        updated_at=updated_at.isoformat() if updated_at else "",
+    )
+
+
+class RenderCache:
+    """LRU of rendered PNGs bounded by total bytes, optionally backed by disk."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, directory: Path | None = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, etag: str) -> bytes | None:
+        with self._lock:
+            data = self._entries.get(etag)
+            if data is not None:
+                self._entries.move_to_end(etag)
+                return data
+
+        data = self._read_disk(etag)
+        if data is not None:
+            self._remember(etag, data)
+        return data
+
+    def put(self, etag: str, data: bytes) -> None:
+        self._remember(etag, data)
+        self._write_disk(etag, data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remember(self, etag: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(etag, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[etag] = data
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _path(self, etag: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / f"{etag}.png"
+
+    def _read_disk(self, etag: str) -> bytes | None:
+        path = self._path(etag)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError:
+            log.warning("OG cache read failed", extra={"path": str(path)})
+            return None
+
+    def _write_disk(self, etag: str, data: bytes) -> None:
+        path = self._path(etag)
+        if path is None:
+            return
+        tmp_name = None
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_name, path)
+        except OSError:
+            log.warning("OG cache write failed", extra={"path": str(path)})
+            if tmp_name is not None and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+
+def _build_default_cache() -> RenderCache:
+    try:
+        max_bytes = int(os.getenv("OG_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES)))
+    except ValueError:
+        max_bytes = DEFAULT_MAX_BYTES
+    raw_dir = os.getenv("OG_CACHE_DIR", "").strip()
+    return RenderCache(max_bytes=max_bytes, directory=Path(raw_dir) if raw_dir else None)
+
+
+share_card_cache = _build_default_cache()
+
+
+__all__ = [
+    "RENDER_VERSION",
+    "RenderCache",
+    "ShareCardKey",
+    "share_card_cache",
+    "share_card_key",
+]
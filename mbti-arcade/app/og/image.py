@@ -1,14 +1,77 @@
 from __future__ import annotations
 
 import zlib
-from typing import Iterable, Sequence, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 
 from .font import FONT_5X7
 
 Color = Tuple[int, int, int, int]
+# (row offset, column offset, RGBA bytes) runs relative to the draw origin.
+Spans = Tuple[Tuple[int, int, bytes], ...]
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+DEFAULT_COMPRESSION_LEVEL = zlib.Z_DEFAULT_COMPRESSION
+DEFAULT_IDAT_CHUNK_SIZE = 64 * 1024
+MAX_PALETTE_COLORS = 256
+# Rows handed to the compressor per call while streaming.
+_ROWS_PER_FEED = 32
+
+
+@lru_cache(maxsize=256)
+def color_span(color: Color, length: int) -> bytes:
+    """Pre-built RGBA run of ``length`` pixels."""
+
+    return bytes(color) * length
+
+
+@lru_cache(maxsize=256)
+def _index_span(index: int, length: int) -> bytes:
+    return bytes((index,)) * length
+
+
+def _build_glyph_spans(glyph: Tuple[str, ...], scale: int, color: Color) -> Spans:
+    spans = []
+    for gy, line in enumerate(glyph):
+        runs = []
+        gx = 0
+        while gx < len(line):
+            if line[gx] != "#":
+                gx += 1
+                continue
+            run_start = gx
+            while gx < len(line) and line[gx] == "#":
+                gx += 1
+            runs.append((run_start * scale, color_span(color, (gx - run_start) * scale)))
+        for sy in range(scale):
+            for dx, span in runs:
+                spans.append((gy * scale + sy, dx, span))
+    return tuple(spans)
+
+
+@lru_cache(maxsize=1024)
+def glyph_spans(char: str, scale: int, color: Color) -> Spans:
+    """``FONT_5X7`` glyph pre-scaled into horizontal runs, cached per colour."""
+
+    return _build_glyph_spans(tuple(FONT_5X7[char]), scale, color)
+
+
+def _chunk(chunk_type: bytes, data: bytes) -> bytes:
+    length = len(data).to_bytes(4, "big")
+    crc = zlib.crc32(data, zlib.crc32(chunk_type)).to_bytes(4, "big")
+    return b"".join((length, chunk_type, data, crc))
 
 
 class Canvas:
+    """RGBA canvas backed by one contiguous PNG scanline buffer.
+
+    ``buffer`` holds every scanline prefixed by its filter byte (always 0), so
+    encoding compresses it as-is.  ``rows`` are writable views of the pixel
+    part of each scanline.  While at most ``MAX_PALETTE_COLORS`` colours are
+    drawn the canvas also tracks a one-byte-per-pixel index buffer, which lets
+    :meth:`to_png` emit an indexed PNG without re-scanning pixels.
+    """
+
     def __init__(
         self,
         width: int,
@@ -24,31 +87,88 @@ class Canvas:
         if rows is not None:
             if len(rows) != height:
                 raise ValueError("Row template height mismatch")
-            self.rows = [bytearray(row) for row in rows]
+            self._allocate(bytearray((width * 4 + 1) * height))
+            for target, row in zip(self.rows, rows):
+                target[:] = row
+            # Arbitrary pixels: colours are unknown, so no index buffer.
+            self._disable_palette()
         else:
             if bg is None:
                 raise ValueError("Background color required when rows not provided")
-            self.rows = [bytearray(bg * width) for _ in range(height)]
+            scanline = b"\x00" + color_span(tuple(bg), width)
+            self._allocate(bytearray(scanline * height))
+            self._palette: Dict[Color, int] | None = {tuple(bg): 0}
+            self._indices: bytearray | None = bytearray((width + 1) * height)
+            self._index_rows: List[memoryview] | None = self._views(self._indices, 1)
+
+    def _views(self, buffer: bytearray, bytes_per_pixel: int) -> List[memoryview]:
+        stride = self.width * bytes_per_pixel + 1
+        view = memoryview(buffer)
+        return [view[y * stride + 1 : (y + 1) * stride] for y in range(self.height)]
+
+    def _allocate(self, buffer: bytearray) -> None:
+        self.buffer = buffer
+        self.rows = self._views(buffer, 4)
+
+    def _disable_palette(self) -> None:
+        self._palette = None
+        self._indices = None
+        self._index_rows = None
+
+    def _color_index(self, color: Color) -> int | None:
+        palette = self._palette
+        if palette is None:
+            return None
+        index = palette.get(color)
+        if index is None:
+            if len(palette) >= MAX_PALETTE_COLORS:
+                self._disable_palette()
+                return None
+            index = palette[color] = len(palette)
+        return index
+
+    @property
+    def palette(self) -> List[Color] | None:
+        """Colours in index order, or ``None`` once more than 256 were drawn."""
+
+        if self._palette is None:
+            return None
+        return sorted(self._palette, key=self._palette.__getitem__)
 
     def set_pixel(self, x: int, y: int, color: Color) -> None:
         if not (0 <= x < self.width and 0 <= y < self.height):
             return
+        color = tuple(color)
         row = self.rows[y]
         idx = x * 4
         row[idx : idx + 4] = bytes(color)
+        index = self._color_index(color)
+        if index is not None:
+            self._index_rows[y][x] = index
 
     def fill_rect(self, x: int, y: int, w: int, h: int, color: Color) -> None:
-        for yy in range(y, y + h):
-            if yy < 0 or yy >= self.height:
-                continue
-            row = self.rows[yy]
-            start = max(x, 0)
-            end = min(x + w, self.width)
-            for xx in range(start, end):
-                idx = xx * 4
-                row[idx : idx + 4] = bytes(color)
+        start = max(x, 0)
+        end = min(x + w, self.width)
+        top = max(y, 0)
+        bottom = min(y + h, self.height)
+        if start >= end or top >= bottom:
+            return
+        color = tuple(color)
+        span = color_span(color, end - start)
+        lo, hi = start * 4, end * 4
+        rows = self.rows
+        for yy in range(top, bottom):
+            rows[yy][lo:hi] = span
+
+        index = self._color_index(color)
+        if index is not None:
+            index_span = _index_span(index, end - start)
+            index_rows = self._index_rows
+            for yy in range(top, bottom):
+                index_rows[yy][start:end] = index_span
 
     def draw_text(self, x: int, y: int, text: str, color: Color, scale: int = 2, spacing: int = 1) -> None:
+        color = tuple(color)
         cursor_x = x
         upper_text = text.upper()
         for char in upper_text:
@@ -56,35 +176,110 @@ class Canvas:
             if glyph is None:
                 cursor_x += (5 * scale) + spacing * scale
                 continue
-            self._draw_glyph(cursor_x, y, glyph, color, scale)
+            self._blit_spans(cursor_x, y, glyph_spans(char, scale, color), color)
             cursor_x += (len(glyph[0]) * scale) + spacing * scale
 
     def _draw_glyph(self, x: int, y: int, glyph: Iterable[str], color: Color, scale: int) -> None:
-        for gy, line in enumerate(glyph):
-            for gx, ch in enumerate(line):
-                if ch != "#":
+        color = tuple(color)
+        self._blit_spans(x, y, _build_glyph_spans(tuple(glyph), scale, color), color)
+
+    def _blit_spans(self, x: int, y: int, spans: Spans, color: Color) -> None:
+        width = self.width
+        height = self.height
+        rows = self.rows
+        index = self._color_index(color)
+        index_rows = self._index_rows
+        for dy, dx, span in spans:
+            yy = y + dy
+            if yy < 0 or yy >= height:
+                continue
+            start = x + dx
+            end = start + len(span) // 4
+            if start >= 0 and end <= width:
+                rows[yy][start * 4 : end * 4] = span
+            else:
+                clipped_start = max(start, 0)
+                clipped_end = min(end, width)
+                if clipped_start >= clipped_end:
                     continue
-                for sy in range(scale):
-                    for sx in range(scale):
-                        self.set_pixel(x + gx * scale + sx, y + gy * scale + sy, color)
+                rows[yy][clipped_start * 4 : clipped_end * 4] = span[
+                    (clipped_start - start) * 4 : (clipped_end - start) * 4
+                ]
+                start, end = clipped_start, clipped_end
+            if index is not None:
+                index_rows[yy][start:end] = _index_span(index, end - start)
+
+    def iter_png(
+        self,
+        *,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        palette: bool = False,
+        chunk_size: int = DEFAULT_IDAT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Yield the PNG piece by piece, emitting IDAT chunks as they fill.
 
-    def to_png(self) -> bytes:
-        raw = b"".join(b"\x00" + bytes(row) for row in self.rows)
-        compressor = zlib.compressobj()
-        compressed = compressor.compress(raw) + compressor.flush()
+        ``palette=True`` writes an 8-bit indexed image when the canvas still
+        tracks its colours and falls back to RGBA otherwise.
+        """
 
-        def chunk(chunk_type: bytes, data: bytes) -> bytes:
-            length = len(data).to_bytes(4, "big")
-            crc = zlib.crc32(chunk_type + data).to_bytes(4, "big")
-            return length + chunk_type + data + crc
+        colors = self.palette if palette else None
+        if colors is not None:
+            source, color_type = self._indices, 3
+        else:
+            source, color_type = self.buffer, 6
 
+        yield PNG_SIGNATURE
         ihdr = (
             self.width.to_bytes(4, "big")
             + self.height.to_bytes(4, "big")
-            + bytes([8, 6, 0, 0, 0])
+            + bytes([8, color_type, 0, 0, 0])
+        )
+        yield _chunk(b"IHDR", ihdr)
+        if colors is not None:
+            yield _chunk(b"PLTE", b"".join(bytes(color[:3]) for color in colors))
+            alphas = bytes(color[3] for color in colors)
+            if alphas.rstrip(b"\xff"):
+                yield _chunk(b"tRNS", alphas.rstrip(b"\xff"))
+
+        compressor = zlib.compressobj(compression_level)
+        view = memoryview(source)
+        feed = (len(source) // self.height) * _ROWS_PER_FEED
+        pending = bytearray()
+        for offset in range(0, len(source), feed):
+            pending += compressor.compress(view[offset : offset + feed])
+            while len(pending) >= chunk_size:
+                yield _chunk(b"IDAT", bytes(pending[:chunk_size]))
+                del pending[:chunk_size]
+        pending += compressor.flush()
+        while pending:
+            yield _chunk(b"IDAT", bytes(pending[:chunk_size]))
+            del pending[:chunk_size]
+        yield _chunk(b"IEND", b"")
+
+    def to_png(
+        self,
+        *,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        palette: bool = False,
+        chunk_size: int = DEFAULT_IDAT_CHUNK_SIZE,
+    ) -> bytes:
+        return b"".join(
+            self.iter_png(
+                compression_level=compression_level,
+                palette=palette,
+                chunk_size=chunk_size,
+            )
         )
-        png = [b"\x89PNG\r\n\x1a\n", chunk(b"IHDR", ihdr), chunk(b"IDAT", compressed), chunk(b"IEND", b"")]
-        return b"".join(png)
 
     def clone(self) -> "Canvas":
-        return Canvas(self.width, self.height, rows=self.rows)
+        copy = Canvas.__new__(Canvas)
+        copy.width = self.width
+        copy.height = self.height
+        copy._allocate(bytearray(self.buffer))
+        if self._palette is None:
+            copy._disable_palette()
+        else:
+            copy._palette = dict(self._palette)
+            copy._indices = bytearray(self._indices)
+            copy._index_rows = copy._views(copy._indices, 1)
+        return copy
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import logging
+import os
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
 from app.services.aggregator import AggregateResult
 from app.models import Session
 
-from .image import Canvas
+from .image import DEFAULT_COMPRESSION_LEVEL, Canvas
 
 BACKGROUND = (15, 23, 42, 255)
 CARD = (17, 99, 255, 255)
@@ -21,18 +23,37 @@ LOCK_TEXT = (226, 232, 240, 255)
 log = logging.getLogger("perception_gap.og")
 
 
-def _build_template() -> Canvas:
+def _load_compression_level() -> int:
+    try:
+        level = int(os.getenv("OG_PNG_COMPRESSION_LEVEL", str(DEFAULT_COMPRESSION_LEVEL)))
+    except ValueError:
+        return DEFAULT_COMPRESSION_LEVEL
+    return level if -1 <= level <= 9 else DEFAULT_COMPRESSION_LEVEL
+
+
+# The card only uses a handful of colours; an indexed PNG is a fraction of
+# the RGBA size and faster to compress.
+PNG_COMPRESSION_LEVEL = _load_compression_level()
+PNG_PALETTE = os.getenv("OG_PNG_PALETTE", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def encoding_tag() -> str:
+    """Identifies the PNG encoding so caches keep variants apart."""
+
+    return f"{'palette' if PNG_PALETTE else 'rgba'}:{PNG_COMPRESSION_LEVEL}"
+
+
+@lru_cache(maxsize=1)
+def _base_template() -> Canvas:
+    # Drawn on first render rather than at import; every card clones it.
     template = Canvas(1200, 630, BACKGROUND)
     template.fill_rect(60, 90, 1080, 360, CARD)
     return template
 
 
-_BASE_TEMPLATE = _build_template()
-
-
 def render_share_card(session: Session, aggregate: AggregateResult) -> bytes:
     started = time.perf_counter()
-    canvas = _BASE_TEMPLATE.clone()
+    canvas = _base_template().clone()
 
     canvas.draw_text(80, 40, "360ME — PERCEPTION GAP", TEXT_SECONDARY, scale=3)
     canvas.draw_text(80, 120, f"SESSION: {session.id[:8]}", TEXT_PRIMARY, scale=4)
@@ -54,7 +75,7 @@ def render_share_card(session: Session, aggregate: AggregateResult) -> bytes:
     footer = "share safely at 360me"
     canvas.draw_text(80, 520, footer.upper(), TEXT_SECONDARY, scale=2)
 
-    image = canvas.to_png()
+    image = canvas.to_png(compression_level=PNG_COMPRESSION_LEVEL, palette=PNG_PALETTE)
 
     duration_ms = (time.perf_counter() - started) * 1000
     if duration_ms >= 150:
@@ -26,7 +26,7 @@ def get_couple_service(request: Request, db=Depends(get_db)) -> CoupleService:
 
 
 @router.post("/sessions", response_model=CoupleSessionEnvelope, status_code=201)
-async def create_session(
+def create_session(
     payload: CoupleSessionCreate,
     service: CoupleService = Depends(get_couple_service),
 ) -> CoupleSessionEnvelope:
@@ -40,7 +40,7 @@ async def create_session(
 
 
 @router.patch("/sessions/{session_id}/stage1", response_model=CoupleSessionEnvelope)
-async def update_stage_one(
+def update_stage_one(
     session_id: str,
     payload: StageOneSnapshot,
     service: CoupleService = Depends(get_couple_service),
@@ -55,7 +55,7 @@ async def update_stage_one(
 
 
 @router.get("/sessions/{session_id}", response_model=CoupleSessionEnvelope)
-async def fetch_session(
+def fetch_session(
     session_id: str,
     service: CoupleService = Depends(get_couple_service),
 ) -> CoupleSessionEnvelope:
@@ -66,7 +66,7 @@ async def fetch_session(
     "/sessions/{session_id}/responses",
     response_model=ResponseUpsertResponse,
 )
-async def upsert_responses(
+def upsert_responses(
     session_id: str,
     payload: ResponseUpsertRequest,
     service: CoupleService = Depends(get_couple_service),
@@ -84,7 +84,7 @@ async def upsert_responses(
     "/sessions/{session_id}/responses",
     response_model=SavedResponses,
 )
-async def get_saved_responses(
+def get_saved_responses(
     session_id: str,
     access_token: str,
     service: CoupleService = Depends(get_couple_service),
@@ -96,7 +96,7 @@ async def get_saved_responses(
     "/sessions/{session_id}/compute",
     response_model=CoupleResultEnvelope,
 )
-async def compute_result(
+def compute_result(
     session_id: str,
     payload: ComputeRequest,
     service: CoupleService = Depends(get_couple_service),
@@ -9,11 +9,13 @@ from urllib.parse import urlparse
 
 from anyio import to_thread
 from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.database import engine
+from app.utils.db_pool import render_prometheus
+from app.utils.sqlite_pragmas import journal_mode
 
 try:  # pragma: no cover - optional dependency
     from redis import asyncio as redis_asyncio  # type: ignore[import]
@@ -66,24 +68,39 @@ async def readyz() -> JSONResponse:
     )
 
 
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Connection pool metrics in the Prometheus text format."""
+
+    return PlainTextResponse(
+        render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+        headers={"Cache-Control": "no-store"},
+    )
+
+
 async def _check_database() -> Dict[str, Any]:
     try:
-        await to_thread.run_sync(_ping_database)
+        mode = await to_thread.run_sync(_ping_database)
     except SQLAlchemyError as exc:  # pragma: no cover - defensive branch
         return {"status": "error", "detail": _truncate(str(exc))}
     except Exception as exc:  # pragma: no cover - defensive branch
         return {"status": "error", "detail": _truncate(str(exc))}
 
-    return {
+    check: Dict[str, Any] = {
         "status": "ok",
         "dialect": engine.dialect.name,
         "driver": engine.url.drivername,
     }
+    if mode is not None:
+        check["journal_mode"] = mode
+    return check
 
 
-def _ping_database() -> None:
+def _ping_database() -> str | None:
     with engine.connect() as connection:
         connection.execute(text("SELECT 1"))
+        return journal_mode(connection)
 
 
 async def _check_redis() -> Dict[str, Any]:
@@ -1,24 +1,49 @@
 from __future__ import annotations
 
-import hashlib
-
-from fastapi import APIRouter, Depends, Response
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi.responses import Response as FastAPIResponse
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import Session as SessionModel
-from app.services.aggregator import recalculate_aggregate
+from app.services.aggregator import load_aggregate
 from app.services.scoring import ScoringError
 from app.utils.problem_details import ProblemDetailsException
 from app.utils.privacy import NOINDEX_VALUE, apply_noindex_headers
-from app.og import render_share_card
+from app.og import render_share_card, share_card_cache, share_card_key
 
 router = APIRouter(prefix="/share", tags=["share"])
 
+CACHE_CONTROL = "public, max-age=600"
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == etag:
+            return True
+    return False
+
+
+def _apply_cache_headers(response: Response, etag: str) -> None:
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.headers["ETag"] = f'"{etag}"'
+    apply_noindex_headers(response)
+    response.headers["X-Robots-Tag"] = NOINDEX_VALUE
+
 
 @router.get("/og/{invite_token}.png")
-async def generate_share_og(invite_token: str, db: Session = Depends(get_db)) -> Response:
+def generate_share_og(
+    invite_token: str,
+    request: Request,
+    db: Session = Depends(get_db),
+) -> Response:
     session = (
         db.query(SessionModel)
         .filter(SessionModel.invite_token == invite_token)
@@ -33,7 +58,7 @@ async def generate_share_og(invite_token: str, db: Session = Depends(get_db)) ->
         )
 
     try:
-        aggregate = recalculate_aggregate(db, session)
+        aggregate, rebuilt = load_aggregate(db, session)
     except ScoringError as exc:
         raise ProblemDetailsException(
             status_code=400,
@@ -42,12 +67,20 @@ async def generate_share_og(invite_token: str, db: Session = Depends(get_db)) ->
             type_suffix="scoring-error",
         ) from exc
 
-    image_bytes = render_share_card(session, aggregate)
-    etag = hashlib.sha256(image_bytes).hexdigest()
+    if rebuilt:
+        db.commit()
+
+    etag = share_card_key(session, aggregate).etag
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        response = FastAPIResponse(status_code=304)
+        _apply_cache_headers(response, etag)
+        return response
+
+    image_bytes = share_card_cache.get(etag)
+    if image_bytes is None:
+        image_bytes = render_share_card(session, aggregate)
+        share_card_cache.put(etag, image_bytes)
 
     response = FastAPIResponse(content=image_bytes, media_type="image/png")
-    response.headers["Cache-Control"] = "public, max-age=600"
-    response.headers["ETag"] = etag
-    apply_noindex_headers(response)
-    response.headers["X-Robots-Tag"] = NOINDEX_VALUE
+    _apply_cache_headers(response, etag)
     return response
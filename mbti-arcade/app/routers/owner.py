@@ -1,17 +1,14 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.config import sha256_hex
 from app.database import get_db
-from app.models import Participant, RelationAggregate, Session as SessionModel
+from app.models import RelationAggregate, Session as SessionModel
 from app.routers.responses import ensure_session_active
+from app.templating import templates
 from app.urling import build_invite_url
 from app.utils.problem_details import ProblemDetailsException
 from app.utils.privacy import NOINDEX_VALUE, apply_noindex_headers
@@ -19,8 +16,6 @@ from app import settings
 
 router = APIRouter(tags=["owner"])
 
-TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "templates"
-templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
 
 OWNER_TOKEN_COOKIE = "owner_token"
 
@@ -103,15 +98,7 @@ def owner_progress(
 
     invite_url = build_invite_url(request, token=session.invite_token)
     threshold = 3
-    respondent_count = (
-        db.query(func.count(Participant.id))
-        .filter(
-            Participant.session_id == session.id,
-            Participant.answers_submitted_at.isnot(None),
-        )
-        .scalar()
-        or 0
-    )
+    respondent_count = session.respondent_count
     unlocked = respondent_count >= threshold
     progress_percent = (
         min(100, int((respondent_count / threshold) * 100)) if threshold else 0
@@ -146,15 +133,7 @@ def owner_report(
     session = _get_owner_session(request, db)
 
     threshold = 3
-    respondent_count = (
-        db.query(func.count(Participant.id))
-        .filter(
-            Participant.session_id == session.id,
-            Participant.answers_submitted_at.isnot(None),
-        )
-        .scalar()
-        or 0
-    )
+    respondent_count = session.respondent_count
     unlocked = respondent_count >= threshold
 
     relations = (
@@ -1,21 +1,17 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Dict, List
 
 from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.data.loader import seed_questions
+from app.data.question_index import get_question_index
 from app.core.config import generate_invite_token, sha256_hex
 from app.database import get_db
 from app.models import (
-    OtherResponse,
     Participant,
-    ParticipantAnswer,
     ParticipantRelation,
-    Question,
     Session as SessionModel,
 )
 from app.routers.responses import ensure_session_active, validate_answers
@@ -29,10 +25,14 @@ from app.schemas import (
     ParticipantRegistrationResponse,
 )
 from app.services.aggregator import (
-    build_question_lookup,
-    recalculate_aggregate,
+    apply_rater_answers,
+    load_relation_aggregates,
+    mark_relations_dirty,
+    participant_rater_hash,
     recalculate_relation_aggregates,
+    record_participant_submission,
 )
+from app.services.answer_store import replace_participant_answers
 from app.services.scoring import ScoringError, compute_norms, norms_to_mbti
 from app.utils.problem_details import ProblemDetailsException
 
@@ -65,15 +65,6 @@ def _ensure_owner_cookie(request: Request, session: SessionModel) -> None:
         )
 
 
-def _participant_rater_hash(participant_id: int) -> str:
-    return f"participant:{participant_id}"
-
-
-def _get_question_lookup(db: Session) -> Dict[int, tuple[str, int]]:
-    questions = db.query(Question).all()
-    return build_question_lookup(questions)
-
-
 def _ensure_capacity(session: SessionModel, db: Session) -> None:
     current_count = (
         db.query(func.count(Participant.id))
@@ -95,7 +86,7 @@ def _ensure_capacity(session: SessionModel, db: Session) -> None:
     response_model=ParticipantRegistrationResponse,
     status_code=201,
 )
-async def register_participant(
+def register_participant(
     invite_token: str,
     payload: ParticipantRegistrationRequest,
     db: Session = Depends(get_db),
@@ -127,6 +118,7 @@ async def register_participant(
 
     try:
         db.add(participant)
+        mark_relations_dirty(session)
         db.flush()
         db.commit()
     except ProblemDetailsException:
@@ -153,7 +145,7 @@ async def register_participant(
     response_model=ParticipantAnswerSubmitResponse,
     status_code=201,
 )
-async def submit_participant_answers(
+def submit_participant_answers(
     participant_id: int,
     payload: ParticipantAnswerSubmitRequest,
     response: Response,
@@ -172,15 +164,7 @@ async def submit_participant_answers(
     ensure_session_active(session)
 
     if participant.answers_submitted_at is not None:
-        respondents = (
-            db.query(func.count(Participant.id))
-            .filter(
-                Participant.session_id == session.id,
-                Participant.answers_submitted_at.isnot(None),
-            )
-            .scalar()
-            or 0
-        )
+        respondents = session.respondent_count
         response.status_code = 200
         return ParticipantAnswerSubmitResponse(
             participant_id=participant.id,
@@ -205,52 +189,29 @@ async def submit_participant_answers(
 
     validate_answers(session.mode, answers)
 
-    seed_questions(db)
-    lookup = _get_question_lookup(db)
+    lookup = get_question_index(db)
 
     try:
-        db.query(ParticipantAnswer).filter(
-            ParticipantAnswer.participant_id == participant.id
-        ).delete()
-
-        rater_hash = _participant_rater_hash(participant.id)
-        db.query(OtherResponse).filter(
-            OtherResponse.session_id == session.id,
-            OtherResponse.rater_hash == rater_hash,
-        ).delete()
-
-        for answer in answers:
-            db.add(
-                ParticipantAnswer(
-                    participant_id=participant.id,
-                    question_id=answer.question_id,
-                    value=answer.value,
-                )
-            )
-            db.add(
-                OtherResponse(
-                    session_id=session.id,
-                    rater_hash=rater_hash,
-                    participant_id=participant.id,
-                    question_id=answer.question_id,
-                    value=answer.value,
-                    relation_tag=participant.relation.value,
-                )
-            )
-
-        db.flush()
-
         answer_pairs = [(item.question_id, item.value) for item in answers]
+        rater_hash = participant_rater_hash(participant.id)
+        replace_participant_answers(db, participant.id, answer_pairs)
+
         norms = compute_norms(answer_pairs, lookup)
         participant.axes_payload = {
             dim: round(value, 6) for dim, value in norms.items()
         }
         participant.perceived_type = norms_to_mbti(norms)
         now = datetime.now(timezone.utc)
-        participant.answers_submitted_at = now
+        record_participant_submission(session, participant, now)
         participant.computed_at = now
 
-        recalculate_aggregate(db, session)
+        apply_rater_answers(
+            db,
+            session,
+            rater_hash,
+            answer_pairs,
+            participant.relation.value,
+        )
         relation_result = recalculate_relation_aggregates(session.id, db)
 
         db.commit()
@@ -288,7 +249,7 @@ async def submit_participant_answers(
     "/participants/{invite_token}/preview",
     response_model=ParticipantPreviewResponse,
 )
-async def participant_preview(
+def participant_preview(
     invite_token: str,
     request: Request,
     db: Session = Depends(get_db),
@@ -306,8 +267,9 @@ async def participant_preview(
 
     _ensure_owner_cookie(request, session)
 
-    relation_result = recalculate_relation_aggregates(session.id, db)
-    db.commit()
+    relation_result, recomputed = load_relation_aggregates(db, session)
+    if recomputed:
+        db.commit()
 
     respondents = relation_result.total_respondents
     unlocked = respondents >= UNLOCK_THRESHOLD
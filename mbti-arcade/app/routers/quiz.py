@@ -1,17 +1,13 @@
-from pathlib import Path
-
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from app.core.db import get_session
 from app.core.models_db import Pair
 from app.core.services.mbti_service import MBTIService
 from app.core.token import verify_token
+from app.templating import templates
 
 router = APIRouter(prefix="/quiz", tags=["Quiz"])
-TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "templates"
-templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
 
 # 실제 데이터베이스 질문 ID를 사용 (각 차원당 6개씩 24개)
 MBTI_QUESTIONS = [
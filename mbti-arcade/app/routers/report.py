@@ -1,8 +1,5 @@
-from pathlib import Path
-
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import JSONResponse
-from fastapi.templating import Jinja2Templates
 
 from app.core.advice import MBTIAdvice
 from app.core.db import get_session
@@ -10,8 +7,6 @@ from app.core.services.mbti_service import MBTIService
 from app.core.token import verify_token
 
 router = APIRouter(prefix="/api", tags=["Report"])
-TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "templates"
-templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
 
 @router.get("/report/{token}")
 def report(token: str, session=Depends(get_session)):
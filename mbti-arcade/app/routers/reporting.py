@@ -5,9 +5,10 @@ from typing import Dict
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
+from app.data.question_index import get_question_index
 from app.database import get_db
 from app.core.config import sha256_hex
-from app.models import Participant, Question, Session as SessionModel
+from app.models import Participant, Session as SessionModel
 from app.schemas import (
     DIMENSIONS,
     ParticipantReportAxis,
@@ -16,9 +17,8 @@ from app.schemas import (
     SessionReportResponse,
 )
 from app.services.aggregator import (
-    build_question_lookup,
+    load_relation_aggregates,
     load_self_norm,
-    recalculate_relation_aggregates,
 )
 from app.services.scoring import norms_to_mbti
 from app.utils.problem_details import ProblemDetailsException
@@ -54,9 +54,7 @@ router = APIRouter(prefix="/v1/report", tags=["report"])
 
 
 def _load_self_axes(db: Session, session: SessionModel) -> Dict[str, float]:
-    questions = db.query(Question).all()
-    lookup = build_question_lookup(questions)
-    self_norm = load_self_norm(db, session, lookup)
+    self_norm = load_self_norm(db, session, get_question_index(db))
     if self_norm is None:
         raise ProblemDetailsException(
             status_code=409,
@@ -125,7 +123,9 @@ def participant_report(
             )
         )
 
-    summary = recalculate_relation_aggregates(session.id, db)
+    summary, recomputed = load_relation_aggregates(db, session)
+    if recomputed:
+        db.commit()
 
     return ParticipantReportResponse(
         participant_id=participant.id,
@@ -162,7 +162,9 @@ def session_report(
     except ProblemDetailsException:
         self_axes = None
 
-    summary = recalculate_relation_aggregates(session.id, db)
+    summary, recomputed = load_relation_aggregates(db, session)
+    if recomputed:
+        db.commit()
     respondents = summary.total_respondents
     unlocked = respondents >= UNLOCK_THRESHOLD
 
@@ -2,13 +2,11 @@ import hashlib
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.data.loader import seed_questions
 from app.data.questions import questions_for_mode
 from app.database import get_db
-from app.models import OtherResponse, Session as SessionModel, SelfResponse
+from app.models import OtherResponse, Session as SessionModel
 from app.schemas import (
     AnswerItem,
     OtherSubmitRequest,
@@ -16,7 +14,8 @@ from app.schemas import (
     SelfSubmitRequest,
     SelfSubmitResponse,
 )
-from app.services.aggregator import recalculate_aggregate
+from app.services.aggregator import apply_rater_answers, apply_self_answers, count_raters
+from app.services.answer_store import replace_rater_answers, replace_self_answers
 from app.services.scoring import ScoringError
 from app.utils.problem_details import ProblemDetailsException
 
@@ -79,7 +78,7 @@ def validate_answers(mode: str, answers: list[AnswerItem]) -> None:
 
 
 @router.post("/self/submit", response_model=SelfSubmitResponse)
-async def submit_self(payload: SelfSubmitRequest, db: Session = Depends(get_db)):
+def submit_self(payload: SelfSubmitRequest, db: Session = Depends(get_db)):
     session = db.get(SessionModel, payload.session_id)
     if session is None:
         raise ProblemDetailsException(
@@ -93,24 +92,12 @@ async def submit_self(payload: SelfSubmitRequest, db: Session = Depends(get_db))
 
     validate_answers(session.mode, payload.answers)
 
-    seed_questions(db)
-
     try:
-        db.query(SelfResponse).filter(SelfResponse.session_id == session.id).delete()
-
-        for answer in payload.answers:
-            db.add(
-                SelfResponse(
-                    session_id=session.id,
-                    question_id=answer.question_id,
-                    value=answer.value,
-                )
-            )
-
-        db.flush()
+        answer_pairs = [(answer.question_id, answer.value) for answer in payload.answers]
+        replace_self_answers(db, session.id, answer_pairs)
 
         try:
-            result = recalculate_aggregate(db, session)
+            result = apply_self_answers(db, session, answer_pairs)
         except ScoringError as exc:
             raise ProblemDetailsException(
                 status_code=400,
@@ -143,7 +130,7 @@ def build_rater_hash(invite_token: str, payload: OtherSubmitRequest) -> str:
 
 
 @router.post("/other/submit", response_model=OtherSubmitResponse, status_code=201)
-async def submit_other(payload: OtherSubmitRequest, db: Session = Depends(get_db)):
+def submit_other(payload: OtherSubmitRequest, db: Session = Depends(get_db)):
     session = (
         db.query(SessionModel)
         .filter(SessionModel.invite_token == payload.invite_token)
@@ -161,14 +148,7 @@ async def submit_other(payload: OtherSubmitRequest, db: Session = Depends(get_db
 
     validate_answers(session.mode, payload.answers)
 
-    seed_questions(db)
-
-    distinct_raters = (
-        db.query(func.count(func.distinct(OtherResponse.rater_hash)))
-        .filter(OtherResponse.session_id == session.id)
-        .scalar()
-        or 0
-    )
+    distinct_raters = count_raters(db, session)
     rater_hash = build_rater_hash(session.invite_token, payload)
     already_exists = (
         db.query(OtherResponse)
@@ -187,26 +167,15 @@ async def submit_other(payload: OtherSubmitRequest, db: Session = Depends(get_db
         )
 
     try:
-        db.query(OtherResponse).filter(
-            OtherResponse.session_id == session.id,
-            OtherResponse.rater_hash == rater_hash,
-        ).delete()
-
-        for answer in payload.answers:
-            db.add(
-                OtherResponse(
-                    session_id=session.id,
-                    rater_hash=rater_hash,
-                    question_id=answer.question_id,
-                    value=answer.value,
-                    relation_tag=payload.relation_tag,
-                )
-            )
-
-        db.flush()
+        answer_pairs = [(answer.question_id, answer.value) for answer in payload.answers]
+        replace_rater_answers(
+            db, session.id, rater_hash, answer_pairs, relation_tag=payload.relation_tag
+        )
 
         try:
-            result = recalculate_aggregate(db, session)
+            result = apply_rater_answers(
+                db, session, rater_hash, answer_pairs, payload.relation_tag
+            )
         except ScoringError as exc:
             raise ProblemDetailsException(
                 status_code=400,
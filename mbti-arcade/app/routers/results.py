@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import Aggregate, Session as SessionModel
 from app.schemas import ResultDetail
-from app.services.aggregator import recalculate_aggregate
+from app.services.aggregator import load_aggregate
 from app.services.scoring import ScoringError, norm_to_radar
 from app.utils.problem_details import ProblemDetailsException
 from app.utils.privacy import apply_noindex_headers
@@ -54,7 +54,7 @@ def _build_result_detail(
 
 
 @router.get("/result/preview", response_model=ResultDetail)
-async def preview_result(
+def preview_result(
     response: Response,
     db: Session = Depends(get_db),
 ) -> ResultDetail:
@@ -70,7 +70,7 @@ async def preview_result(
         return PREVIEW_RESULT
 
     try:
-        aggregate_result = recalculate_aggregate(db, session)
+        aggregate_result, rebuilt = load_aggregate(db, session)
     except ScoringError as exc:
         raise ProblemDetailsException(
             status_code=503,
@@ -79,7 +79,8 @@ async def preview_result(
             type_suffix="preview-unavailable",
         ) from exc
 
-    db.commit()
+    if rebuilt:
+        db.commit()
 
     publish_other = session.mode == "couple" or (aggregate_result.n or 0) >= 3
 
@@ -89,7 +90,7 @@ async def preview_result(
 
 
 @router.get("/result/{invite_token}", response_model=ResultDetail)
-async def fetch_result(
+def fetch_result(
     invite_token: str,
     response: Response,
     db: Session = Depends(get_db),
@@ -108,7 +109,7 @@ async def fetch_result(
         )
 
     try:
-        aggregate_result = recalculate_aggregate(db, session)
+        aggregate_result, rebuilt = load_aggregate(db, session)
     except ScoringError as exc:
         raise ProblemDetailsException(
             status_code=400,
@@ -117,7 +118,8 @@ async def fetch_result(
             type_suffix="scoring-error",
         ) from exc
 
-    db.commit()
+    if rebuilt:
+        db.commit()
 
     publish_other = session.mode == "couple" or (aggregate_result.n or 0) >= 3
 
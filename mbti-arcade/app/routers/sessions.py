@@ -8,7 +8,6 @@ from app.core.config import (
     generate_session_id,
     sha256_hex,
 )
-from app.data.loader import seed_questions
 from app.data.questions import questions_for_mode
 from app.database import get_db
 from app.models import Session as SessionModel, User
@@ -20,13 +19,11 @@ router = APIRouter(prefix="/api", tags=["sessions"])
 
 
 @router.post("/sessions", response_model=SessionResponse, status_code=201)
-async def create_session(
+def create_session(
     payload: SessionCreate,
     request: Request,
     db: Session = Depends(get_db),
 ):
-    seed_questions(db)
-
     owner = None
     if payload.owner_email:
         owner = db.query(User).filter(User.email == payload.owner_email).first()
@@ -70,7 +67,7 @@ async def create_session(
 
 
 @router.post("/invite/create", response_model=SessionResponse)
-async def update_invite(payload: InviteUpdate, db: Session = Depends(get_db)):
+def update_invite(payload: InviteUpdate, db: Session = Depends(get_db)):
     session = db.get(SessionModel, payload.session_id)
     if session is None:
         raise ProblemDetailsException(
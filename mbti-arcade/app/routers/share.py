@@ -1,9 +1,7 @@
-from pathlib import Path
 from urllib.parse import urlencode
 
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from sqlalchemy.orm import Session as OrmSession
@@ -15,16 +13,12 @@ from app.core.config import (
     generate_session_id,
     sha256_hex,
 )
-from app.core.db import get_session
-from app.core.services.mbti_service import MBTIService
 from app.database import get_db
 from app.models import Session as SessionModel
 from app.urling import build_invite_url, build_owner_exchange_url
 
 limiter = Limiter(key_func=get_remote_address)
 router = APIRouter(tags=["Share"])
-TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "templates"
-templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
 
 
 @router.get("/share", response_class=HTMLResponse)
@@ -41,7 +35,6 @@ def make_share_link(
     mbti_source: str = Form("input"),
     mbti_value: str = Form(""),
     show_public: str | None = Form(None),
-    session=Depends(get_session),
     db: OrmSession = Depends(get_db),
 ):
     name = (display_name or "").strip()
@@ -61,19 +54,6 @@ def make_share_link(
     if source != "input":
         mbti_clean = ""
 
-    svc = MBTIService(session)
-    pair_id = svc.create_pair(
-        "friend",
-        None,
-        my_name=name,
-        my_mbti=mbti_clean or None,
-        my_avatar=avatar,
-        my_mbti_source=source,
-        show_public=bool(show_public),
-    )
-
-    _ = pair_id
-
     owner_token = generate_owner_token()
     invite_token = generate_invite_token()
     owner_session = SessionModel(
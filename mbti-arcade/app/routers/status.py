@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-from datetime import datetime
-
 from fastapi import APIRouter, Depends, Response
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models import Participant, Session as SessionModel
+from app.models import Session as SessionModel
 from app.routers.participants import UNLOCK_THRESHOLD
 from app.routers.responses import ensure_session_active
 from app.schemas import InviteStatusResponse
@@ -35,24 +32,7 @@ def get_invite_status(
 
     ensure_session_active(session)
 
-    respondent_count = (
-        db.query(func.count(Participant.id))
-        .filter(
-            Participant.session_id == session.id,
-            Participant.answers_submitted_at.isnot(None),
-        )
-        .scalar()
-        or 0
-    )
-
-    last_submitted_at: datetime | None = (
-        db.query(func.max(Participant.answers_submitted_at))
-        .filter(
-            Participant.session_id == session.id,
-            Participant.answers_submitted_at.isnot(None),
-        )
-        .scalar()
-    )
+    respondent_count = session.respondent_count
 
     threshold = UNLOCK_THRESHOLD
     unlocked = respondent_count >= threshold
@@ -66,5 +46,5 @@ def get_invite_status(
         unlocked=unlocked,
         expires_at=session.expires_at,
         max_raters=session.max_raters,
-        updated_at=last_submitted_at,
+        updated_at=session.last_submitted_at,
     )
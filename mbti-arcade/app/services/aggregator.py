@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 from collections import Counter, defaultdict
+from datetime import datetime, timezone
 from statistics import fmean
-from typing import Dict, Iterable, List, NamedTuple, Tuple
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Sequence, Tuple
 
+from sqlalchemy import func, insert, update
 from sqlalchemy.orm import Session
 
+from app import settings
+from app.data.question_index import QuestionIndex, get_question_index
 from app.models import (
     Aggregate,
+    AggregateRater,
     OtherResponse,
     Participant,
+    ParticipantAnswer,
     ParticipantRelation,
     Question,
     RelationAggregate,
@@ -19,9 +25,9 @@ from app.models import (
 from app.schemas import DIMENSIONS
 from app.services.scoring import (
     ScoringError,
-    compute_gap_metrics,
     compute_norms,
     norm_to_radar,
+    score_norms,
     weight_for_relation,
 )
 
@@ -88,14 +94,258 @@ def group_other_responses(responses: Iterable[OtherResponse]) -> Dict[str, List[
     return grouped
 
 
+PARTICIPANT_RATER_PREFIX = "participant:"
+
+
+def participant_rater_hash(participant_id: int) -> str:
+    return f"{PARTICIPANT_RATER_PREFIX}{participant_id}"
+
+
+class RaterAnswers(NamedTuple):
+    relation_tag: str | None
+    answers: List[Tuple[int, int]]
+
+
+def load_rater_answers(db: Session, session_id: str) -> Dict[str, RaterAnswers]:
+    """Every rater's answers for a session, keyed by rater hash.
+
+    Registered participants are read from ``participant_answers``.  Rows in
+    ``responses_other`` cover ``/api/other/submit`` raters and participant
+    answers written before submissions stopped copying them there; a
+    participant's own answer set wins over such a historic copy.
+    """
+
+    raters: Dict[str, RaterAnswers] = {}
+    participant_rows = (
+        db.query(
+            ParticipantAnswer.participant_id,
+            Participant.relation,
+            ParticipantAnswer.question_id,
+            ParticipantAnswer.value,
+        )
+        .join(Participant, Participant.id == ParticipantAnswer.participant_id)
+        .filter(Participant.session_id == session_id)
+        .all()
+    )
+    for participant_id, relation, question_id, value in participant_rows:
+        rater = raters.get(participant_rater_hash(participant_id))
+        if rater is None:
+            rater = raters[participant_rater_hash(participant_id)] = RaterAnswers(
+                relation.value, []
+            )
+        rater.answers.append((question_id, value))
+
+    from_participants = set(raters)
+    legacy_rows = (
+        db.query(
+            OtherResponse.rater_hash,
+            OtherResponse.relation_tag,
+            OtherResponse.question_id,
+            OtherResponse.value,
+        )
+        .filter(OtherResponse.session_id == session_id)
+        .all()
+    )
+    for rater_hash, relation_tag, question_id, value in legacy_rows:
+        if rater_hash in from_participants:
+            continue
+        rater = raters.get(rater_hash)
+        if rater is None:
+            rater = raters[rater_hash] = RaterAnswers(relation_tag, [])
+        rater.answers.append((question_id, value))
+    return raters
+
+
+def count_raters(db: Session, session: SessionModel) -> int:
+    """Distinct raters on a session: submitted participants plus direct raters."""
+
+    direct = (
+        db.query(func.count(func.distinct(OtherResponse.rater_hash)))
+        .filter(
+            OtherResponse.session_id == session.id,
+            ~OtherResponse.rater_hash.startswith(PARTICIPANT_RATER_PREFIX),
+        )
+        .scalar()
+        or 0
+    )
+    return direct + (session.respondent_count or 0)
+
+
+def _dim_key(dim: str, suffix: str) -> str:
+    return f"{dim.lower()}_{suffix}"
+
+
+def _reset_running_sums(aggregate: Aggregate) -> None:
+    aggregate.weight_total = 0.0
+    aggregate.n = 0
+    for dim in DIMENSIONS:
+        setattr(aggregate, _dim_key(dim, "wsum"), 0.0)
+        setattr(aggregate, _dim_key(dim, "wsq"), 0.0)
+
+
+def _add_rater_contribution(
+    aggregate: Aggregate, norms: Dict[str, float], weight: float, sign: int
+) -> None:
+    aggregate.weight_total = (aggregate.weight_total or 0.0) + sign * weight
+    aggregate.n = (aggregate.n or 0) + sign
+    for dim in DIMENSIONS:
+        value = norms[dim]
+        wsum_key = _dim_key(dim, "wsum")
+        wsq_key = _dim_key(dim, "wsq")
+        setattr(
+            aggregate,
+            wsum_key,
+            (getattr(aggregate, wsum_key) or 0.0) + sign * weight * value,
+        )
+        setattr(
+            aggregate,
+            wsq_key,
+            (getattr(aggregate, wsq_key) or 0.0) + sign * weight * value * value,
+        )
+    if aggregate.n <= 0:
+        # Avoid carrying floating point residue once the last rater is gone.
+        _reset_running_sums(aggregate)
+
+
+def _lock_aggregate(db: Session, session_id: str) -> Aggregate | None:
+    """Load the aggregate row ``FOR UPDATE`` so concurrent submits serialise.
+
+    The running sums are adjusted in Python, so every writer must hold the
+    row lock from this read until commit.  ``populate_existing`` refreshes an
+    instance already in the identity map with the locked values.
+    """
+
+    return db.get(Aggregate, session_id, with_for_update=True, populate_existing=True)
+
+
+def _rater_row_norms(row: AggregateRater) -> Dict[str, float]:
+    return {dim: getattr(row, _dim_key(dim, "norm")) for dim in DIMENSIONS}
+
+
+def _stored_self_norm(aggregate: Aggregate | None) -> Dict[str, float] | None:
+    if aggregate is None:
+        return None
+    values = {dim: getattr(aggregate, _dim_key(dim, "self")) for dim in DIMENSIONS}
+    if any(value is None for value in values.values()):
+        return None
+    return values
+
+
+def _is_initialised(aggregate: Aggregate | None) -> bool:
+    return aggregate is not None and aggregate.weight_total is not None
+
+
+def _responses_version(session: SessionModel) -> int:
+    return session.responses_version or 0
+
+
+def mark_relations_dirty(session: SessionModel) -> None:
+    """Flag the session's relation rollups for recomputation on next read."""
+
+    session.relations_dirty = True
+
+
+def record_participant_submission(
+    session: SessionModel, participant: Participant, submitted_at: datetime
+) -> None:
+    """Stamp ``participant`` as submitted and update the session counters.
+
+    Only a participant's first submission counts.  The increment is issued as
+    ``respondent_count + 1`` so concurrent submits do not lose updates.
+    """
+
+    if participant.answers_submitted_at is None:
+        session.respondent_count = SessionModel.respondent_count + 1
+    participant.answers_submitted_at = submitted_at
+    session.last_submitted_at = submitted_at
+
+
+def mark_responses_changed(db: Session, session: SessionModel) -> int:
+    """Record that the session's stored answers changed; return the new version.
+
+    The bump is issued as ``responses_version + 1`` and flushed, so the UPDATE
+    holds the session row lock until commit and every concurrent writer gets
+    its own version.  The value is read back under that lock.
+    """
+
+    session.responses_version = SessionModel.responses_version + 1
+    db.flush()
+    return session.responses_version
+
+
+def is_aggregate_current(session: SessionModel, aggregate: Aggregate | None) -> bool:
+    """Whether ``aggregate`` reflects every answer stored for ``session``."""
+
+    return _is_initialised(aggregate) and aggregate.version == _responses_version(session)
+
+
+def _finalize_aggregate(aggregate: Aggregate) -> None:
+    """Derive means, sigmas and gaps from the stored running sums."""
+
+    self_norm = _stored_self_norm(aggregate)
+    total_weight = aggregate.weight_total or 0.0
+    if self_norm is None or not aggregate.n or total_weight <= 0:
+        for dim in DIMENSIONS:
+            setattr(aggregate, _dim_key(dim, "other"), None)
+            setattr(aggregate, _dim_key(dim, "gap"), None)
+            setattr(aggregate, _dim_key(dim, "sigma"), None)
+        aggregate.gap_score = None
+        return
+
+    gaps: List[float] = []
+    for dim in DIMENSIONS:
+        mean = getattr(aggregate, _dim_key(dim, "wsum")) / total_weight
+        variance = getattr(aggregate, _dim_key(dim, "wsq")) / total_weight - mean * mean
+        gap = mean - self_norm[dim]
+        setattr(aggregate, _dim_key(dim, "other"), mean)
+        setattr(aggregate, _dim_key(dim, "sigma"), max(variance, 0.0) ** 0.5)
+        setattr(aggregate, _dim_key(dim, "gap"), gap)
+        gaps.append(abs(gap))
+    aggregate.gap_score = fmean(gaps) * 100
+
+
+def aggregate_to_result(session: SessionModel, aggregate: Aggregate) -> AggregateResult:
+    self_norm = _stored_self_norm(aggregate)
+    if self_norm is None:
+        raise ScoringError("Self responses missing for session")
+
+    other_norm = gap = sigma = radar_other = None
+    if aggregate.n and aggregate.ei_other is not None:
+        other_norm = {dim: getattr(aggregate, _dim_key(dim, "other")) for dim in DIMENSIONS}
+        gap = {dim: getattr(aggregate, _dim_key(dim, "gap")) for dim in DIMENSIONS}
+        sigma = {dim: getattr(aggregate, _dim_key(dim, "sigma")) for dim in DIMENSIONS}
+        radar_other = norm_to_radar(other_norm)
+
+    return AggregateResult(
+        session_id=session.id,
+        mode=session.mode,
+        self_norm=self_norm,
+        radar_self=norm_to_radar(self_norm),
+        other_norm=other_norm,
+        radar_other=radar_other,
+        gap=gap,
+        sigma=sigma,
+        n=aggregate.n or 0,
+        gap_score=aggregate.gap_score if other_norm is not None else None,
+    )
+
+
 def recalculate_aggregate(db: Session, session: SessionModel) -> AggregateResult:
-    questions = db.query(Question).all()
-    lookup = build_question_lookup(questions)
+    """Rebuild the aggregate and its running sums from every stored answer.
+
+    Submit paths keep the aggregate current through :func:`apply_rater_answers`
+    and :func:`apply_self_answers`; the full rebuild is reserved for
+    initialising legacy rows, backfills and repairs.
+    """
+
+    lookup = get_question_index(db)
+    # Lock before reading answers so a concurrent delta cannot land between
+    # the read and the rebuild.
+    aggregate = _lock_aggregate(db, session.id)
 
     self_rows = (
         db.query(SelfResponse)
         .filter(SelfResponse.session_id == session.id)
-        
         .all()
     )
     if not self_rows:
@@ -103,89 +353,185 @@ def recalculate_aggregate(db: Session, session: SessionModel) -> AggregateResult
 
     self_answers = [(row.question_id, row.value) for row in self_rows]
     self_norm = compute_norms(self_answers, lookup)
-    radar_self = norm_to_radar(self_norm)
 
-    other_rows = (
-        db.query(OtherResponse)
-        .filter(OtherResponse.session_id == session.id)
-        .all()
-    )
-    grouped = group_other_responses(other_rows)
-
-    other_norms: List[Dict[str, float]] = []
-    weights: List[float] = []
-    for rater_hash, rows in grouped.items():
-        answers = [(row.question_id, row.value) for row in rows]
-        relation_tag = rows[0].relation_tag if rows else None
-        try:
-            norms = compute_norms(answers, lookup)
-        except ScoringError:
-            continue
-        other_norms.append(norms)
-        weights.append(weight_for_relation(relation_tag))
-
-    agg_other = None
-    radar_other = None
-    gap = None
-    sigma = None
-    gap_score = None
-
-    if other_norms:
-        agg_other, sigma, gap, gap_score = compute_gap_metrics(
-            self_norm, other_norms, weights
-        )
-        radar_other = norm_to_radar(agg_other)
+    raters = load_rater_answers(db, session.id)
 
-    aggregate = db.get(Aggregate, session.id)
     if aggregate is None:
         aggregate = Aggregate(session_id=session.id)
         db.add(aggregate)
 
-    aggregate.ei_self = self_norm["EI"]
-    aggregate.sn_self = self_norm["SN"]
-    aggregate.tf_self = self_norm["TF"]
-    aggregate.jp_self = self_norm["JP"]
-
-    if agg_other is not None and gap is not None and sigma is not None:
-        aggregate.ei_other = agg_other["EI"]
-        aggregate.sn_other = agg_other["SN"]
-        aggregate.tf_other = agg_other["TF"]
-        aggregate.jp_other = agg_other["JP"]
-        aggregate.ei_gap = gap["EI"]
-        aggregate.sn_gap = gap["SN"]
-        aggregate.tf_gap = gap["TF"]
-        aggregate.jp_gap = gap["JP"]
-        aggregate.ei_sigma = sigma["EI"]
-        aggregate.sn_sigma = sigma["SN"]
-        aggregate.tf_sigma = sigma["TF"]
-        aggregate.jp_sigma = sigma["JP"]
-        aggregate.n = len(other_norms)
-        aggregate.gap_score = gap_score
-    else:
-        aggregate.ei_other = aggregate.sn_other = aggregate.tf_other = aggregate.jp_other = None
-        aggregate.ei_gap = aggregate.sn_gap = aggregate.tf_gap = aggregate.jp_gap = None
-        aggregate.ei_sigma = aggregate.sn_sigma = aggregate.tf_sigma = aggregate.jp_sigma = None
-        aggregate.n = 0
-        aggregate.gap_score = None
+    for dim in DIMENSIONS:
+        setattr(aggregate, _dim_key(dim, "self"), self_norm[dim])
 
+    db.query(AggregateRater).filter(AggregateRater.session_id == session.id).delete(
+        synchronize_session=False
+    )
+    _reset_running_sums(aggregate)
+
+    rater_hashes = list(raters)
+    weights = [weight_for_relation(raters[key].relation_tag) for key in rater_hashes]
+    question_ids, matrix = _answer_matrix(raters, rater_hashes)
+    # Mean, sigma and gap come from the running sums in _finalize_aggregate.
+    norms_per_rater = score_norms(matrix, question_ids, lookup)
+
+    for rater_hash, norms, weight in zip(rater_hashes, norms_per_rater, weights):
+        if norms is None:
+            continue
+        _add_rater_contribution(aggregate, norms, weight, 1)
+        db.add(_build_rater_row(session.id, rater_hash, norms, weight))
+
+    _finalize_aggregate(aggregate)
+    aggregate.version = _responses_version(session)
     db.flush()
 
-    return AggregateResult(
-        session_id=session.id,
-        mode=session.mode,
-        self_norm=self_norm,
-        radar_self=radar_self,
-        other_norm=agg_other,
-        radar_other=radar_other,
-        gap=gap,
-        sigma=sigma,
-        n=len(other_norms),
-        gap_score=gap_score,
+    return aggregate_to_result(session, aggregate)
+
+
+def _answer_matrix(
+    raters: Mapping[str, RaterAnswers], rater_hashes: Sequence[str]
+) -> tuple[List[int], List[List[int]]]:
+    question_ids = sorted(
+        {question_id for rater in raters.values() for question_id, _ in rater.answers}
     )
+    columns = {question_id: position for position, question_id in enumerate(question_ids)}
+    matrix: List[List[int]] = []
+    for rater_hash in rater_hashes:
+        cells = [0] * len(question_ids)
+        for question_id, value in raters[rater_hash].answers:
+            cells[columns[question_id]] = value
+        matrix.append(cells)
+    return question_ids, matrix
+
+
+def _build_rater_row(
+    session_id: str, rater_hash: str, norms: Dict[str, float], weight: float
+) -> AggregateRater:
+    return AggregateRater(
+        session_id=session_id,
+        rater_hash=rater_hash,
+        weight=weight,
+        ei_norm=norms["EI"],
+        sn_norm=norms["SN"],
+        tf_norm=norms["TF"],
+        jp_norm=norms["JP"],
+    )
+
+
+def _running_aggregate(db: Session, session: SessionModel) -> Aggregate | None:
+    """Bump the session version and return the aggregate if it can take deltas.
+
+    ``None`` means the caller should fall back to a full rebuild, which
+    already accounts for any freshly flushed answers.  The version is bumped
+    before anything can fail so readers never trust a stale aggregate.
+    """
+
+    version = mark_responses_changed(db, session)
+    aggregate = _lock_aggregate(db, session.id)
+    if not (_is_initialised(aggregate) and aggregate.version == version - 1):
+        return None
+    aggregate.version = version
+    return aggregate
+
+
+def apply_self_answers(
+    db: Session, session: SessionModel, answers: Sequence[tuple[int, int]]
+) -> AggregateResult:
+    """Replace the self norm and refresh the derived gap metrics."""
+
+    aggregate = _running_aggregate(db, session)
+    if aggregate is None:
+        mark_relations_dirty(session)
+        return recalculate_aggregate(db, session)
+
+    lookup = get_question_index(db)
+    self_norm = compute_norms(answers, lookup)
+    for dim in DIMENSIONS:
+        setattr(aggregate, _dim_key(dim, "self"), self_norm[dim])
+
+    _finalize_aggregate(aggregate)
+    # Relation PGIs are measured against the self norm.
+    mark_relations_dirty(session)
+    db.flush()
+    return aggregate_to_result(session, aggregate)
+
+
+def apply_rater_answers(
+    db: Session,
+    session: SessionModel,
+    rater_hash: str,
+    answers: Sequence[tuple[int, int]],
+    relation_tag: str | None,
+) -> AggregateResult:
+    """Insert or replace one rater's contribution to the running sums."""
+
+    aggregate = _running_aggregate(db, session)
+    if aggregate is None:
+        return recalculate_aggregate(db, session)
+    if _stored_self_norm(aggregate) is None:
+        raise ScoringError("Self responses missing for session")
+
+    lookup = get_question_index(db)
+    try:
+        norms: Dict[str, float] | None = compute_norms(answers, lookup)
+    except ScoringError:
+        norms = None
+
+    existing = db.get(AggregateRater, (session.id, rater_hash))
+    if existing is not None:
+        _add_rater_contribution(aggregate, _rater_row_norms(existing), existing.weight, -1)
+
+    if norms is None:
+        if existing is not None:
+            db.delete(existing)
+    else:
+        weight = weight_for_relation(relation_tag)
+        _add_rater_contribution(aggregate, norms, weight, 1)
+        if existing is None:
+            db.add(_build_rater_row(session.id, rater_hash, norms, weight))
+        else:
+            existing.weight = weight
+            for dim in DIMENSIONS:
+                setattr(existing, _dim_key(dim, "norm"), norms[dim])
+
+    _finalize_aggregate(aggregate)
+    db.flush()
+    return aggregate_to_result(session, aggregate)
+
+
+def remove_rater(db: Session, session: SessionModel, rater_hash: str) -> AggregateResult:
+    """Drop one rater's contribution from the running sums."""
+
+    aggregate = _running_aggregate(db, session)
+    if aggregate is None:
+        return recalculate_aggregate(db, session)
+
+    existing = db.get(AggregateRater, (session.id, rater_hash))
+    if existing is not None:
+        _add_rater_contribution(aggregate, _rater_row_norms(existing), existing.weight, -1)
+        db.delete(existing)
+
+    _finalize_aggregate(aggregate)
+    db.flush()
+    return aggregate_to_result(session, aggregate)
+
+
+def load_aggregate(db: Session, session: SessionModel) -> tuple[AggregateResult, bool]:
+    """Serve the stored aggregate without writing when it is current.
+
+    Returns the result and whether it had to be rebuilt; only in that case
+    does the caller hold pending writes that need committing.
+    """
+
+    aggregate = db.get(Aggregate, session.id)
+    if is_aggregate_current(session, aggregate):
+        return aggregate_to_result(session, aggregate), False
+    return recalculate_aggregate(db, session), True
 
 
 def load_self_norm(
-    db: Session, session: SessionModel, lookup: Dict[int, Tuple[str, int]]
+    db: Session,
+    session: SessionModel,
+    lookup: Mapping[int, Tuple[str, int]] | QuestionIndex,
 ) -> Dict[str, float] | None:
     aggregate = db.get(Aggregate, session.id)
     if aggregate and all(
@@ -220,26 +566,84 @@ def _average_axes(payloads: List[Dict[str, float]]) -> Dict[str, float]:
     }
 
 
+_RELATION_UPSERT_KEEP = frozenset({"session_id", "relation", "created_at"})
+
+
+def _upsert_relation_aggregates(db: Session, rows: List[Dict[str, object]]) -> None:
+    """Write relation rollups in one statement keyed on ``uq_relation_per_session``."""
+
+    if not rows:
+        return
+
+    dialect = db.get_bind().dialect.name
+    if dialect in {"sqlite", "postgresql"}:
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+        stmt = dialect_insert(RelationAggregate).values(rows)
+        updated = {
+            column: stmt.excluded[column]
+            for column in rows[0]
+            if column not in _RELATION_UPSERT_KEEP
+        }
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["session_id", "relation"], set_=updated
+            )
+        )
+        return
+
+    # Generic fallback: one lookup for the existing ids, then bulk writes.
+    session_id = rows[0]["session_id"]
+    existing = dict(
+        db.query(RelationAggregate.relation, RelationAggregate.id)
+        .filter(RelationAggregate.session_id == session_id)
+        .all()
+    )
+    inserts = [row for row in rows if row["relation"] not in existing]
+    updates = [
+        {
+            **{key: value for key, value in row.items() if key not in _RELATION_UPSERT_KEEP},
+            "id": existing[row["relation"]],
+        }
+        for row in rows
+        if row["relation"] in existing
+    ]
+    if updates:
+        db.execute(update(RelationAggregate), updates)
+    if inserts:
+        db.execute(insert(RelationAggregate), inserts)
+
+
 def recalculate_relation_aggregates(session_id: str, db: Session) -> RelationAggregateSummary:
     session = db.get(SessionModel, session_id)
     if session is None:
         return RelationAggregateSummary(session_id=session_id, relations=[])
 
-    questions = db.query(Question).all()
-    lookup = build_question_lookup(questions)
-    self_norm = load_self_norm(db, session, lookup)
+    self_norm = load_self_norm(db, session, get_question_index(db))
 
-    participants = (
-        db.query(Participant)
+    # Column tuples bypass the identity map, so pending participant edits
+    # must reach the database first.
+    db.flush()
+    participant_rows = (
+        db.query(
+            Participant.relation,
+            Participant.answers_submitted_at,
+            Participant.perceived_type,
+            Participant.axes_payload,
+        )
         .filter(Participant.session_id == session_id)
         .all()
     )
 
-    relations_map: Dict[ParticipantRelation, List[Participant]] = defaultdict(list)
-    for participant in participants:
-        relations_map[participant.relation].append(participant)
+    relations_map: Dict[ParticipantRelation, list] = defaultdict(list)
+    for row in participant_rows:
+        relations_map[row.relation].append(row)
 
     results: List[RelationAggregateResult] = []
+    now = datetime.now(timezone.utc)
 
     for relation, members in relations_map.items():
         submitted = [item for item in members if item.answers_submitted_at is not None]
@@ -275,27 +679,6 @@ def recalculate_relation_aggregates(session_id: str, db: Session) -> RelationAgg
                 gaps = [abs(axes_payload[dim] - self_norm[dim]) for dim in DIMENSIONS]
                 pgi = round(fmean(gaps) * 100, 6)
 
-        record = (
-            db.query(RelationAggregate)
-            .filter(
-                RelationAggregate.session_id == session_id,
-                RelationAggregate.relation == relation,
-            )
-            .first()
-        )
-        if record is None:
-            record = RelationAggregate(session_id=session_id, relation=relation)
-            db.add(record)
-
-        record.respondent_count = respondent_count
-        record.top_type = top_type
-        record.top_fraction = top_fraction
-        record.second_type = second_type
-        record.second_fraction = second_fraction
-        record.consensus = consensus
-        record.pgi = pgi
-        record.axes_payload = axes_payload
-
         results.append(
             RelationAggregateResult(
                 relation=relation,
@@ -310,9 +693,57 @@ def recalculate_relation_aggregates(session_id: str, db: Session) -> RelationAgg
             )
         )
 
-    db.flush()
-
     # Ensure deterministic ordering for callers/tests.
     results.sort(key=lambda item: item.relation.value)
+    session.relations_dirty = False
+
+    _upsert_relation_aggregates(
+        db,
+        [
+            {
+                "session_id": session_id,
+                "created_at": now,
+                "updated_at": now,
+                **item._asdict(),
+            }
+            for item in results
+        ],
+    )
 
     return RelationAggregateSummary(session_id=session_id, relations=results)
+
+
+def load_relation_aggregates(
+    db: Session, session: SessionModel
+) -> tuple[RelationAggregateSummary, bool]:
+    """Serve the persisted relation rollups for read endpoints.
+
+    Submits keep ``relation_aggregates`` current; in ``"dirty"`` consistency
+    mode a flagged session is recomputed once.  Returns the summary and
+    whether it was recomputed, i.e. whether the caller must commit.
+    """
+
+    if session.relations_dirty and settings.RELATION_AGGREGATE_CONSISTENCY == "dirty":
+        return recalculate_relation_aggregates(session.id, db), True
+
+    records = (
+        db.query(RelationAggregate)
+        .filter(RelationAggregate.session_id == session.id)
+        .all()
+    )
+    results = [
+        RelationAggregateResult(
+            relation=record.relation,
+            respondent_count=record.respondent_count,
+            top_type=record.top_type,
+            top_fraction=record.top_fraction,
+            second_type=record.second_type,
+            second_fraction=record.second_fraction,
+            consensus=record.consensus,
+            pgi=record.pgi,
+            axes_payload=record.axes_payload,
+        )
+        for record in records
+    ]
+    results.sort(key=lambda item: item.relation.value)
+    return RelationAggregateSummary(session_id=session.id, relations=results), False
@@ -0,0 +1,95 @@
+"""Bulk writes for submitted answer sets.
+
+Every submission path replaces a respondent's whole answer set, so each table
+gets one ``DELETE`` and one executemany ``INSERT`` instead of an ORM object per
+answer going through identity-map bookkeeping and unit-of-work ordering.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping, Sequence
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from app.models import OtherResponse, ParticipantAnswer, SelfResponse
+
+
+def replace_rows(
+    db: Session,
+    model: type,
+    criteria: Iterable[Any],
+    rows: Sequence[Mapping[str, Any]],
+) -> int:
+    """Delete ``model`` rows matching ``criteria`` and insert ``rows`` in bulk.
+
+    Column defaults such as ``created_at`` are still applied by the ORM bulk
+    insert.  Returns the number of rows written.
+    """
+
+    db.execute(delete(model).where(*criteria))
+    if rows:
+        db.execute(insert(model), list(rows))
+    return len(rows)
+
+
+def replace_self_answers(
+    db: Session, session_id: str, answers: Sequence[tuple[int, int]]
+) -> int:
+    return replace_rows(
+        db,
+        SelfResponse,
+        [SelfResponse.session_id == session_id],
+        [
+            {"session_id": session_id, "question_id": question_id, "value": value}
+            for question_id, value in answers
+        ],
+    )
+
+
+def replace_rater_answers(
+    db: Session,
+    session_id: str,
+    rater_hash: str,
+    answers: Sequence[tuple[int, int]],
+    *,
+    relation_tag: str | None,
+    participant_id: int | None = None,
+) -> int:
+    return replace_rows(
+        db,
+        OtherResponse,
+        [OtherResponse.session_id == session_id, OtherResponse.rater_hash == rater_hash],
+        [
+            {
+                "session_id": session_id,
+                "rater_hash": rater_hash,
+                "participant_id": participant_id,
+                "question_id": question_id,
+                "value": value,
+                "relation_tag": relation_tag,
+            }
+            for question_id, value in answers
+        ],
+    )
+
+
+def replace_participant_answers(
+    db: Session, participant_id: int, answers: Sequence[tuple[int, int]]
+) -> int:
+    return replace_rows(
+        db,
+        ParticipantAnswer,
+        [ParticipantAnswer.participant_id == participant_id],
+        [
+            {"participant_id": participant_id, "question_id": question_id, "value": value}
+            for question_id, value in answers
+        ],
+    )
+
+
+__all__ = [
+    "replace_participant_answers",
+    "replace_rater_answers",
+    "replace_rows",
+    "replace_self_answers",
+]
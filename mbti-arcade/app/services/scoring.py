@@ -1,8 +1,9 @@
 ﻿from __future__ import annotations
 
 from statistics import fmean
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Sequence
 
+from app.data.question_index import MISSING_DIM, QuestionIndex
 from app.schemas import DIMENSIONS
 
 RELATION_WEIGHTS = {
@@ -25,8 +26,12 @@ MBTI_POSITIVE = {"EI": "E", "SN": "S", "TF": "T", "JP": "J"}
 
 
 def compute_norms(
-    answers: Iterable[tuple[int, int]], question_lookup: Dict[int, tuple[str, int]]
+    answers: Iterable[tuple[int, int]],
+    question_lookup: Mapping[int, tuple[str, int]] | QuestionIndex,
 ) -> Dict[str, float]:
+    if isinstance(question_lookup, QuestionIndex):
+        return _compute_norms_indexed(answers, question_lookup)
+
     totals: Dict[str, float] = {dim: 0.0 for dim in DIMENSIONS}
     counts: Dict[str, int] = {dim: 0 for dim in DIMENSIONS}
 
@@ -48,6 +53,32 @@ def compute_norms(
     return norms
 
 
+def _compute_norms_indexed(
+    answers: Iterable[tuple[int, int]], index: QuestionIndex
+) -> Dict[str, float]:
+    dim_index = index.dim_index
+    signs = index.signs
+    size = len(dim_index)
+    totals = [0, 0, 0, 0]
+    counts = [0, 0, 0, 0]
+
+    for question_id, value in answers:
+        position = dim_index[question_id] if 0 <= question_id < size else MISSING_DIM
+        if position == MISSING_DIM:
+            raise ScoringError(f"Unknown question_id={question_id}")
+        if value < 1 or value > 5:
+            raise ScoringError(f"Answer value must be 1..5 (question_id={question_id})")
+        totals[position] += signs[question_id] * (value - 3)
+        counts[position] += 1
+
+    norms: Dict[str, float] = {}
+    for position, dim in enumerate(DIMENSIONS):
+        if counts[position] == 0:
+            raise ScoringError(f"Missing answers for dimension {dim}")
+        norms[dim] = totals[position] / (2 * counts[position])
+    return norms
+
+
 def norm_to_radar(norms: Dict[str, float]) -> Dict[str, float]:
     return {dim: round((value + 1) * 50, 3) for dim, value in norms.items()}
 
@@ -97,6 +128,129 @@ def compute_gap_metrics(
     return agg_other, sigma, gaps, gap_score
 
 
+class BatchScores(NamedTuple):
+    """Result of :func:`score_batch`.
+
+    ``norms`` holds one entry per matrix row; rows that :func:`compute_norms`
+    would reject (unknown question, value outside 1..5, a dimension without
+    answers) are ``None`` and excluded from the weighted statistics.
+    """
+
+    norms: List[Dict[str, float] | None]
+    other_norm: Dict[str, float] | None
+    sigma: Dict[str, float] | None
+    gap: Dict[str, float] | None
+    gap_score: float | None
+
+
+def _column_projection(
+    question_ids: Sequence[int],
+    question_lookup: Mapping[int, tuple[str, int]] | QuestionIndex,
+) -> List[tuple[int, int]]:
+    lookup = (
+        question_lookup.dim_sign
+        if isinstance(question_lookup, QuestionIndex)
+        else question_lookup
+    )
+    positions = {dim: position for position, dim in enumerate(DIMENSIONS)}
+    projection: List[tuple[int, int]] = []
+    for question_id in question_ids:
+        entry = lookup.get(question_id)
+        if entry is None:
+            projection.append((MISSING_DIM, 0))
+        else:
+            projection.append((positions[entry[0]], entry[1]))
+    return projection
+
+
+def _batch_norms_python(
+    matrix: Sequence[Sequence[int]], projection: List[tuple[int, int]]
+) -> List[Dict[str, float] | None]:
+    results: List[Dict[str, float] | None] = []
+    for row in matrix:
+        totals = [0, 0, 0, 0]
+        counts = [0, 0, 0, 0]
+        valid = True
+        for (position, sign), value in zip(projection, row):
+            if not value:
+                continue
+            if position == MISSING_DIM or value < 1 or value > 5:
+                valid = False
+                break
+            totals[position] += sign * (value - 3)
+            counts[position] += 1
+        if not valid or 0 in counts:
+            results.append(None)
+            continue
+        results.append(
+            {dim: totals[i] / (2 * counts[i]) for i, dim in enumerate(DIMENSIONS)}
+        )
+    return results
+
+
+def _batch_stats_python(
+    norms: List[Dict[str, float] | None], weights: Sequence[float]
+) -> tuple[Dict[str, float], Dict[str, float]] | None:
+    pairs = [(norm, weight) for norm, weight in zip(norms, weights) if norm is not None]
+    if not pairs:
+        return None
+    valid_norms = [norm for norm, _ in pairs]
+    valid_weights = [weight for _, weight in pairs]
+    mean: Dict[str, float] = {}
+    sigma: Dict[str, float] = {}
+    for dim in DIMENSIONS:
+        values = [norm[dim] for norm in valid_norms]
+        mean[dim] = weighted_mean(values, valid_weights)
+        sigma[dim] = weighted_sigma(values, valid_weights)
+    return mean, sigma
+
+
+def score_norms(
+    matrix: Sequence[Sequence[int]],
+    question_ids: Sequence[int],
+    question_lookup: Mapping[int, tuple[str, int]] | QuestionIndex,
+) -> List[Dict[str, float] | None]:
+    """Per-rater norms for a raters x questions matrix, without statistics.
+
+    Same layout and rejection rules as :func:`score_batch`; for callers that
+    fold the norms into their own running sums.
+    """
+
+    return _batch_norms_python(matrix, _column_projection(question_ids, question_lookup))
+
+
+def score_batch(
+    matrix: Sequence[Sequence[int]],
+    question_ids: Sequence[int],
+    question_lookup: Mapping[int, tuple[str, int]] | QuestionIndex,
+    weights: Sequence[float],
+    self_norm: Dict[str, float] | None = None,
+) -> BatchScores:
+    """Score many raters in one pass.
+
+    ``matrix`` is raters x questions with ``0`` for unanswered cells; column
+    ``j`` holds answers to ``question_ids[j]``.  Per-rater norms match
+    :func:`compute_norms`, the weighted mean and sigma match
+    :func:`compute_gap_metrics`.
+    """
+
+    if len(weights) != len(matrix):
+        raise ScoringError("One weight per rater required")
+
+    norms = score_norms(matrix, question_ids, question_lookup)
+    stats = _batch_stats_python(norms, weights)
+
+    if stats is None:
+        return BatchScores(norms, None, None, None, None)
+
+    other_norm, sigma = stats
+    gap = gap_score = None
+    if self_norm is not None:
+        gap = {dim: other_norm[dim] - self_norm[dim] for dim in DIMENSIONS}
+        gap_score = fmean(abs(gap[dim]) for dim in DIMENSIONS) * 100
+    return BatchScores(norms, other_norm, sigma, gap, gap_score)
+
+
 def norms_to_mbti(norms: Dict[str, float]) -> str:
     letters: List[str] = []
     for dim in ("EI", "SN", "TF", "JP"):
@@ -52,3 +52,16 @@ def _load_allowed_hosts() -> list[str]:
 
 
 ALLOWED_HOSTS = _load_allowed_hosts()
+
+# How owner-facing reads treat ``relation_aggregates``:
+#   "dirty"  - recompute once when the session is flagged dirty, else read rows
+#   "stored" - always serve the persisted rows; only submits recompute
+RELATION_AGGREGATE_MODES = ("dirty", "stored")
+
+
+def _load_relation_aggregate_consistency() -> str:
+    value = os.getenv("RELATION_AGGREGATE_CONSISTENCY", "dirty").strip().lower()
+    return value if value in RELATION_AGGREGATE_MODES else "dirty"
+
+
+RELATION_AGGREGATE_CONSISTENCY = _load_relation_aggregate_consistency()
@@ -0,0 +1,38 @@
+"""The one Jinja environment shared by ``app.main`` and the HTML routers.
+
+A single instance means one loader and one compiled-template cache for the
+whole process instead of one per router module.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from fastapi.templating import Jinja2Templates
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
+
+def _escape_js(value: object) -> str:
+    if value is None:
+        return ""
+    text = str(value)
+    replacements = {
+        "\\": "\\\\",
+        "\n": "\\n",
+        "\r": "\\r",
+        "\t": "\\t",
+        "'": "\\'",
+        '"': '\\"',
+        "</": "<" + "\\/",
+        "\u2028": "\\u2028",
+        "\u2029": "\\u2029",
+    }
+    for search, replacement in replacements.items():
+        text = text.replace(search, replacement)
+    return text
+
+
+templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+templates.env.filters.setdefault("escapejs", _escape_js)
+
+__all__ = ["TEMPLATE_DIR", "templates"]
@@ -0,0 +1,229 @@
+"""Connection pool settings and metrics shared by both database engines.
+
+Pool sizing comes from ``<PREFIX>_POOL_SIZE``, ``<PREFIX>_MAX_OVERFLOW``,
+``<PREFIX>_POOL_TIMEOUT``, ``<PREFIX>_POOL_RECYCLE`` and
+``<PREFIX>_POOL_PRE_PING``.  Unset variables keep SQLAlchemy's defaults.
+:func:`instrument_engine` attaches pool listeners whose counters are rendered
+by :func:`render_prometheus` for the ``/metrics`` endpoint.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds (seconds) of the checkout wait histogram.
+WAIT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+_TRUE = {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str) -> int | None:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return None
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise ValueError(f"{name} must be an integer, got {raw!r}") from exc
+
+
+def pool_options(prefix: str, *, pre_ping_default: bool = False) -> Dict[str, object]:
+    """``create_engine`` keyword arguments read from ``<prefix>_*`` variables."""
+
+    options: Dict[str, object] = {
+        "pool_pre_ping": os.getenv(
+            f"{prefix}_POOL_PRE_PING", "1" if pre_ping_default else "0"
+        ).strip().lower()
+        in _TRUE
+    }
+    for env_name, key in (
+        ("POOL_SIZE", "pool_size"),
+        ("MAX_OVERFLOW", "max_overflow"),
+        ("POOL_TIMEOUT", "pool_timeout"),
+        ("POOL_RECYCLE", "pool_recycle"),
+    ):
+        value = _env_int(f"{prefix}_{env_name}")
+        if value is not None:
+            options[key] = value
+    return options
+
+
+class PoolMetrics:
+    """Counters for one engine's pool, updated from pool events."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.peak_checked_out = 0
+        self.wait_count = 0
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+        self.wait_buckets: List[int] = [0] * len(WAIT_BUCKETS)
+        self._checked_out = 0
+        self.pool = None
+
+    def record_wait(self, seconds: float, *, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            self.wait_count += 1
+            self.wait_sum += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            index = bisect_left(WAIT_BUCKETS, seconds)
+            if index < len(self.wait_buckets):
+                self.wait_buckets[index] += 1
+
+    def _on_checkout(self, *_args) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self._checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self._checked_out)
+
+    def _on_checkin(self, *_args) -> None:
+        with self._lock:
+            self._checked_out = max(0, self._checked_out - 1)
+
+    def _on_connect(self, *_args) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_invalidate(self, *_args) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        pool = self.pool
+        with self._lock:
+            data: Dict[str, object] = {
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "checked_out": self._checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "wait_count": self.wait_count,
+                "wait_sum": self.wait_sum,
+                "wait_max": self.wait_max,
+                "wait_buckets": list(self.wait_buckets),
+            }
+        if isinstance(pool, QueuePool):
+            data["size"] = pool.size()
+            data["overflow"] = max(0, pool.overflow())
+            data["checked_in"] = pool.checkedin()
+        return data
+
+
+class InstrumentedQueuePool(QueuePool):
+    """``QueuePool`` that times how long each checkout waits for a connection."""
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
+
+
+_REGISTRY: Dict[str, PoolMetrics] = {}
+
+
+def instrument_engine(name: str, engine: Engine) -> PoolMetrics:
+    """Attach pool listeners to ``engine`` and register its metrics as ``name``."""
+
+    metrics = PoolMetrics(name)
+    metrics.pool = engine.pool
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.metrics = metrics
+    event.listen(engine, "checkout", metrics._on_checkout)
+    event.listen(engine, "checkin", metrics._on_checkin)
+    event.listen(engine, "connect", metrics._on_connect)
+    event.listen(engine, "invalidate", metrics._on_invalidate)
+    _REGISTRY[name] = metrics
+    return metrics
+
+
+def registered_pools() -> Dict[str, PoolMetrics]:
+    return dict(_REGISTRY)
+
+
+def _format(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus() -> str:
+    """Prometheus text exposition of every registered pool."""
+
+    gauges = (
+        ("db_pool_size", "size", "Configured pool size"),
+        ("db_pool_checked_out", "checked_out", "Connections currently checked out"),
+        ("db_pool_checked_in", "checked_in", "Idle connections held by the pool"),
+        ("db_pool_overflow", "overflow", "Connections open beyond pool_size"),
+        ("db_pool_peak_checked_out", "peak_checked_out", "Most connections checked out at once"),
+    )
+    counters = (
+        ("db_pool_checkouts_total", "checkouts", "Connection checkouts"),
+        ("db_pool_connects_total", "connects", "New DBAPI connections opened"),
+        ("db_pool_invalidations_total", "invalidations", "Connections invalidated"),
+        ("db_pool_timeouts_total", "timeouts", "Checkouts that hit pool_timeout"),
+    )
+    snapshots = {name: metrics.snapshot() for name, metrics in sorted(_REGISTRY.items())}
+    lines: List[str] = []
+
+    for metric, key, help_text in gauges + counters:
+        kind = "counter" if metric.endswith("_total") else "gauge"
+        rows = [(name, data[key]) for name, data in snapshots.items() if key in data]
+        if not rows:
+            continue
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.extend(f'{metric}{{engine="{name}"}} {_format(value)}' for name, value in rows)
+
+    metric = "db_pool_checkout_wait_seconds"
+    lines.append(f"# HELP {metric} Time spent waiting for a pooled connection")
+    lines.append(f"# TYPE {metric} histogram")
+    for name, data in snapshots.items():
+        cumulative = 0
+        for bound, count in zip(WAIT_BUCKETS, data["wait_buckets"]):
+            cumulative += count
+            lines.append(f'{metric}_bucket{{engine="{name}",le="{bound}"}} {cumulative}')
+        lines.append(f'{metric}_bucket{{engine="{name}",le="+Inf"}} {data["wait_count"]}')
+        lines.append(f'{metric}_sum{{engine="{name}"}} {_format(data["wait_sum"])}')
+        lines.append(f'{metric}_count{{engine="{name}"}} {data["wait_count"]}')
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "InstrumentedQueuePool",
+    "PoolMetrics",
+    "WAIT_BUCKETS",
+    "instrument_engine",
+    "pool_options",
+    "registered_pools",
+    "render_prometheus",
+]
@@ -0,0 +1,124 @@
+"""Per-connection SQLite pragma profiles.
+
+SQLite settings such as ``busy_timeout`` and ``synchronous`` live on the
+connection, not in the database file, so they are applied from a ``connect``
+event on every pooled DBAPI connection.  ``SQLITE_PRAGMA_PROFILE`` picks the
+profile and ``SQLITE_PRAGMAS`` (``name=value`` pairs separated by commas)
+overrides individual entries.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from typing import Dict, Mapping
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+log = logging.getLogger("perception_gap.database")
+
+PRAGMA_PROFILES: Dict[str, Dict[str, str]] = {
+    # Concurrent uvicorn workers: readers never wait on the writer and
+    # writers queue on the busy timeout instead of failing immediately.
+    "production": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": "5000",
+        "cache_size": "-20000",
+        "mmap_size": "268435456",
+        "temp_store": "MEMORY",
+    },
+    # SQLite defaults apart from a busy timeout.
+    "default": {"busy_timeout": "5000"},
+    "off": {},
+}
+
+DEFAULT_PROFILE = "production"
+
+# journal_mode is persisted in the file and must be set before the others.
+_ORDER = ("journal_mode",)
+
+
+def _parse_overrides(raw: str) -> Dict[str, str]:
+    overrides: Dict[str, str] = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        name, sep, value = item.partition("=")
+        name, value = name.strip().lower(), value.strip()
+        if not sep or not name.isidentifier() or not value:
+            raise ValueError(f"Invalid SQLite pragma override: {item.strip()!r}")
+        overrides[name] = value
+    return overrides
+
+
+def resolve_pragmas(
+    profile: str | None = None, overrides: str | None = None
+) -> Dict[str, str]:
+    """Return the pragma mapping for ``profile`` with ``overrides`` applied."""
+
+    name = (profile or os.getenv("SQLITE_PRAGMA_PROFILE") or DEFAULT_PROFILE).strip().lower()
+    if name not in PRAGMA_PROFILES:
+        raise ValueError(
+            f"Unknown SQLite pragma profile {name!r}; expected one of {sorted(PRAGMA_PROFILES)}"
+        )
+    pragmas = dict(PRAGMA_PROFILES[name])
+    if overrides is None:
+        overrides = os.getenv("SQLITE_PRAGMAS", "")
+    pragmas.update(_parse_overrides(overrides))
+    return pragmas
+
+
+def _statements(pragmas: Mapping[str, str]) -> list[str]:
+    names = sorted(pragmas, key=lambda key: (key not in _ORDER, key))
+    return [f"PRAGMA {name}={pragmas[name]}" for name in names]
+
+
+def install_sqlite_pragmas(
+    engine: Engine, profile: str | None = None, overrides: str | None = None
+) -> Dict[str, str]:
+    """Apply the pragma profile to every new connection of a SQLite ``engine``.
+
+    In-memory databases cannot use WAL, so ``journal_mode`` is skipped there.
+    Returns the pragmas that will be applied.
+    """
+
+    if engine.dialect.name != "sqlite":
+        return {}
+
+    pragmas = resolve_pragmas(profile, overrides)
+    if engine.url.database in (None, "", ":memory:"):
+        pragmas.pop("journal_mode", None)
+        pragmas.pop("mmap_size", None)
+    statements = _statements(pragmas)
+    if not statements:
+        return pragmas
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, _record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    log.debug("SQLite pragmas installed", extra={"pragmas": pragmas})
+    return pragmas
+
+
+def journal_mode(connection) -> str | None:
+    """Active journal mode of a SQLAlchemy ``connection`` (``None`` off SQLite)."""
+
+    if connection.dialect.name != "sqlite":
+        return None
+    return str(connection.exec_driver_sql("PRAGMA journal_mode").scalar()).lower()
+
+
+__all__ = [
+    "DEFAULT_PROFILE",
+    "PRAGMA_PROFILES",
+    "install_sqlite_pragmas",
+    "journal_mode",
+    "resolve_pragmas",
+]
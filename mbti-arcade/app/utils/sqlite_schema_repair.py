@@ -4,6 +4,32 @@ import sqlite3
 from pathlib import Path
 from urllib.parse import unquote
 
+AGGREGATE_RUNNING_SUM_COLUMNS = (
+    "weight_total",
+    "ei_wsum",
+    "sn_wsum",
+    "tf_wsum",
+    "jp_wsum",
+    "ei_wsq",
+    "sn_wsq",
+    "tf_wsq",
+    "jp_wsq",
+)
+
+# (index name, table, columns) added after the tables first shipped.
+HOT_PATH_INDEXES = (
+    ("ix_participants_session_submitted", "participants", ("session_id", "answers_submitted_at")),
+    ("ix_responses_other_participant_id", "responses_other", ("participant_id",)),
+    ("ix_audit_events_session_created", "audit_events", ("session_id", "created_at", "id")),
+    (
+        "ix_couple_responses_session_participant_kind",
+        "couple_responses",
+        ("session_id", "participant_id", "kind"),
+    ),
+)
+
+DECISION_PACKET_KEY = ("session_id", "packet_sha256")
+
 
 def _get_columns(conn: sqlite3.Connection, table: str) -> set[str]:
     rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
@@ -26,6 +52,79 @@ def _maybe_add_column(
     return True
 
 
+def _maybe_create_index(
+    conn: sqlite3.Connection,
+    name: str,
+    table: str,
+    columns: tuple[str, ...],
+    unique: bool = False,
+) -> bool:
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='index' AND name=?", (name,)
+    ).fetchone()
+    if exists:
+        return False
+
+    kind = "UNIQUE INDEX" if unique else "INDEX"
+    conn.execute(f"CREATE {kind} {name} ON {table} ({', '.join(columns)})")
+    return True
+
+
+def _has_unique_key(conn: sqlite3.Connection, table: str, columns: tuple[str, ...]) -> bool:
+    # Tables built by create_all carry the constraint as an unnamed autoindex.
+    for _, name, unique, *_ in conn.execute(f"PRAGMA index_list({table})").fetchall():
+        if unique and tuple(
+            row[2] for row in conn.execute(f"PRAGMA index_info({name})").fetchall()
+        ) == columns:
+            return True
+    return False
+
+
+def _ensure_unique_decision_packets(conn: sqlite3.Connection) -> bool:
+    if _has_unique_key(conn, "decision_packets", DECISION_PACKET_KEY):
+        return False
+    conn.execute(
+        """
+        DELETE FROM decision_packets WHERE id NOT IN (
+            SELECT MIN(id) FROM decision_packets GROUP BY session_id, packet_sha256
+        )
+        """
+    )
+    return _maybe_create_index(
+        conn, "uq_decision_packet_sha", "decision_packets", DECISION_PACKET_KEY, unique=True
+    )
+
+
+def _backfill_respondent_counters(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        UPDATE sessions SET
+            respondent_count = (
+                SELECT COUNT(*) FROM participants
+                WHERE participants.session_id = sessions.id
+                  AND participants.answers_submitted_at IS NOT NULL
+            ),
+            last_submitted_at = (
+                SELECT MAX(answers_submitted_at) FROM participants
+                WHERE participants.session_id = sessions.id
+            )
+        """
+    )
+
+
+def _backfill_audit_chain_heads(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        UPDATE couple_sessions SET last_audit_hash = (
+            SELECT hash FROM audit_events
+            WHERE audit_events.session_id = couple_sessions.id
+            ORDER BY created_at DESC, id DESC
+            LIMIT 1
+        )
+        """
+    )
+
+
 def _sqlite_raw_path(database_url: str) -> str | None:
     for prefix in ("sqlite+pysqlite:///", "sqlite:///"):
         if database_url.startswith(prefix):
@@ -36,6 +135,15 @@ def _sqlite_raw_path(database_url: str) -> str | None:
     return None
 
 
+def sqlite_file_path(database_url: str) -> Path | None:
+    """The file an engine for ``database_url`` opens, or ``None`` if not a SQLite file."""
+
+    raw = _sqlite_raw_path(database_url)
+    if not raw:
+        return None
+    return (Path.cwd() / raw).resolve()
+
+
 def _candidate_paths(raw_path: str) -> list[Path]:
     path = Path(raw_path)
     if path.is_absolute():
@@ -79,6 +187,52 @@ def repair_sqlite_file(db_path: Path) -> dict[str, bool]:
                 column="owner_token_hash",
                 ddl_type="VARCHAR(64)",
             )
+            changed["sessions.responses_version"] = _maybe_add_column(
+                conn,
+                table="sessions",
+                column="responses_version",
+                ddl_type="INTEGER NOT NULL",
+                default_clause="0",
+            )
+            # Existing rows were only refreshed on read; recompute them once.
+            changed["sessions.relations_dirty"] = _maybe_add_column(
+                conn,
+                table="sessions",
+                column="relations_dirty",
+                ddl_type="BOOLEAN NOT NULL",
+                default_clause="1",
+            )
+            added_count = _maybe_add_column(
+                conn,
+                table="sessions",
+                column="respondent_count",
+                ddl_type="INTEGER NOT NULL",
+                default_clause="0",
+            )
+            changed["sessions.respondent_count"] = added_count
+            changed["sessions.last_submitted_at"] = _maybe_add_column(
+                conn,
+                table="sessions",
+                column="last_submitted_at",
+                ddl_type="DATETIME",
+            )
+            if added_count and "participants" in tables:
+                _backfill_respondent_counters(conn)
+
+        if "aggregates" in tables:
+            changed["aggregates.version"] = _maybe_add_column(
+                conn,
+                table="aggregates",
+                column="version",
+                ddl_type="INTEGER",
+            )
+            for column in AGGREGATE_RUNNING_SUM_COLUMNS:
+                changed[f"aggregates.{column}"] = _maybe_add_column(
+                    conn,
+                    table="aggregates",
+                    column=column,
+                    ddl_type="FLOAT",
+                )
 
         if "pair" in tables:
             changed["pair.my_avatar"] = _maybe_add_column(
@@ -102,6 +256,57 @@ def repair_sqlite_file(db_path: Path) -> dict[str, bool]:
                 default_clause="1",
             )
 
+        if "couple_sessions" in tables:
+            added_head = _maybe_add_column(
+                conn,
+                table="couple_sessions",
+                column="last_audit_hash",
+                ddl_type="VARCHAR(64)",
+            )
+            changed["couple_sessions.last_audit_hash"] = added_head
+            if added_head and "audit_events" in tables:
+                _backfill_audit_chain_heads(conn)
+            changed["couple_sessions.responses_fingerprint"] = _maybe_add_column(
+                conn,
+                table="couple_sessions",
+                column="responses_fingerprint",
+                ddl_type="VARCHAR(64)",
+            )
+
+        if "audit_events" in tables:
+            changed["audit_events.digest_version"] = _maybe_add_column(
+                conn,
+                table="audit_events",
+                column="digest_version",
+                ddl_type="INTEGER",
+            )
+
+        if "couple_participants" in tables:
+            changed["couple_participants.answers_fingerprint"] = _maybe_add_column(
+                conn,
+                table="couple_participants",
+                column="answers_fingerprint",
+                ddl_type="VARCHAR(64)",
+            )
+
+        if "couple_results" in tables:
+            for column in ("input_fingerprint", "packet_sha256"):
+                changed[f"couple_results.{column}"] = _maybe_add_column(
+                    conn,
+                    table="couple_results",
+                    column=column,
+                    ddl_type="VARCHAR(64)",
+                )
+
+        if "decision_packets" in tables:
+            changed["decision_packets.uq_decision_packet_sha"] = _ensure_unique_decision_packets(
+                conn
+            )
+
+        for name, table, columns in HOT_PATH_INDEXES:
+            if table in tables:
+                changed[f"index.{name}"] = _maybe_create_index(conn, name, table, columns)
+
         conn.commit()
         return changed
 
@@ -0,0 +1,128 @@
+"""On-disk proof that startup schema repair and seeding already ran.
+
+Startup repairs the SQLite files, runs ``create_all`` and seeds the question
+table.  After a full pass the app writes a JSON marker next to the main
+database recording the model schema, the questionnaire file and the identity
+of each database file.  While all three still match, a restart can skip the
+work.  ``FAST_START=0`` always takes the full path; ``STARTUP_MARKER_PATH``
+moves the marker file.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Sequence
+
+from sqlalchemy import MetaData
+
+from app.data.questionnaire_loader import get_questionnaire_file_digest
+from app.utils.sqlite_schema_repair import sqlite_file_path
+
+MARKER_VERSION = 1
+MARKER_SUFFIX = ".startup.json"
+
+log = logging.getLogger("perception_gap.startup")
+
+
+def fast_start_enabled() -> bool:
+    return os.getenv("FAST_START", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def marker_path(database_url: str) -> Path | None:
+    override = os.getenv("STARTUP_MARKER_PATH", "").strip()
+    if override:
+        return Path(override).expanduser()
+    db_path = sqlite_file_path(database_url)
+    if db_path is None:
+        return None
+    return db_path.with_name(db_path.name + MARKER_SUFFIX)
+
+
+def schema_fingerprint(metadatas: Iterable[MetaData]) -> str:
+    """Hash of every table, column and index the models declare."""
+
+    entries = []
+    for metadata in metadatas:
+        for table in metadata.sorted_tables:
+            columns = sorted(
+                (column.name, str(column.type), column.nullable) for column in table.columns
+            )
+            indexes = sorted(
+                (index.name or "", tuple(column.name for column in index.columns))
+                for index in table.indexes
+            )
+            entries.append((table.name, columns, indexes))
+    encoded = json.dumps(sorted(entries), separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _database_identity(path: Path) -> Dict[str, int] | None:
+    # The schema cookie changes on every CREATE/ALTER/DROP, so a file that was
+    # recreated or migrated since the marker was written no longer matches.
+    try:
+        stat = path.stat()
+        with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as conn:
+            (schema_version,) = conn.execute("PRAGMA schema_version").fetchone()
+    except (OSError, sqlite3.Error):
+        return None
+    return {"inode": stat.st_ino, "schema_version": schema_version}
+
+
+def startup_state(
+    database_urls: Sequence[str], metadatas: Iterable[MetaData]
+) -> Dict[str, object] | None:
+    """What a marker for the current code and databases would record.
+
+    ``None`` when a database is not an existing SQLite file, since there is
+    nothing on disk to vouch for.
+    """
+
+    databases: Dict[str, Dict[str, int]] = {}
+    for url in dict.fromkeys(database_urls):
+        path = sqlite_file_path(url)
+        identity = _database_identity(path) if path is not None else None
+        if identity is None:
+            return None
+        databases[str(path)] = identity
+    return {
+        "version": MARKER_VERSION,
+        "schema": schema_fingerprint(metadatas),
+        "questionnaire": get_questionnaire_file_digest(),
+        "databases": databases,
+    }
+
+
+def marker_is_current(path: Path, state: Dict[str, object] | None) -> bool:
+    if state is None:
+        return False
+    try:
+        recorded = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return recorded == state
+
+
+def write_marker(path: Path, state: Dict[str, object] | None) -> None:
+    if state is None:
+        return
+    temp = path.with_name(path.name + ".tmp")
+    try:
+        temp.write_text(json.dumps(state, sort_keys=True), encoding="utf-8")
+        os.replace(temp, path)
+    except OSError as exc:
+        # A read-only volume only costs the fast path on the next start.
+        log.warning("Startup marker write failed", extra={"path": str(path), "error": str(exc)})
+
+
+__all__ = [
+    "fast_start_enabled",
+    "marker_is_current",
+    "marker_path",
+    "schema_fingerprint",
+    "startup_state",
+    "write_marker",
+]
@@ -6,24 +6,23 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List
 
-from sqlalchemy.orm import Session
-
 from app.data.loader import seed_questions
+from app.data.question_index import get_question_index
 from app.database import SessionLocal
 from app.models import (
     OtherResponse,
     Participant,
-    ParticipantAnswer,
     ParticipantRelation,
-    Question,
     Session as SessionModel,
 )
 from app.services.aggregator import (
-    build_question_lookup,
     group_other_responses,
+    mark_responses_changed,
     recalculate_aggregate,
     recalculate_relation_aggregates,
+    record_participant_submission,
 )
+from app.services.answer_store import replace_participant_answers
 from app.services.scoring import ScoringError, compute_norms, norms_to_mbti
 
 LOG_PATH = Path(__file__).resolve().parents[1] / "logs" / "backfill_participants.log"
@@ -43,18 +42,10 @@ def _normalize_relation(tag: str | None) -> ParticipantRelation:
         return RELATION_DEFAULT
 
 
-def _participant_rater_hash(participant_id: int) -> str:
-    return f"participant:{participant_id}"
-
 def _participant_answers(rows: Iterable[OtherResponse]) -> List[tuple[int, int]]:
     return [(row.question_id, row.value) for row in rows]
 
 
-def _load_questions(db: Session) -> Dict[int, tuple[str, int]]:
-    questions = db.query(Question).all()
-    return build_question_lookup(questions)
-
-
 def backfill_participants(dry_run: bool = False) -> Dict[str, int]:
     summary = {
         "sessions_processed": 0,
@@ -67,7 +58,7 @@ def backfill_participants(dry_run: bool = False) -> Dict[str, int]:
     db = SessionLocal()
     try:
         seed_questions(db)
-        lookup = _load_questions(db)
+        lookup = get_question_index(db)
 
         sessions = db.query(SessionModel).all()
         for session in sessions:
@@ -100,24 +91,16 @@ def backfill_participants(dry_run: bool = False) -> Dict[str, int]:
                     db.flush()
                     summary["participants_created"] += 1
 
-                for row in rows:
-                    row.participant_id = participant.id
-
-                db.query(ParticipantAnswer).filter(
-                    ParticipantAnswer.participant_id == participant.id
-                ).delete()
-
-                for row in rows:
-                    db.add(
-                        ParticipantAnswer(
-                            participant_id=participant.id,
-                            question_id=row.question_id,
-                            value=row.value,
-                        )
-                    )
-                    summary["answers_copied"] += 1
-
                 answers = _participant_answers(rows)
+                summary["answers_copied"] += replace_participant_answers(
+                    db, participant.id, answers
+                )
+                # participant_answers is now the only copy the aggregate reads.
+                db.query(OtherResponse).filter(
+                    OtherResponse.session_id == session.id,
+                    OtherResponse.rater_hash == rater_hash,
+                ).delete(synchronize_session=False)
+
                 try:
                     norms = compute_norms(answers, lookup)
                 except ScoringError:
@@ -128,18 +111,13 @@ def backfill_participants(dry_run: bool = False) -> Dict[str, int]:
                 latest_ts = max((row.created_at for row in rows if row.created_at), default=None)
                 if latest_ts is None:
                     latest_ts = datetime.now(timezone.utc)
-                participant.answers_submitted_at = latest_ts
+                # Converted raters now count through the session's respondent
+                # counter; flush so each increment lands before the next one.
+                record_participant_submission(session, participant, latest_ts)
                 participant.computed_at = datetime.now(timezone.utc)
+                db.flush()
 
-                new_rater_hash = _participant_rater_hash(participant.id)
-                if rater_hash != new_rater_hash:
-                    db.query(OtherResponse).filter(
-                        OtherResponse.session_id == session.id,
-                        OtherResponse.rater_hash == new_rater_hash,
-                    ).delete()
-                    for row in rows:
-                        row.rater_hash = new_rater_hash
-
+            mark_responses_changed(db, session)
             try:
                 recalculate_aggregate(db, session)
             except ScoringError:
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from statistics import median
+from typing import Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import (
+    OtherResponse,
+    Participant,
+    ParticipantAnswer,
+    ParticipantRelation,
+    Question,
+)
+from app.services.answer_store import replace_participant_answers, replace_rater_answers
+from scripts.benchmark_result_reads import (
+    INVITE_TOKEN,
+    SESSION_ID,
+    _percentile,
+    prepare_database,
+)
+
+DEFAULT_SIZES = (20, 48, 96)
+RATER_HASH = "participant:bench"
+
+
+def _write_per_row(db, participant_id: int, answers: List[tuple[int, int]]) -> None:
+    """Previous shape: one ORM object per answer and table, then a flush."""
+
+    db.query(ParticipantAnswer).filter(
+        ParticipantAnswer.participant_id == participant_id
+    ).delete()
+    db.query(OtherResponse).filter(
+        OtherResponse.session_id == SESSION_ID,
+        OtherResponse.rater_hash == RATER_HASH,
+    ).delete()
+    for question_id, value in answers:
+        db.add(
+            ParticipantAnswer(participant_id=participant_id, question_id=question_id, value=value)
+        )
+        db.add(
+            OtherResponse(
+                session_id=SESSION_ID,
+                rater_hash=RATER_HASH,
+                participant_id=participant_id,
+                question_id=question_id,
+                value=value,
+                relation_tag="friend",
+            )
+        )
+    db.flush()
+
+
+def _write_bulk(db, participant_id: int, answers: List[tuple[int, int]]) -> None:
+    """Bulk writes that still copy every answer into responses_other."""
+
+    replace_participant_answers(db, participant_id, answers)
+    replace_rater_answers(
+        db,
+        SESSION_ID,
+        RATER_HASH,
+        answers,
+        relation_tag="friend",
+        participant_id=participant_id,
+    )
+
+
+def _write_single_copy(db, participant_id: int, answers: List[tuple[int, int]]) -> None:
+    """Current shape: participant_answers is the only copy."""
+
+    replace_participant_answers(db, participant_id, answers)
+
+
+WRITERS = {"per_row": _write_per_row, "bulk": _write_bulk, "single_copy": _write_single_copy}
+
+
+def run_size(
+    factory: sessionmaker, participant_id: int, question_ids: List[int], size: int, iterations: int
+) -> Dict[str, Dict[str, float]]:
+    rng = random.Random(size)
+    ids = question_ids[:size]
+    results: Dict[str, Dict[str, float]] = {}
+    for name, writer in WRITERS.items():
+        latencies: List[float] = []
+        for _ in range(iterations):
+            answers = [(question_id, rng.randint(1, 5)) for question_id in ids]
+            started = time.perf_counter()
+            with factory() as db:
+                writer(db, participant_id, answers)
+                db.commit()
+            latencies.append((time.perf_counter() - started) * 1000)
+        results[name] = {
+            "p50_ms": round(median(latencies), 3),
+            "p99_ms": round(_percentile(latencies, 0.99), 3),
+        }
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Answer submit write latency: per-row ORM adds vs bulk delete+insert"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="Answers per submission (the couple flow writes 96)",
+    )
+    parser.add_argument("--iterations", type=int, default=200, help="Submissions per variant")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    summary: Dict[str, Dict[str, Dict[str, float]]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        factory = prepare_database(Path(tmp) / "bench.db", raters=0)
+        with factory() as db:
+            question_ids = list(db.scalars(select(Question.id).order_by(Question.id)))
+            participant = Participant(
+                session_id=SESSION_ID,
+                invite_token=INVITE_TOKEN,
+                relation=ParticipantRelation.FRIEND,
+            )
+            db.add(participant)
+            db.commit()
+            participant_id = participant.id
+        if max(args.sizes) > len(question_ids):
+            raise SystemExit(f"Only {len(question_ids)} seeded questions are available")
+        for size in args.sizes:
+            summary[str(size)] = run_size(
+                factory, participant_id, question_ids, size, args.iterations
+            )
+        factory.kw["bind"].dispose()
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Callable, Dict, List
+
+from app.data.question_index import get_question_index
+from app.data.questions import questions_for_mode
+from app.schemas import DIMENSIONS
+from app.services.scoring import (
+    ScoringError,
+    compute_gap_metrics,
+    compute_norms,
+    score_batch,
+)
+
+DEFAULT_SIZES = (50, 500, 5000)
+
+
+def _build_inputs(raters: int, mode: str, seed: int):
+    rng = random.Random(seed)
+    question_ids = [int(item["id"]) for item in questions_for_mode(mode)]
+    matrix = [[rng.randint(1, 5) for _ in question_ids] for _ in range(raters)]
+    weights = [rng.choice((1.0, 1.1, 1.2, 1.5)) for _ in range(raters)]
+    self_norm = {dim: rng.uniform(-1, 1) for dim in DIMENSIONS}
+    return question_ids, matrix, weights, self_norm
+
+
+def _per_rater(question_ids, matrix, weights, self_norm, lookup):
+    norms: List[Dict[str, float]] = []
+    kept: List[float] = []
+    for row, weight in zip(matrix, weights):
+        try:
+            norms.append(compute_norms(list(zip(question_ids, row)), lookup))
+        except ScoringError:
+            continue
+        kept.append(weight)
+    return compute_gap_metrics(self_norm, norms, kept)
+
+
+def _best_of(repeats: int, func: Callable[[], object]) -> tuple[float, object]:
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def run(sizes, mode: str, repeats: int) -> Dict[str, Dict[str, float]]:
+    lookup = get_question_index()
+    summary: Dict[str, Dict[str, float]] = {}
+    for size in sizes:
+        question_ids, matrix, weights, self_norm = _build_inputs(size, mode, seed=size)
+        per_rater_ms, (other, sigma, _, gap_score) = _best_of(
+            repeats, lambda: _per_rater(question_ids, matrix, weights, self_norm, lookup)
+        )
+        entry: Dict[str, float] = {"per_rater_ms": round(per_rater_ms, 3)}
+
+        batch_ms, batch = _best_of(
+            repeats,
+            lambda: score_batch(matrix, question_ids, lookup, weights, self_norm),
+        )
+        entry["batch_ms"] = round(batch_ms, 3)
+        entry["batch_max_abs_diff"] = max(
+            [abs(batch.other_norm[dim] - other[dim]) for dim in DIMENSIONS]
+            + [abs(batch.sigma[dim] - sigma[dim]) for dim in DIMENSIONS]
+            + [abs(batch.gap_score - gap_score) / 100]
+        )
+        summary[str(size)] = entry
+    return summary
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare per-rater compute_norms with batch score_batch"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="Rater counts to benchmark",
+    )
+    parser.add_argument("--mode", default="basic", help="Questionnaire mode to sample")
+    parser.add_argument("--repeats", type=int, default=5, help="Best-of repetitions")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    summary = run(args.sizes, args.mode, args.repeats)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Callable, Dict, List
+
+from app.core_scoring import (
+    COMPILED,
+    QUESTION_TO_SCALE,
+    REV_ITEMS,
+    SCALES,
+    compute_deltas,
+    compute_scale_means,
+    rank_top_delta_items,
+    score_arrays,
+)
+
+DEFAULT_COUPLES = 1000
+
+
+def _random_answers(rng: random.Random) -> Dict[str, int]:
+    return {code: rng.randint(0, 10 if code == "SF1" else 4) for code in QUESTION_TO_SCALE}
+
+
+def _per_item(a_self, a_guess, b_self, b_guess):
+    """Previous shape: per-item code checks, per-scale lists, two delta passes."""
+
+    def score(code: str, value: int) -> float:
+        upper_bound = 10 if code == "SF1" else 4
+        if value < 0 or value > upper_bound:
+            raise ValueError(code)
+        if code in REV_ITEMS:
+            return float(4 - value)
+        if code == "SF1":
+            return float(value) * 0.4
+        return float(value)
+
+    means = [
+        {
+            scale: sum(score(code, answers[code]) for code in codes) / len(codes)
+            for scale, codes in SCALES.items()
+        }
+        for answers in (a_self, a_guess, b_self, b_guess)
+    ]
+    items_a = {code: abs(float(a_guess[code]) - float(b_self[code])) for code in QUESTION_TO_SCALE}
+    items_b = {code: abs(float(b_guess[code]) - float(a_self[code])) for code in QUESTION_TO_SCALE}
+    scales = []
+    for items in (items_a, items_b):
+        per_scale: Dict[str, List[float]] = {scale: [] for scale in SCALES}
+        for code, value in items.items():
+            per_scale[QUESTION_TO_SCALE[code]].append(value)
+        scales.append({scale: sum(values) / len(values) for scale, values in per_scale.items()})
+    return means, scales, rank_top_delta_items(items_a, items_b)
+
+
+def _dict_api(a_self, a_guess, b_self, b_guess):
+    """Public dict helpers, which now pack and delegate to the arrays."""
+
+    means = [compute_scale_means(answers) for answers in (a_self, a_guess, b_self, b_guess)]
+    deltas = compute_deltas(a_self, a_guess, b_self, b_guess)
+    top = rank_top_delta_items(deltas.delta_items_a, deltas.delta_items_b)
+    return means, deltas, top
+
+
+def _packed(a_self, a_guess, b_self, b_guess):
+    """CoupleService shape: pack the four maps once, then one array pass."""
+
+    return score_arrays(*(COMPILED.pack(answers) for answers in (a_self, a_guess, b_self, b_guess)))
+
+
+def _best_of(repeats: int, func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(couples: int, repeats: int) -> Dict[str, float]:
+    rng = random.Random(couples)
+    maps = [[_random_answers(rng) for _ in range(4)] for _ in range(couples)]
+    arrays = [[COMPILED.pack(answers) for answers in couple] for couple in maps]
+
+    variants = {
+        "per_item": lambda: [_per_item(*couple) for couple in maps],
+        "dict_api": lambda: [_dict_api(*couple) for couple in maps],
+        "packed_arrays": lambda: [_packed(*couple) for couple in maps],
+        "arrays": lambda: [score_arrays(*couple) for couple in arrays],
+    }
+    return {
+        f"{name}_us_per_couple": round(_best_of(repeats, func) / couples * 1_000_000, 2)
+        for name, func in variants.items()
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Couple scoring cost: per-item dict rules vs the compiled array engine"
+    )
+    parser.add_argument("--couples", type=int, default=DEFAULT_COUPLES, help="Couples per run")
+    parser.add_argument("--repeats", type=int, default=5, help="Best-of repetitions")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    print(json.dumps(run(args.couples, args.repeats), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
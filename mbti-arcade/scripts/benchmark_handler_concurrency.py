@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import tempfile
+import time
+from pathlib import Path
+from statistics import median
+from typing import Dict, List
+
+import anyio
+from fastapi import FastAPI
+from sqlalchemy import event
+
+from app.database import get_db
+from app.routers.results import fetch_result
+from scripts.benchmark_result_reads import INVITE_TOKEN, _percentile, prepare_database
+
+
+def _blocking_async(handler):
+    """Previous shape: ``async def`` calling the sync Session on the event loop."""
+
+    @functools.wraps(handler)
+    async def endpoint(*args, **kwargs):
+        return handler(*args, **kwargs)
+
+    return endpoint
+
+
+def build_app(factory) -> FastAPI:
+    bench = FastAPI()
+    bench.get("/before/result/{invite_token}")(_blocking_async(fetch_result))
+    bench.get("/after/result/{invite_token}")(fetch_result)
+
+    @bench.get("/ping")
+    async def ping() -> Dict[str, bool]:
+        return {"ok": True}
+
+    def _get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    bench.dependency_overrides[get_db] = _get_db
+    return bench
+
+
+async def _get(app: FastAPI, path: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def run_variant(app: FastAPI, variant: str, concurrency: int, duration: float):
+    latencies: List[float] = []
+    lags: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    path = f"/{variant}/result/{INVITE_TOKEN}"
+
+    async def client() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                status = await _get(app, path)
+            except Exception:
+                # Blocking handlers can exhaust the connection pool: the
+                # waiting checkout holds the loop that would release it.
+                status = None
+            if status != 200:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    async def prober() -> None:
+        # Event-loop lag: how late a 10 ms sleep wakes up, plus a DB-free
+        # request served while the clients are running.
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await anyio.sleep(0.01)
+            await _get(app, "/ping")
+            lags.append((time.perf_counter() - started - 0.01) * 1000)
+
+    async with anyio.create_task_group() as group:
+        for _ in range(concurrency):
+            group.start_soon(client)
+        group.start_soon(prober)
+
+    return {
+        "requests_per_sec": round(len(latencies) / duration, 1),
+        "p50_ms": round(median(latencies), 3) if latencies else 0.0,
+        "p99_ms": round(_percentile(latencies, 0.99), 3),
+        "loop_lag_p99_ms": round(_percentile(lags, 0.99), 3),
+        "errors": errors,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Per-worker concurrency of GET /api/result with blocking vs threadpool handlers"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=12,
+        help="In-flight requests (the default pool holds 15 connections)",
+    )
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per variant")
+    parser.add_argument("--raters", type=int, default=20, help="Raters stored on the session")
+    parser.add_argument(
+        "--db-latency-ms",
+        type=float,
+        default=2.0,
+        help="Simulated network round trip added to every statement",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    summary: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        factory = prepare_database(Path(tmp) / "bench.db", args.raters)
+        engine = factory.kw["bind"]
+        if args.db_latency_ms > 0:
+            delay = args.db_latency_ms / 1000
+
+            @event.listens_for(engine, "before_cursor_execute")
+            def _latency(*_):
+                time.sleep(delay)
+
+        app = build_app(factory)
+        for variant in ("before", "after"):
+            summary[variant] = anyio.run(
+                run_variant, app, variant, args.concurrency, args.duration
+            )
+        engine.dispose()
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from statistics import median
+from types import SimpleNamespace
+from typing import Dict, List
+
+from app.og import renderer
+from app.og.renderer import render_share_card
+
+SLOW_RENDER_MS = 150.0
+MODES = ("basic", "friend", "couple", "work", "partner", "family")
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _fake_card(rng: random.Random, base: datetime):
+    session = SimpleNamespace(
+        id=str(uuid.UUID(int=rng.getrandbits(128))),
+        mode=rng.choice(MODES),
+        updated_at=base - timedelta(minutes=rng.randint(0, 60 * 24 * 30)),
+    )
+    n = rng.randint(0, 40)
+    aggregate = SimpleNamespace(
+        n=n,
+        gap_score=round(rng.uniform(0, 100), 3) if n >= 3 else None,
+    )
+    return session, aggregate
+
+
+def run(cards: int, seed: int) -> Dict[str, float]:
+    rng = random.Random(seed)
+    base = datetime.now(timezone.utc)
+    inputs = [_fake_card(rng, base) for _ in range(cards)]
+
+    durations: List[float] = []
+    total_bytes = 0
+    for session, aggregate in inputs:
+        started = time.perf_counter()
+        image = render_share_card(session, aggregate)
+        durations.append((time.perf_counter() - started) * 1000)
+        total_bytes += len(image)
+
+    return {
+        "cards": cards,
+        "p50_ms": round(median(durations), 3),
+        "p99_ms": round(_percentile(durations, 0.99), 3),
+        "max_ms": round(max(durations), 3),
+        "slow_renders": sum(1 for value in durations if value >= SLOW_RENDER_MS),
+        "avg_png_bytes": round(total_bytes / cards),
+        "encoding": renderer.encoding_tag(),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Render share cards and report latency")
+    parser.add_argument("--cards", type=int, default=1000, help="Number of cards to render")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for card contents")
+    parser.add_argument(
+        "--level",
+        type=int,
+        default=renderer.PNG_COMPRESSION_LEVEL,
+        help="zlib compression level (-1..9)",
+    )
+    parser.add_argument("--palette", action="store_true", help="Emit indexed-palette PNGs")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    renderer.PNG_COMPRESSION_LEVEL = args.level
+    renderer.PNG_PALETTE = args.palette
+    print(json.dumps(run(args.cards, args.seed), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
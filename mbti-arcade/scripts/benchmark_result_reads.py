@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from statistics import median
+from typing import Dict, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.data.loader import seed_questions
+from app.data.questions import questions_for_mode
+from app.database import Base
+from app.models import SelfResponse, Session as SessionModel
+from app.services.aggregator import (
+    apply_rater_answers,
+    load_aggregate,
+    recalculate_aggregate,
+)
+from app.services.answer_store import replace_rater_answers
+
+SESSION_ID = "bench-session"
+INVITE_TOKEN = "bench-token"
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _random_answers(rng: random.Random, question_ids: List[int]) -> List[tuple[int, int]]:
+    return [(question_id, rng.randint(1, 5)) for question_id in question_ids]
+
+
+def _store_rater(db, question_ids, rater_hash: str, rng: random.Random) -> None:
+    answers = _random_answers(rng, question_ids)
+    replace_rater_answers(db, SESSION_ID, rater_hash, answers, relation_tag="friend")
+    session = db.get(SessionModel, SESSION_ID)
+    apply_rater_answers(db, session, rater_hash, answers, "friend")
+
+
+def prepare_database(path: Path, raters: int) -> sessionmaker:
+    engine = create_engine(
+        f"sqlite+pysqlite:///{path}",
+        connect_args={"check_same_thread": False, "timeout": 5},
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+
+    rng = random.Random(42)
+    question_ids = [int(item["id"]) for item in questions_for_mode("basic")]
+    with factory() as db:
+        seed_questions(db)
+        session = SessionModel(
+            id=SESSION_ID,
+            mode="basic",
+            invite_token=INVITE_TOKEN,
+            is_anonymous=True,
+            expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+            max_raters=raters + 10,
+        )
+        db.add(session)
+        db.add_all(
+            SelfResponse(session_id=SESSION_ID, question_id=question_id, value=value)
+            for question_id, value in _random_answers(rng, question_ids)
+        )
+        db.flush()
+        recalculate_aggregate(db, session)
+        for index in range(raters):
+            _store_rater(db, question_ids, f"rater-{index}", rng)
+        db.commit()
+    return factory
+
+
+def _read_once(factory: sessionmaker, mode: str) -> None:
+    with factory() as db:
+        session = (
+            db.query(SessionModel)
+            .filter(SessionModel.invite_token == INVITE_TOKEN)
+            .first()
+        )
+        if mode == "recompute":
+            # Previous behaviour: rebuild and commit on every GET.
+            recalculate_aggregate(db, session)
+            db.commit()
+            return
+        _, rebuilt = load_aggregate(db, session)
+        if rebuilt:
+            db.commit()
+
+
+def run_mode(
+    factory: sessionmaker,
+    mode: str,
+    readers: int,
+    duration: float,
+    write_interval: float,
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = {"locked": 0}
+    lock = threading.Lock()
+    stop = threading.Event()
+    question_ids = [int(item["id"]) for item in questions_for_mode("basic")]
+
+    def reader() -> None:
+        local: List[float] = []
+        locked = 0
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                _read_once(factory, mode)
+            except OperationalError:
+                locked += 1
+                continue
+            local.append((time.perf_counter() - started) * 1000)
+        with lock:
+            latencies.extend(local)
+            errors["locked"] += locked
+
+    def writer() -> None:
+        rng = random.Random(7)
+        index = 0
+        while not stop.wait(write_interval):
+            try:
+                with factory() as db:
+                    _store_rater(db, question_ids, f"writer-{index % 5}", rng)
+                    db.commit()
+            except OperationalError:
+                with lock:
+                    errors["locked"] += 1
+            index += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    if write_interval > 0:
+        threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {
+        "reads": len(latencies),
+        "reads_per_sec": round(len(latencies) / duration, 1),
+        "p50_ms": round(median(latencies), 3) if latencies else 0.0,
+        "p99_ms": round(_percentile(latencies, 0.99), 3),
+        "lock_errors": errors["locked"],
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare GET /api/result read paths under concurrent readers"
+    )
+    parser.add_argument("--raters", type=int, default=50, help="Raters stored on the session")
+    parser.add_argument("--readers", type=int, default=8, help="Concurrent reader threads")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per mode")
+    parser.add_argument(
+        "--write-interval",
+        type=float,
+        default=0.25,
+        help="Seconds between background rater submissions (0 disables writes)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    summary: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        factory = prepare_database(Path(tmp) / "bench.db", args.raters)
+        for mode in ("recompute", "read-only"):
+            summary[mode] = run_mode(
+                factory, mode, args.readers, args.duration, args.write_interval
+            )
+        factory.kw["bind"].dispose()
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
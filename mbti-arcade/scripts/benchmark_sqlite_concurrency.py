@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import random
+import tempfile
+import time
+from pathlib import Path
+from statistics import median
+from typing import Dict, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.data.questions import questions_for_mode
+from app.utils.sqlite_pragmas import PRAGMA_PROFILES, install_sqlite_pragmas, journal_mode
+from scripts.benchmark_result_reads import _percentile, _read_once, _store_rater, prepare_database
+
+DEFAULT_PROFILES = ("off", "production")
+
+
+def _worker(args: tuple) -> Dict[str, object]:
+    """One uvicorn-worker stand-in: its own engine and pool, mixed traffic."""
+
+    path, profile, worker_id, duration, write_ratio = args
+    engine = create_engine(
+        f"sqlite+pysqlite:///{path}", connect_args={"check_same_thread": False}
+    )
+    install_sqlite_pragmas(engine, profile=profile, overrides="")
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    question_ids = [int(item["id"]) for item in questions_for_mode("basic")]
+    rng = random.Random(worker_id)
+
+    reads: List[float] = []
+    writes: List[float] = []
+    locked = 0
+    submitted = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        is_write = rng.random() < write_ratio
+        started = time.perf_counter()
+        try:
+            if is_write:
+                with factory() as db:
+                    _store_rater(db, question_ids, f"w{worker_id}-{submitted % 20}", rng)
+                    db.commit()
+                submitted += 1
+            else:
+                _read_once(factory, "read-only")
+        except OperationalError:
+            locked += 1
+            continue
+        (writes if is_write else reads).append((time.perf_counter() - started) * 1000)
+
+    engine.dispose()
+    return {"reads": reads, "writes": writes, "locked": locked}
+
+
+def run_profile(
+    path: Path, profile: str, workers: int, duration: float, write_ratio: float
+) -> Dict[str, float]:
+    context = multiprocessing.get_context("spawn")
+    jobs = [(str(path), profile, index, duration, write_ratio) for index in range(workers)]
+    with context.Pool(workers) as pool:
+        results = pool.map(_worker, jobs)
+
+    reads = [value for result in results for value in result["reads"]]
+    writes = [value for result in results for value in result["writes"]]
+    probe = create_engine(f"sqlite+pysqlite:///{path}")
+    with probe.connect() as connection:
+        mode = journal_mode(connection)
+    probe.dispose()
+    return {
+        "journal_mode": mode,
+        "reads_per_sec": round(len(reads) / duration, 1),
+        "writes_per_sec": round(len(writes) / duration, 1),
+        "read_p50_ms": round(median(reads), 3) if reads else 0.0,
+        "read_p99_ms": round(_percentile(reads, 0.99), 3),
+        "write_p50_ms": round(median(writes), 3) if writes else 0.0,
+        "write_p99_ms": round(_percentile(writes, 0.99), 3),
+        "lock_errors": sum(result["locked"] for result in results),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Mixed submit/read traffic from several worker processes per pragma profile"
+    )
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        choices=sorted(PRAGMA_PROFILES),
+        default=list(DEFAULT_PROFILES),
+        help="Pragma profiles to compare",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes (make prod uses 4)")
+    parser.add_argument("--raters", type=int, default=50, help="Raters stored before the run")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per profile")
+    parser.add_argument(
+        "--write-ratio", type=float, default=0.2, help="Fraction of operations that submit"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    summary: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in args.profiles:
+            # journal_mode is stored in the file, so each profile starts fresh.
+            path = Path(tmp) / f"{profile}.db"
+            prepare_database(path, args.raters).kw["bind"].dispose()
+            summary[profile] = run_profile(
+                path, profile, args.workers, args.duration, args.write_ratio
+            )
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
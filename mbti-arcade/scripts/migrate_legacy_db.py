@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from typing import Dict
+
+from sqlalchemy import create_engine, inspect, select
+from sqlalchemy.engine import Engine
+from sqlmodel import SQLModel
+
+from app.core.models_db import Friend, Pair, Response
+from app.utils.sqlite_schema_repair import repair_sqlite_schema_for_url
+
+# Parents before children so foreign keys hold on the target.
+LEGACY_MODELS = (Friend, Pair, Response)
+DEFAULT_SOURCE = "sqlite:///./mbti.db"
+DEFAULT_TARGET = os.getenv("DATABASE_URL", "sqlite:///./perception_gap.db")
+
+
+def migrate(
+    source: Engine,
+    target: Engine,
+    *,
+    batch_size: int = 500,
+    dry_run: bool = False,
+) -> Dict[str, Dict[str, int]]:
+    """Copy legacy rows from ``source`` into ``target``, skipping existing keys.
+
+    Safe to re-run: rows whose primary key already exists on the target are
+    left untouched.
+    """
+
+    if not dry_run:
+        SQLModel.metadata.create_all(target, tables=[model.__table__ for model in LEGACY_MODELS])
+
+    summary: Dict[str, Dict[str, int]] = {}
+    with source.connect() as src, target.connect() as dst:
+        for model in LEGACY_MODELS:
+            table = model.__table__
+            (key,) = table.primary_key.columns
+            existing = set()
+            if inspect(dst).has_table(table.name):
+                existing = set(dst.execute(select(key)).scalars())
+
+            copied = skipped = 0
+            batch = []
+            # A dry run only needs keys, so unrepaired legacy files work too.
+            query = select(key) if dry_run else select(table)
+            for row in src.execute(query).mappings():
+                if row[key.name] in existing:
+                    skipped += 1
+                    continue
+                batch.append(dict(row))
+                if len(batch) >= batch_size:
+                    copied += _flush(dst, table, batch, dry_run)
+            copied += _flush(dst, table, batch, dry_run)
+            summary[table.name] = {"copied": copied, "skipped": skipped}
+        if not dry_run:
+            dst.commit()
+    return summary
+
+
+def _flush(connection, table, batch, dry_run: bool) -> int:
+    count = len(batch)
+    if batch and not dry_run:
+        connection.execute(table.insert(), batch)
+    batch.clear()
+    return count
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Copy legacy Friend/Pair/Response rows into the main database"
+    )
+    parser.add_argument("--source", default=DEFAULT_SOURCE, help="Legacy database URL")
+    parser.add_argument("--target", default=DEFAULT_TARGET, help="Main database URL")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per insert")
+    parser.add_argument("--dry-run", action="store_true", help="Report counts without writing")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.source == args.target:
+        raise SystemExit("Source and target databases are the same")
+
+    # Older legacy files predate columns the models expect; add them the same
+    # way application startup does.
+    if not args.dry_run:
+        repair_sqlite_schema_for_url(args.source)
+
+    source = create_engine(args.source)
+    target = create_engine(args.target)
+    try:
+        summary = migrate(source, target, batch_size=args.batch_size, dry_run=args.dry_run)
+    finally:
+        source.dispose()
+        target.dispose()
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import groupby
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from app.core_scoring import ScoringValidationError, score_couple
+from app.couple.constants import QUESTION_REGISTRY
+from app.couple.models import (
+    CoupleParticipant,
+    CoupleResponse,
+    CoupleResult,
+    CoupleSession,
+    DecisionPacket,
+)
+from app.couple.packets import ANSWER_KEYS
+from app.couple.services import CoupleService
+from app.database import SessionLocal
+
+LOGS_DIR = Path(__file__).resolve().parents[1] / "logs"
+LOG_PATH = LOGS_DIR / "rescore_couple_sessions.log"
+CHECKPOINT_PATH = LOGS_DIR / "rescore_couple_sessions.checkpoint.json"
+DEFAULT_CHUNK_SIZE = 200
+QUESTION_COUNT = len(QUESTION_REGISTRY)
+
+AnswerSets = Dict[str, Dict[str, int]]
+
+
+def _stream_answer_sets(
+    db: Session, after: str | None, batch_size: int
+) -> Iterator[Tuple[str, AnswerSets]]:
+    """Yield ``(session_id, answer sets)`` in session order from a server-side cursor.
+
+    Only sessions that already have a result are read; the job recomputes
+    results, it does not create them for sessions that never called compute.
+    """
+
+    stmt = (
+        select(
+            CoupleResponse.session_id,
+            CoupleParticipant.role,
+            CoupleResponse.kind,
+            CoupleResponse.question_code,
+            CoupleResponse.value,
+        )
+        .join(CoupleParticipant, CoupleResponse.participant_id == CoupleParticipant.id)
+        .join(CoupleResult, CoupleResult.session_id == CoupleResponse.session_id)
+        .order_by(CoupleResponse.session_id)
+        .execution_options(stream_results=True, yield_per=batch_size)
+    )
+    if after is not None:
+        stmt = stmt.where(CoupleResponse.session_id > after)
+
+    for session_id, rows in groupby(db.execute(stmt), key=lambda row: row[0]):
+        answers: AnswerSets = {key: {} for key in ANSWER_KEYS}
+        for _, role, kind, code, value in rows:
+            target = answers.get(f"{role.lower()}_{kind}")
+            if target is not None:
+                target[code] = value
+        yield session_id, answers
+
+
+def _chunks(
+    items: Iterable[Tuple[str, AnswerSets]], size: int
+) -> Iterator[List[Tuple[str, AnswerSets]]]:
+    chunk: List[Tuple[str, AnswerSets]] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _score(answers: AnswerSets) -> dict | None:
+    """Worker entry point: result fields, or ``None`` for incomplete sessions."""
+
+    if any(len(answers[key]) != QUESTION_COUNT for key in ANSWER_KEYS):
+        return None
+    try:
+        return score_couple(*(answers[key] for key in ANSWER_KEYS))
+    except ScoringValidationError:
+        return None
+
+
+def _grade_and_flags(result: CoupleResult) -> Tuple[str | None, set[str]]:
+    grade = (result.gap_summary or {}).get("grade")
+    return grade, {flag["code"] for flag in result.flags or []}
+
+
+def _change(session_id: str, previous: CoupleResult, outputs: dict) -> dict | None:
+    old_grade, old_flags = _grade_and_flags(previous)
+    new_grade = outputs["gap_summary"].get("grade")
+    new_flags = {flag["code"] for flag in outputs["flags"]}
+    if old_grade == new_grade and old_flags == new_flags:
+        return None
+    return {
+        "session_id": session_id,
+        "grade": [old_grade, new_grade],
+        "flags_added": sorted(new_flags - old_flags),
+        "flags_removed": sorted(old_flags - new_flags),
+    }
+
+
+def _apply_chunk(
+    db: Session,
+    scored: List[Tuple[str, AnswerSets, dict]],
+    summary: Dict[str, object],
+    changes: List[dict],
+    dry_run: bool,
+) -> None:
+    service = CoupleService(db)
+    sessions = {
+        session.id: session
+        for session in db.scalars(
+            select(CoupleSession)
+            .where(CoupleSession.id.in_([session_id for session_id, _, _ in scored]))
+            .options(selectinload(CoupleSession.result))
+            # Same row lock as CoupleService write paths: the audit chain head
+            # on the session is advanced below.
+            .with_for_update(of=CoupleSession)
+        )
+    }
+
+    pending: List[Tuple[CoupleSession, dict, str, dict | None]] = []
+    for session_id, answers, outputs in scored:
+        session = sessions.get(session_id)
+        if session is None or session.result is None:
+            continue
+        result = session.result
+        change = _change(session_id, result, outputs)
+        if change is not None:
+            summary["grade_or_flag_changes"] += 1
+            if dry_run:
+                changes.append(change)
+        if all(getattr(result, field) == value for field, value in outputs.items()):
+            summary["results_unchanged"] += 1
+            continue
+        if dry_run:
+            continue
+
+        for field, value in outputs.items():
+            setattr(result, field, value)
+        # The next compute_result re-keys the result against the live
+        # fingerprint and reuses the packet written here.
+        result.input_fingerprint = None
+        payload, digest = service.encode_result_packet(session, answers, result)
+        result.packet_sha256 = digest
+        pending.append((session, payload, digest, change))
+
+    if not pending:
+        return
+
+    existing = set(
+        db.execute(
+            select(DecisionPacket.session_id, DecisionPacket.packet_sha256).where(
+                DecisionPacket.session_id.in_([session.id for session, _, _, _ in pending]),
+                DecisionPacket.packet_sha256.in_([digest for _, _, digest, _ in pending]),
+            )
+        ).all()
+    )
+    for session, payload, digest, change in pending:
+        if (session.id, digest) not in existing:
+            service.store_packet(session, payload, digest)
+            summary["packets_written"] += 1
+        service.log_event(
+            session,
+            event_type="result.rescored",
+            payload={
+                "packet_sha256": digest,
+                "gap_grade": session.result.gap_summary.get("grade"),
+                "change": change,
+            },
+        )
+    summary["results_written"] += len(pending)
+
+
+def _read_checkpoint(path: Path) -> str | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("last_session_id")
+    except (OSError, ValueError):
+        return None
+
+
+def _write_checkpoint(path: Path, last_session_id: str, summary: Dict[str, object]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entry = {
+        "last_session_id": last_session_id,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "summary": summary,
+    }
+    temp = path.with_name(path.name + ".tmp")
+    temp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+    os.replace(temp, path)
+
+
+def rescore_couple_sessions(
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+    dry_run: bool = False,
+    resume: bool = False,
+    checkpoint_path: Path = CHECKPOINT_PATH,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> Dict[str, object]:
+    """Recompute every couple result with the current ``core_scoring`` rules.
+
+    Sessions are read in id order and scored ``chunk_size`` at a time, in a
+    process pool unless ``workers`` is 0.  Each chunk is written in one
+    transaction and then checkpointed, so ``resume`` continues after the last
+    committed session.  ``dry_run`` writes nothing and lists the sessions
+    whose gap grade or flags would change.
+    """
+
+    after = _read_checkpoint(checkpoint_path) if resume else None
+    summary: Dict[str, object] = {
+        "sessions_scored": 0,
+        "sessions_skipped": 0,
+        "results_written": 0,
+        "results_unchanged": 0,
+        "packets_written": 0,
+        "grade_or_flag_changes": 0,
+        "resumed_after": after,
+        "dry_run": dry_run,
+    }
+    changes: List[dict] = []
+
+    reader = session_factory()
+    writer = session_factory()
+    pool_size = workers if workers is not None else (os.cpu_count() or 1)
+    executor = ProcessPoolExecutor(max_workers=pool_size) if pool_size > 0 else None
+    try:
+        for chunk in _chunks(_stream_answer_sets(reader, after, chunk_size * 4), chunk_size):
+            answer_sets = [answers for _, answers in chunk]
+            if executor is not None:
+                per_task = max(1, len(chunk) // (pool_size * 4))
+                outputs = list(executor.map(_score, answer_sets, chunksize=per_task))
+            else:
+                outputs = [_score(answers) for answers in answer_sets]
+
+            scored = [
+                (session_id, answers, result)
+                for (session_id, answers), result in zip(chunk, outputs)
+                if result is not None
+            ]
+            summary["sessions_scored"] += len(scored)
+            summary["sessions_skipped"] += len(chunk) - len(scored)
+            if scored:
+                _apply_chunk(writer, scored, summary, changes, dry_run)
+
+            if dry_run:
+                writer.rollback()
+            else:
+                writer.commit()
+                _write_checkpoint(checkpoint_path, chunk[-1][0], summary)
+    except Exception:
+        writer.rollback()
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        reader.close()
+        writer.close()
+
+    if dry_run:
+        summary["changes"] = changes
+    return summary
+
+
+def log_summary(summary: Dict[str, object]) -> None:
+    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "summary": {key: value for key, value in summary.items() if key != "changes"},
+    }
+    with LOG_PATH.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Recompute couple results and decision packets with the current scoring rules"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Sessions scored and committed per transaction",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Scoring processes (default: CPU count, 0 scores in-process)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report sessions whose gap grade or flags would change without writing",
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="Continue after the last checkpointed session"
+    )
+    parser.add_argument(
+        "--checkpoint", type=Path, default=CHECKPOINT_PATH, help="Checkpoint file path"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    summary = rescore_couple_sessions(
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        dry_run=args.dry_run,
+        resume=args.resume,
+        checkpoint_path=args.checkpoint,
+    )
+    log_summary(summary)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
 from app.main import app as fastapi_app
 from app.database import Base, engine as orm_engine
 from app.core.db import engine as core_engine
+from testing_utils.sql_capture import capture_statements
 from .client import create_client
 
 
@@ -46,6 +47,19 @@ def client(app: FastAPI):
         test_client.close()
 
 
+@pytest.fixture
+def capture_sql():
+    """``with capture_sql() as statements:`` records what the ORM engine runs.
+
+    Pass another engine to watch it instead.
+    """
+
+    def _capture(bind=orm_engine):
+        return capture_statements(bind)
+
+    return _capture
+
+
 @pytest.fixture
 def user_token() -> str:
     return "test-user-token"
@@ -190,3 +190,32 @@ def test_two_respondents_counted_even_with_participant_token_uniqueness(client):
     payload = status.json()
     assert payload["respondent_count"] == 2
     assert payload["unlocked"] is False
+
+
+def test_participant_answers_are_stored_once_and_still_aggregated(client):
+    session = _create_session(client)
+    answers = build_fake_answers()
+    _submit_self(client, session["session_id"], answers)
+
+    participant = _register_participant(client, session["invite_token"], 0)
+    _submit_answers(client, participant["participant_id"], answers)
+
+    with orm_engine.connect() as conn:
+        legacy_rows = conn.execute(
+            text("SELECT COUNT(*) FROM responses_other WHERE session_id = :sid"),
+            {"sid": session["session_id"]},
+        ).scalar_one()
+        stored = conn.execute(
+            text("SELECT COUNT(*) FROM participant_answers WHERE participant_id = :pid"),
+            {"pid": participant["participant_id"]},
+        ).scalar_one()
+    assert legacy_rows == 0
+    assert stored == len(answers)
+
+    # A direct rater joins the participant in the rebuilt aggregate.
+    direct = client.post(
+        "/api/other/submit",
+        json={"invite_token": session["invite_token"], "answers": answers, "rater_key": "direct"},
+    )
+    assert direct.status_code == HTTPStatus.CREATED
+    assert direct.json()["respondents"] == 2
@@ -0,0 +1,154 @@
+"""Query-plan regression tests for hot lookup paths.
+
+Every statement the app sends while serving the participant, owner and couple
+flows is captured and re-run under ``EXPLAIN QUERY PLAN``.  A plain ``SCAN``
+of one of the hot tables means an index went missing or a query stopped
+matching it.
+"""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import Iterator, List
+from urllib.parse import urlparse
+
+import pytest
+
+from app.couple.constants import QUESTION_REGISTRY
+from app.couple.services import CoupleService
+from app.database import SessionLocal, engine
+from testing_utils import build_fake_answers
+from testing_utils.sql_capture import CapturedStatement
+
+HOT_TABLES = (
+    "participants",
+    "relation_aggregates",
+    "audit_events",
+    "couple_responses",
+    "responses_other",
+)
+
+
+@pytest.fixture
+def captured_sql(capture_sql) -> Iterator[List[CapturedStatement]]:
+    with capture_sql() as statements:
+        yield statements
+
+
+def _hot_reads(statements: List[CapturedStatement]) -> List[CapturedStatement]:
+    return [
+        captured
+        for captured in statements
+        if not captured.executemany
+        and captured.verb not in ("INSERT", "PRAGMA")
+        and any(table in captured.statement for table in HOT_TABLES)
+    ]
+
+
+def _full_scans(statements: List[CapturedStatement]) -> List[str]:
+    problems: List[str] = []
+    with engine.connect() as connection:
+        driver = connection.connection.driver_connection
+        for statement, parameters, _ in _hot_reads(statements):
+            plan = driver.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            for row in plan:
+                detail = row[-1]
+                # "SCAN t" (or "SCAN TABLE t" on older SQLite) has no index;
+                # "SCAN t USING INDEX ..." still walks the whole table.
+                if not detail.startswith("SCAN"):
+                    continue
+                if any(f" {table}" in detail for table in HOT_TABLES):
+                    problems.append(f"{detail}\n    {statement.strip()}")
+    return problems
+
+
+def _owner_headers(owner_exchange_url: str) -> dict[str, str]:
+    owner_token = urlparse(owner_exchange_url).path.rstrip("/").split("/")[-1]
+    return {"Cookie": f"owner_token={owner_token}"}
+
+
+def _couple_answers(offset: int) -> list[dict]:
+    return [
+        {"code": code, "value": (idx + offset) % 5}
+        for idx, code in enumerate(sorted(QUESTION_REGISTRY))
+    ]
+
+
+def test_participant_and_owner_paths_use_indexes(client, captured_sql):
+    create = client.post("/api/sessions", json={"mode": "friend"})
+    assert create.status_code == HTTPStatus.CREATED
+    session = create.json()
+    token = session["invite_token"]
+    headers = _owner_headers(session["owner_exchange_url"])
+    answers = build_fake_answers(mode="friend")
+
+    assert (
+        client.post(
+            "/api/self/submit",
+            json={"session_id": session["session_id"], "answers": answers},
+        ).status_code
+        == HTTPStatus.OK
+    )
+    for idx in range(3):
+        reg = client.post(
+            f"/v1/participants/{token}",
+            json={"relation": "friend", "display_name": f"P{idx}", "consent_display": False},
+        )
+        assert reg.status_code == HTTPStatus.CREATED
+        submit = client.post(
+            f"/v1/answers/{reg.json()['participant_id']}", json={"answers": answers}
+        )
+        assert submit.status_code == HTTPStatus.CREATED
+
+    assert client.get(f"/i/{token}").status_code == HTTPStatus.OK
+    assert client.get(f"/v1/invites/{token}/status").status_code == HTTPStatus.OK
+    assert client.get("/me", headers=headers).status_code == HTTPStatus.OK
+    assert client.get("/me/report", headers=headers).status_code == HTTPStatus.OK
+    report = client.get(f"/v1/report/session/{session['session_id']}", headers=headers)
+    assert report.status_code == HTTPStatus.OK
+
+    assert _hot_reads(captured_sql), "no hot-table statements captured"
+    assert _full_scans(captured_sql) == []
+
+
+def test_couple_paths_use_indexes(client, captured_sql):
+    created = client.post(
+        "/api/couples/sessions",
+        json={
+            "participants": [{"role": "A"}, {"role": "B"}],
+            "stage1_snapshot": {"k": 5, "visible": True, "dimensions": {"CS": 3.1}},
+        },
+    )
+    assert created.status_code == 201
+    body = created.json()
+    session_id = body["session_id"]
+    tokens = {item["role"]: item["access_token"] for item in body["participants"]}
+
+    for offset, role in enumerate(("A", "B")):
+        saved = client.put(
+            f"/api/couples/sessions/{session_id}/responses",
+            json={
+                "access_token": tokens[role],
+                "self_answers": _couple_answers(offset),
+                "guess_answers": _couple_answers(offset + 1),
+                "stage": 2,
+            },
+        )
+        assert saved.status_code == 200
+    fetched = client.get(
+        f"/api/couples/sessions/{session_id}/responses",
+        params={"access_token": tokens["A"]},
+    )
+    assert fetched.status_code == 200
+    compute = client.post(
+        f"/api/couples/sessions/{session_id}/compute",
+        json={"access_token": tokens["A"]},
+    )
+    assert compute.status_code == 200
+    # Appends read the chain head from couple_sessions; verification is the
+    # remaining audit_events walk.
+    with SessionLocal() as db:
+        assert CoupleService(db).verify_chain(session_id).ok
+
+    assert any("audit_events" in captured.statement for captured in _hot_reads(captured_sql))
+    assert _full_scans(captured_sql) == []
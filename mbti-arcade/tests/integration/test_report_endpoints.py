@@ -122,3 +122,75 @@ def test_session_report_lock_and_unlock(client):
     )
     assert participant_report.status_code == HTTPStatus.OK
     assert participant_report.json()["respondent_count"] == 3
+
+
+def _count_writes(client, capture_sql, url: str, headers: dict[str, str]):
+    with capture_sql() as statements:
+        response = client.get(url, headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    return response.json(), len([s for s in statements if s.is_write])
+
+
+def _relations(payload: dict) -> dict[str, int]:
+    return {item["relation"]: item["respondent_count"] for item in payload["relations"]}
+
+
+def test_owner_report_reads_do_not_write(client, capture_sql):
+    session = _create_session(client)
+    owner_headers = _owner_headers(session["owner_exchange_url"])
+    _submit_self(client, session["session_id"])
+    for _ in range(3):
+        registration = _register_participant(client, session["invite_token"])
+        _submit_answers(client, registration["participant_id"])
+
+    urls = [
+        f"/v1/report/session/{session['session_id']}",
+        f"/v1/report/participant/{registration['participant_id']}",
+        f"/v1/participants/{session['invite_token']}/preview",
+    ]
+    for url in urls:
+        for _ in range(2):
+            _, writes = _count_writes(client, capture_sql, url, owner_headers)
+            assert writes == 0, url
+
+
+def test_session_report_recomputes_dirty_session_once(client, capture_sql):
+    session = _create_session(client)
+    owner_headers = _owner_headers(session["owner_exchange_url"])
+    _submit_self(client, session["session_id"])
+    registration = _register_participant(client, session["invite_token"])
+    _submit_answers(client, registration["participant_id"])
+
+    response = client.post(
+        f"/v1/participants/{session['invite_token']}",
+        json={"relation": "coworker", "display_name": "동료", "consent_display": True},
+    )
+    assert response.status_code == HTTPStatus.CREATED
+
+    url = f"/v1/report/session/{session['session_id']}"
+    payload, writes = _count_writes(client, capture_sql, url, owner_headers)
+    assert writes > 0
+    assert _relations(payload) == {"coworker": 0, "friend": 1}
+
+    payload, writes = _count_writes(client, capture_sql, url, owner_headers)
+    assert writes == 0
+    assert _relations(payload) == {"coworker": 0, "friend": 1}
+
+
+def test_session_report_stored_mode_never_recomputes(client, capture_sql, monkeypatch):
+    from app import settings
+
+    monkeypatch.setattr(settings, "RELATION_AGGREGATE_CONSISTENCY", "stored")
+
+    session = _create_session(client)
+    owner_headers = _owner_headers(session["owner_exchange_url"])
+    _submit_self(client, session["session_id"])
+    registration = _register_participant(client, session["invite_token"])
+    _submit_answers(client, registration["participant_id"])
+    _register_participant(client, session["invite_token"])
+
+    payload, writes = _count_writes(
+        client, capture_sql, f"/v1/report/session/{session['session_id']}", owner_headers
+    )
+    assert writes == 0
+    assert _relations(payload) == {"friend": 1}
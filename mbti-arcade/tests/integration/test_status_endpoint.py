@@ -98,3 +98,36 @@ def test_owner_only_endpoints_allow_with_cookie(client):
         headers=headers,
     )
     assert report.status_code == HTTPStatus.OK
+
+
+def test_status_endpoint_reads_session_counters_only(client, capture_sql):
+    create = client.post("/api/sessions", json={"mode": "basic"})
+    assert create.status_code == HTTPStatus.CREATED
+    session = create.json()
+    answers = build_fake_answers(mode="basic")
+    client.post(
+        "/api/self/submit",
+        json={"session_id": session["session_id"], "answers": answers},
+    )
+    reg = client.post(
+        f"/v1/participants/{session['invite_token']}",
+        json={"relation": "friend", "display_name": "A", "consent_display": False},
+    )
+    participant_id = reg.json()["participant_id"]
+    first = client.post(f"/v1/answers/{participant_id}", json={"answers": answers})
+    assert first.status_code == HTTPStatus.CREATED
+
+    # A repeated submit is answered from the counter and does not recount.
+    again = client.post(f"/v1/answers/{participant_id}", json={"answers": answers})
+    assert again.status_code == HTTPStatus.OK
+    assert again.json()["respondent_count"] == 1
+
+    with capture_sql() as statements:
+        status = client.get(f"/v1/invites/{session['invite_token']}/status")
+
+    assert status.status_code == HTTPStatus.OK
+    body = status.json()
+    assert body["respondent_count"] == 1
+    assert body["updated_at"] is not None
+    assert len(statements) == 1
+    assert "participants" not in statements[0].statement
@@ -3,17 +3,50 @@ import unittest
 from datetime import UTC, datetime, timedelta
 
 try:
-    from sqlalchemy import create_engine
+    from sqlalchemy import create_engine, update
     from sqlalchemy.orm import sessionmaker
+
+    from testing_utils.sql_capture import capture_statements
 except ImportError:  # pragma: no cover - optional dependency guard
     SQLALCHEMY_AVAILABLE = False
 else:
     SQLALCHEMY_AVAILABLE = True
 
+from app.data.question_index import (
+    build_question_index,
+    get_question_index,
+    invalidate_question_index,
+)
 from app.database import Base
-from app.models import Aggregate, OtherResponse, Question, Session, SelfResponse
-from app.services.aggregator import recalculate_aggregate
-from app.services.scoring import ScoringError, compute_gap_metrics, compute_norms, weight_for_relation
+from app.models import (
+    Aggregate,
+    AggregateRater,
+    OtherResponse,
+    Participant,
+    ParticipantAnswer,
+    ParticipantRelation,
+    Question,
+    RelationAggregate,
+    SelfResponse,
+    Session,
+)
+from app.services.aggregator import (
+    apply_rater_answers,
+    apply_self_answers,
+    load_aggregate,
+    participant_rater_hash,
+    recalculate_aggregate,
+    recalculate_relation_aggregates,
+    remove_rater,
+)
+from app.services.scoring import (
+    ScoringError,
+    compute_gap_metrics,
+    compute_norms,
+    score_batch,
+    score_norms,
+    weight_for_relation,
+)
 
 
 def _make_session():
@@ -34,6 +67,12 @@ def _insert_questions(db_session):
         ]
     )
     db_session.commit()
+    # These fixtures use their own question ids; reload the shared index.
+    invalidate_question_index()
+
+
+def tearDownModule():
+    invalidate_question_index()
 
 
 class ScoringHelpersTest(unittest.TestCase):
@@ -55,6 +94,32 @@ class ScoringHelpersTest(unittest.TestCase):
         self.assertTrue(math.isclose(norms["SN"], 0.0))
         self.assertTrue(math.isclose(norms["TF"], -1.0))
 
+    def test_compute_norms_indexed_matches_mapping_lookup(self):
+        rows = [(1, "EI", 1), (2, "EI", -1), (3, "SN", 1), (4, "TF", 1), (5, "JP", -1)]
+        index = build_question_index(rows)
+        answers = [(1, 5), (2, 2), (3, 4), (4, 1), (5, 3)]
+
+        self.assertEqual(
+            compute_norms(answers, index),
+            compute_norms(answers, dict(index.dim_sign)),
+        )
+        for bad in ([(99, 3)], [(-1, 3)], [(1, 6)], [(1, 3)]):
+            with self.assertRaises(ScoringError):
+                compute_norms(bad, index)
+
+    def test_question_index_digest_tracks_content(self):
+        rows = [(1, "EI", 1), (2, "SN", -1)]
+        self.assertEqual(
+            build_question_index(rows).digest,
+            build_question_index(list(reversed(rows))).digest,
+        )
+        self.assertNotEqual(
+            build_question_index(rows).digest,
+            build_question_index([(1, "EI", 1), (2, "SN", 1)]).digest,
+        )
+        with self.assertRaises(TypeError):
+            build_question_index(rows).dim_sign[3] = ("TF", 1)
+
     def test_compute_gap_metrics_weights_and_sigma(self):
         self_norm = {dim: 0.0 for dim in ("EI", "SN", "TF", "JP")}
         other_norms = [
@@ -86,6 +151,71 @@ class ScoringHelpersTest(unittest.TestCase):
         self.assertEqual(weight_for_relation(None), 1.0)
 
 
+class BatchScoringTest(unittest.TestCase):
+    LOOKUP = {
+        1: ("EI", 1),
+        2: ("EI", -1),
+        3: ("SN", 1),
+        4: ("TF", -1),
+        5: ("JP", 1),
+        6: ("JP", -1),
+    }
+    QUESTION_IDS = [1, 2, 3, 4, 5, 6]
+    SELF_NORM = {"EI": 0.25, "SN": -0.5, "TF": 0.0, "JP": 0.75}
+
+    def _matrix(self):
+        return [
+            [5, 1, 4, 2, 3, 5],
+            [1, 0, 2, 5, 4, 1],
+            [3, 3, 3, 3, 3, 3],
+            [4, 2, 0, 1, 5, 2],  # no SN answer: rejected
+            [2, 4, 5, 9, 1, 1],  # out of range: rejected
+        ]
+
+    def test_batch_matches_per_rater_path(self):
+        matrix = self._matrix()
+        weights = [1.0, 1.5, 1.2, 1.0, 1.1]
+        batch = score_batch(matrix, self.QUESTION_IDS, self.LOOKUP, weights, self.SELF_NORM)
+
+        expected_norms = []
+        expected_weights = []
+        for position, (row, weight) in enumerate(zip(matrix, weights)):
+            answers = [(qid, value) for qid, value in zip(self.QUESTION_IDS, row) if value]
+            try:
+                norms = compute_norms(answers, self.LOOKUP)
+            except ScoringError:
+                norms = None
+            else:
+                expected_norms.append(norms)
+                expected_weights.append(weight)
+            self.assertEqual(batch.norms[position], norms)
+        self.assertEqual([item is None for item in batch.norms], [False, False, False, True, True])
+
+        other, sigma, gaps, gap_score = compute_gap_metrics(
+            self.SELF_NORM, expected_norms, expected_weights
+        )
+        for dim in ("EI", "SN", "TF", "JP"):
+            self.assertTrue(math.isclose(batch.other_norm[dim], other[dim], abs_tol=1e-12))
+            self.assertTrue(math.isclose(batch.sigma[dim], sigma[dim], abs_tol=1e-12))
+            self.assertTrue(math.isclose(batch.gap[dim], gaps[dim], abs_tol=1e-12))
+        self.assertTrue(math.isclose(batch.gap_score, gap_score, abs_tol=1e-9))
+        self.assertEqual(score_norms(matrix, self.QUESTION_IDS, self.LOOKUP), batch.norms)
+
+    def test_batch_without_valid_raters_has_no_statistics(self):
+        batch = score_batch([[0, 0, 0, 0, 0, 0]], self.QUESTION_IDS, self.LOOKUP, [1.0])
+        self.assertEqual(batch.norms, [None])
+        self.assertIsNone(batch.other_norm)
+        self.assertIsNone(batch.gap_score)
+
+    def test_unknown_question_rejects_only_raters_that_answer_it(self):
+        question_ids = self.QUESTION_IDS + [999]
+        matrix = [row + [0] for row in self._matrix()[:2]]
+        matrix[1][-1] = 3
+        batch = score_batch(matrix, question_ids, self.LOOKUP, [1.0, 1.0])
+        self.assertIsNotNone(batch.norms[0])
+        self.assertIsNone(batch.norms[1])
+
+
 @unittest.skipUnless(SQLALCHEMY_AVAILABLE, "sqlalchemy not installed")
 class AggregateRecalculationTest(unittest.TestCase):
     def test_recalculate_aggregate_computes_weighted_stats(self):
@@ -139,6 +269,71 @@ class AggregateRecalculationTest(unittest.TestCase):
             session.close()
             engine.dispose()
 
+    def test_recalculate_aggregate_reads_participant_answers(self):
+        session, engine = _make_session()
+        try:
+            _insert_questions(session)
+            record = Session(
+                id="sess-3",
+                owner_id=None,
+                mode="basic",
+                invite_token="token-789",
+                is_anonymous=True,
+                expires_at=datetime.now(UTC) + timedelta(hours=1),
+                max_raters=10,
+            )
+            session.add(record)
+            participant = Participant(
+                session_id="sess-3",
+                invite_token="token-789",
+                relation=ParticipantRelation.FRIEND,
+            )
+            session.add(participant)
+            session.flush()
+
+            session.add_all(
+                SelfResponse(session_id="sess-3", question_id=qid, value=value)
+                for qid, value in ((1, 5), (2, 3), (3, 1), (4, 4))
+            )
+            session.add_all(
+                ParticipantAnswer(participant_id=participant.id, question_id=qid, value=value)
+                for qid, value in ((1, 1), (2, 5), (3, 5), (4, 1))
+            )
+            # A copy written before dual writes stopped must not count twice,
+            # and the participant's own answer set wins over it.
+            session.add_all(
+                OtherResponse(
+                    session_id="sess-3",
+                    rater_hash=participant_rater_hash(participant.id),
+                    participant_id=participant.id,
+                    question_id=qid,
+                    value=3,
+                    relation_tag="friend",
+                )
+                for qid in (1, 2, 3, 4)
+            )
+            session.add_all(
+                OtherResponse(
+                    session_id="sess-3", rater_hash="r2", question_id=qid, value=value, relation_tag="couple"
+                )
+                for qid, value in ((1, 3), (2, 4), (3, 2), (4, 3))
+            )
+            session.commit()
+
+            result = recalculate_aggregate(session, record)
+
+            # Same answers as the all-legacy case above.
+            self.assertEqual(result.n, 2)
+            self.assertTrue(math.isclose(result.other_norm["SN"], 0.7))
+            self.assertTrue(math.isclose(result.gap["EI"], -1.4))
+            self.assertEqual(
+                {row.rater_hash for row in session.query(AggregateRater).all()},
+                {participant_rater_hash(participant.id), "r2"},
+            )
+        finally:
+            session.close()
+            engine.dispose()
+
     def test_recalculate_aggregate_requires_self_answers(self):
         session, engine = _make_session()
         try:
@@ -162,5 +357,241 @@ class AggregateRecalculationTest(unittest.TestCase):
             engine.dispose()
 
 
+@unittest.skipUnless(SQLALCHEMY_AVAILABLE, "sqlalchemy not installed")
+class IncrementalAggregateTest(unittest.TestCase):
+    def setUp(self):
+        self.db, self.engine = _make_session()
+        _insert_questions(self.db)
+        self.record = Session(
+            id="sess-inc",
+            owner_id=None,
+            mode="basic",
+            invite_token="token-inc",
+            is_anonymous=True,
+            expires_at=datetime.now(UTC) + timedelta(hours=1),
+            max_raters=10,
+        )
+        self.db.add(self.record)
+        self.db.add_all(
+            [
+                SelfResponse(session_id="sess-inc", question_id=1, value=5),
+                SelfResponse(session_id="sess-inc", question_id=2, value=3),
+                SelfResponse(session_id="sess-inc", question_id=3, value=1),
+                SelfResponse(session_id="sess-inc", question_id=4, value=4),
+            ]
+        )
+        self.db.commit()
+        recalculate_aggregate(self.db, self.record)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _store_rater(self, rater_hash, values, relation_tag):
+        self.db.query(OtherResponse).filter(
+            OtherResponse.session_id == "sess-inc",
+            OtherResponse.rater_hash == rater_hash,
+        ).delete()
+        answers = list(zip((1, 2, 3, 4), values))
+        for question_id, value in answers:
+            self.db.add(
+                OtherResponse(
+                    session_id="sess-inc",
+                    rater_hash=rater_hash,
+                    question_id=question_id,
+                    value=value,
+                    relation_tag=relation_tag,
+                )
+            )
+        self.db.flush()
+        return apply_rater_answers(self.db, self.record, rater_hash, answers, relation_tag)
+
+    def _assert_matches_full_rebuild(self, incremental):
+        stored, rebuilt = load_aggregate(self.db, self.record)
+        self.assertFalse(rebuilt)
+        rebuilt = recalculate_aggregate(self.db, self.record)
+        for result in (incremental, stored):
+            self.assertEqual(result.n, rebuilt.n)
+            if rebuilt.other_norm is None:
+                self.assertIsNone(result.other_norm)
+                self.assertIsNone(result.gap_score)
+                continue
+            self.assertTrue(math.isclose(result.gap_score, rebuilt.gap_score, abs_tol=1e-9))
+            for dim in ("EI", "SN", "TF", "JP"):
+                self.assertTrue(math.isclose(result.other_norm[dim], rebuilt.other_norm[dim], abs_tol=1e-9))
+                self.assertTrue(math.isclose(result.sigma[dim], rebuilt.sigma[dim], abs_tol=1e-7))
+                self.assertTrue(math.isclose(result.gap[dim], rebuilt.gap[dim], abs_tol=1e-9))
+
+    def test_insert_replace_and_remove_match_full_rebuild(self):
+        self._assert_matches_full_rebuild(self._store_rater("r1", (1, 5, 5, 1), "friend"))
+        self._assert_matches_full_rebuild(self._store_rater("r2", (3, 4, 2, 3), "couple"))
+        self._assert_matches_full_rebuild(self._store_rater("r3", (4, 2, 3, 5), "family"))
+
+        replaced = self._store_rater("r2", (5, 5, 1, 1), "coworker")
+        self.assertEqual(replaced.n, 3)
+        self._assert_matches_full_rebuild(replaced)
+
+        self.db.query(OtherResponse).filter(OtherResponse.rater_hash == "r1").delete()
+        self.db.flush()
+        removed = remove_rater(self.db, self.record, "r1")
+        self.assertEqual(removed.n, 2)
+        self._assert_matches_full_rebuild(removed)
+
+    def test_rater_delta_applies_to_the_locked_row(self):
+        self._store_rater("r1", (1, 5, 5, 1), "friend")
+        cached = self.db.get(Aggregate, "sess-inc")
+        # Another transaction commits a rater behind this session's back; the
+        # next delta must build on the row as stored, not the cached copy.
+        self.db.execute(
+            update(Aggregate)
+            .where(Aggregate.session_id == "sess-inc")
+            .values(n=Aggregate.n + 1, weight_total=Aggregate.weight_total + 1.0),
+            execution_options={"synchronize_session": False},
+        )
+
+        result = self._store_rater("r2", (3, 4, 2, 3), "couple")
+
+        self.assertEqual(result.n, 3)
+        self.assertEqual(cached.n, 3)
+
+    def test_version_bump_builds_on_the_stored_version(self):
+        self._store_rater("r1", (1, 5, 5, 1), "friend")
+        before = self.record.responses_version
+        # A concurrent writer bumps the version without touching the
+        # aggregate; this writer must not reuse that version number.
+        self.db.execute(
+            update(Session)
+            .where(Session.id == "sess-inc")
+            .values(responses_version=Session.responses_version + 1),
+            execution_options={"synchronize_session": False},
+        )
+
+        self._store_rater("r2", (3, 4, 2, 3), "couple")
+
+        self.assertEqual(self.record.responses_version, before + 2)
+        self.assertEqual(self.db.get(Aggregate, "sess-inc").version, before + 2)
+        self._assert_matches_full_rebuild(load_aggregate(self.db, self.record)[0])
+
+    def test_removing_last_rater_clears_other_metrics(self):
+        self._store_rater("r1", (1, 5, 5, 1), "friend")
+        self.db.query(OtherResponse).filter(OtherResponse.rater_hash == "r1").delete()
+        self.db.flush()
+
+        result = remove_rater(self.db, self.record, "r1")
+
+        self.assertEqual(result.n, 0)
+        self.assertIsNone(result.other_norm)
+        aggregate = self.db.get(Aggregate, "sess-inc")
+        self.assertEqual(aggregate.weight_total, 0.0)
+        self.assertEqual(self.db.query(AggregateRater).count(), 0)
+
+    def test_self_answers_refresh_gap_without_touching_raters(self):
+        self._store_rater("r1", (1, 5, 5, 1), "friend")
+
+        result = apply_self_answers(self.db, self.record, [(1, 1), (2, 3), (3, 5), (4, 2)])
+
+        self.assertTrue(math.isclose(result.self_norm["EI"], -1.0))
+        self.assertTrue(math.isclose(result.gap["EI"], 0.0))
+        self.assertEqual(result.n, 1)
+
+
+@unittest.skipUnless(SQLALCHEMY_AVAILABLE, "sqlalchemy not installed")
+class RelationAggregateTest(unittest.TestCase):
+    def setUp(self):
+        self.db, self.engine = _make_session()
+        _insert_questions(self.db)
+        self.db.add(
+            Session(
+                id="sess-rel",
+                owner_id=None,
+                mode="friend",
+                invite_token="token-rel",
+                is_anonymous=True,
+                expires_at=datetime.now(UTC) + timedelta(hours=1),
+                max_raters=20,
+            )
+        )
+        self.db.add_all(
+            SelfResponse(session_id="sess-rel", question_id=qid, value=value)
+            for qid, value in ((1, 5), (2, 3), (3, 1), (4, 4))
+        )
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _add_participants(self, relation, types):
+        for index, perceived in enumerate(types):
+            self.db.add(
+                Participant(
+                    session_id="sess-rel",
+                    invite_token=f"{relation.value}-{index}",
+                    relation=relation,
+                    perceived_type=perceived,
+                    axes_payload={"EI": 0.5, "SN": -0.25, "TF": 0.0, "JP": 0.25},
+                    answers_submitted_at=datetime.now(UTC),
+                )
+            )
+
+    def _count_statements(self):
+        with capture_statements(self.engine) as statements:
+            summary = recalculate_relation_aggregates("sess-rel", self.db)
+        return summary, len(statements)
+
+    def test_upserts_rows_and_preserves_identity(self):
+        self._add_participants(ParticipantRelation.FRIEND, ["ENTJ", "ENTJ", "INTJ"])
+        self._add_participants(ParticipantRelation.FAMILY, ["ISFP"])
+        self.db.commit()
+
+        summary = recalculate_relation_aggregates("sess-rel", self.db)
+        self.db.commit()
+        self.assertEqual([item.relation for item in summary.relations], [
+            ParticipantRelation.FAMILY,
+            ParticipantRelation.FRIEND,
+        ])
+        friend = summary.relations[1]
+        self.assertEqual(friend.top_type, "ENTJ")
+        self.assertTrue(math.isclose(friend.consensus, round(round(2 / 3, 6) - round(1 / 3, 6), 6)))
+        stored = (
+            self.db.query(RelationAggregate)
+            .filter(RelationAggregate.relation == ParticipantRelation.FRIEND)
+            .one()
+        )
+        first_id, first_created = stored.id, stored.created_at
+
+        self._add_participants(ParticipantRelation.FRIEND, ["INTJ"])
+        self.db.commit()
+        recalculate_relation_aggregates("sess-rel", self.db)
+        self.db.commit()
+        self.db.expire_all()
+
+        rows = self.db.query(RelationAggregate).all()
+        self.assertEqual(len(rows), 2)
+        stored = next(row for row in rows if row.relation == ParticipantRelation.FRIEND)
+        self.assertEqual((stored.id, stored.created_at), (first_id, first_created))
+        self.assertEqual(stored.respondent_count, 4)
+        self.assertTrue(math.isclose(stored.consensus, 0.0))
+        self.assertIsNotNone(stored.pgi)
+
+    def test_query_count_does_not_grow_with_relations(self):
+        self._add_participants(ParticipantRelation.FRIEND, ["ENTJ"] * 3)
+        self.db.commit()
+        get_question_index(self.db)  # keep the one-off index load out of the count
+        _, few = self._count_statements()
+
+        for relation in (
+            ParticipantRelation.FAMILY,
+            ParticipantRelation.COWORKER,
+            ParticipantRelation.PARTNER,
+        ):
+            self._add_participants(relation, ["INFP"] * 3)
+        self.db.commit()
+        summary, many = self._count_statements()
+
+        self.assertEqual(len(summary.relations), 4)
+        self.assertEqual(few, many)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,91 @@
+"""The compiled array engine matches the per-item dict rules exactly."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from app.core_scoring import (
+    COMPILED,
+    QUESTION_TO_SCALE,
+    REV_ITEMS,
+    SCALES,
+    MissingResponsesError,
+    ScoringValidationError,
+    compute_deltas,
+    compute_scale_means,
+    rank_top_delta_items,
+    score_arrays,
+    score_item,
+)
+
+
+def _reference_score(code: str, value: int) -> float:
+    if code in REV_ITEMS:
+        return float(4 - value)
+    if code == "SF1":
+        return float(value) * 0.4
+    return float(value)
+
+
+def _random_answers(rng: random.Random) -> dict[str, int]:
+    return {
+        code: rng.randint(0, 10 if code == "SF1" else 4) for code in QUESTION_TO_SCALE
+    }
+
+
+def test_compiled_spec_follows_scale_order():
+    assert COMPILED.codes == tuple(QUESTION_TO_SCALE)
+    assert COMPILED.scales == tuple(SCALES)
+    for code, position in COMPILED.positions.items():
+        assert COMPILED.scales[COMPILED.item_scale[position]] == QUESTION_TO_SCALE[code]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_score_arrays_matches_dict_reference(seed):
+    rng = random.Random(seed)
+    a_self, a_guess, b_self, b_guess = (_random_answers(rng) for _ in range(4))
+
+    scores = score_arrays(*(COMPILED.pack(m) for m in (a_self, a_guess, b_self, b_guess)))
+
+    for answers, means in (
+        (a_self, scores.scale_means_a_self),
+        (b_guess, scores.scale_means_b_guess),
+    ):
+        expected = {
+            scale: sum(_reference_score(code, answers[code]) for code in codes) / len(codes)
+            for scale, codes in SCALES.items()
+        }
+        assert COMPILED.by_scale(means) == expected
+        assert compute_scale_means(answers) == expected
+
+    deltas = compute_deltas(a_self, a_guess, b_self, b_guess)
+    expected_items_a = {
+        code: abs(float(a_guess[code]) - float(b_self[code])) for code in QUESTION_TO_SCALE
+    }
+    assert deltas.delta_items_a == expected_items_a
+    assert COMPILED.by_code(scores.item_deltas_a) == expected_items_a
+    assert COMPILED.by_code(scores.item_deltas_b) == deltas.delta_items_b
+    assert COMPILED.by_scale(scores.scale_deltas_b) == deltas.delta_scales_b
+    assert scores.top_items == rank_top_delta_items(deltas.delta_items_a, deltas.delta_items_b)
+
+
+def test_dict_wrappers_keep_partial_and_invalid_behaviour():
+    answers = {code: 2 for code in QUESTION_TO_SCALE}
+    del answers["EA3"]
+    with pytest.raises(MissingResponsesError, match="EA3"):
+        compute_scale_means(answers)
+
+    partial = compute_deltas({"CS1": 1}, {"CS1": 4}, {"CS1": 0}, {"CS1": 2})
+    assert partial.delta_items_a == {"CS1": 4.0}
+    assert partial.delta_scales_a["EA"] == 0.0
+
+    with pytest.raises(ScoringValidationError, match="0..10"):
+        score_item("SF1", 11)
+    assert score_item("SF1", 10) == 4.0
+    assert score_item("CS2", 1) == 3.0
+
+    values = COMPILED.pack({code: 0 for code in QUESTION_TO_SCALE})
+    with pytest.raises(ScoringValidationError, match="expected 48"):
+        score_arrays(values[:-1], values, values, values)
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
+import json
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+
+from sqlalchemy import delete, func, select, update
+
+from app.couple import packets
 from app.couple.constants import QUESTION_REGISTRY
+from app.couple.models import AuditEvent, CoupleResult, CoupleSession, DecisionPacket
+from app.couple.schemas import StageOneSnapshot
+from app.couple.services import CoupleService
+from app.database import SessionLocal
 
 
 def _create_session(client) -> dict:
@@ -221,3 +232,402 @@ def test_responses_prevent_stage_skip(client):
 
     assert response.status_code == 409
     assert response.json()["type"].endswith("/stage-order")
+
+
+def _submit_both(client, session: dict) -> None:
+    for offset, participant in enumerate(session["participants"]):
+        response = client.put(
+            f"/api/couples/sessions/{session['session_id']}/responses",
+            json={
+                "access_token": participant["access_token"],
+                "self_answers": _answers(offset=offset * 2),
+                "guess_answers": _answers(offset=offset * 2 + 1),
+                "stage": 2,
+            },
+        )
+        assert response.status_code == 200
+
+
+def test_audit_append_reads_chain_head_from_session(client, capture_sql):
+    session = _create_session(client)
+    with capture_sql() as statements:
+        _submit_both(client, session)
+
+    assert not [s for s in statements if s.verb == "SELECT" and "audit_events" in s.statement]
+
+    with SessionLocal() as db:
+        couple = db.get(CoupleSession, session["session_id"])
+        events = list(
+            db.scalars(
+                select(AuditEvent)
+                .where(AuditEvent.session_id == couple.id)
+                .order_by(AuditEvent.created_at, AuditEvent.id)
+            )
+        )
+        assert len(events) >= 3
+        assert events[0].prev_hash is None
+        for previous, current in zip(events, events[1:]):
+            assert current.prev_hash == previous.hash
+        assert couple.last_audit_hash == events[-1].hash
+
+
+def test_verify_chain_reports_first_broken_link(client):
+    session = _create_session(client)
+    session_id = session["session_id"]
+    _submit_both(client, session)
+
+    with SessionLocal() as db:
+        service = CoupleService(db)
+        result = service.verify_chain(session_id, batch_size=2)
+        assert result.ok is True
+        assert result.checked >= 3
+
+        event_ids = list(
+            db.scalars(
+                select(AuditEvent.id)
+                .where(AuditEvent.session_id == session_id)
+                .order_by(AuditEvent.created_at, AuditEvent.id)
+            )
+        )
+        db.execute(update(AuditEvent).where(AuditEvent.id == event_ids[1]).values(prev_hash="0" * 64))
+        db.commit()
+
+        broken = service.verify_chain(session_id, batch_size=2)
+        assert broken.ok is False
+        assert broken.broken_event_id == event_ids[1]
+        assert broken.checked == 1
+
+        # Repair the link; editing an event's contents breaks its digest.
+        first_hash = db.scalar(select(AuditEvent.hash).where(AuditEvent.id == event_ids[0]))
+        db.execute(update(AuditEvent).where(AuditEvent.id == event_ids[1]).values(prev_hash=first_hash))
+        original_payload = db.scalar(select(AuditEvent.payload).where(AuditEvent.id == event_ids[1]))
+        db.execute(
+            update(AuditEvent)
+            .where(AuditEvent.id == event_ids[1])
+            .values(payload={**original_payload, "edited": True})
+        )
+        db.commit()
+
+        tampered = service.verify_chain(session_id)
+        assert tampered.ok is False
+        assert tampered.broken_event_id == event_ids[1]
+        assert tampered.reason == "hash does not match the event contents"
+
+        # Restore the payload, then point the session at a hash no event carries.
+        db.execute(update(AuditEvent).where(AuditEvent.id == event_ids[1]).values(payload=original_payload))
+        db.execute(
+            update(CoupleSession).where(CoupleSession.id == session_id).values(last_audit_hash="f" * 64)
+        )
+        db.commit()
+        db.expire_all()
+
+        stale_head = service.verify_chain(session_id)
+        assert stale_head.ok is False
+        assert stale_head.broken_event_id is None
+        assert stale_head.checked == len(event_ids)
+
+
+def _legacy_digest(prev_hash: str | None, event_type: str, payload: dict) -> str:
+    # Events written before digest_version hashed a timestamp they never stored.
+    body = json.dumps(
+        {
+            "event_type": event_type,
+            "payload": payload,
+            "ts": (datetime.now(timezone.utc) + timedelta(seconds=7)).isoformat(),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return sha256(((prev_hash or "") + body).encode("utf-8")).hexdigest()
+
+
+def test_verify_chain_accepts_events_from_before_digest_versions(client):
+    session = _create_session(client)
+    session_id = session["session_id"]
+
+    with SessionLocal() as db:
+        db.execute(delete(AuditEvent).where(AuditEvent.session_id == session_id))
+        prev_hash = None
+        for event_type in ("session_created", "stage1_updated"):
+            payload = {"session_id": session_id}
+            digest = _legacy_digest(prev_hash, event_type, payload)
+            db.add(
+                AuditEvent(
+                    session_id=session_id,
+                    event_type=event_type,
+                    payload=payload,
+                    prev_hash=prev_hash,
+                    hash=digest,
+                )
+            )
+            db.flush()
+            prev_hash = digest
+        db.execute(
+            update(CoupleSession).where(CoupleSession.id == session_id).values(last_audit_hash=prev_hash)
+        )
+        db.commit()
+
+        service = CoupleService(db)
+        legacy = service.verify_chain(session_id)
+        assert legacy.ok is True
+        assert legacy.checked == 2
+
+        service.update_stage_one(session_id, StageOneSnapshot(k=4, visible=True))
+        service.update_stage_one(session_id, StageOneSnapshot(k=5, visible=True))
+        db.commit()
+        mixed = service.verify_chain(session_id)
+        assert mixed.ok is True
+        assert mixed.checked == 4
+
+        # A current event cannot pass itself off as legacy to skip its digest.
+        last_id = db.scalar(select(func.max(AuditEvent.id)).where(AuditEvent.session_id == session_id))
+        db.execute(update(AuditEvent).where(AuditEvent.id == last_id).values(digest_version=None))
+        db.commit()
+        downgraded = service.verify_chain(session_id)
+        assert downgraded.ok is False
+        assert downgraded.broken_event_id == last_id
+
+
+def test_concurrent_writers_extend_one_audit_chain(client):
+    session = _create_session(client)
+    session_id = session["session_id"]
+
+    with SessionLocal() as db:
+        service = CoupleService(db)
+        cached = db.get(CoupleSession, session_id)
+        # The partner's request appends an event after this one read the
+        # session; the next append must chain onto it rather than fork.
+        with SessionLocal() as other:
+            CoupleService(other).update_stage_one(session_id, StageOneSnapshot(k=3, visible=True))
+            other.commit()
+
+        service.update_stage_one(session_id, StageOneSnapshot(k=4, visible=True))
+        db.commit()
+
+        assert cached.k_value == 4
+        result = service.verify_chain(session_id)
+        assert result.ok is True
+        assert result.checked == 3
+
+
+def test_store_packet_shares_one_row_with_a_concurrent_writer(client, monkeypatch):
+    session_id = _create_session(client)["session_id"]
+    payload, digest = {"format": packets.PACKET_FORMAT}, "a" * 64
+    offload = packets.offload_payload
+
+    def _racing_offload(payload, digest):
+        # Another request stores the same digest after this one's lookup.
+        monkeypatch.setattr(packets, "offload_payload", offload)
+        with SessionLocal() as other:
+            CoupleService(other).store_packet(other.get(CoupleSession, session_id), payload, digest)
+            other.commit()
+        return offload(payload, digest)
+
+    monkeypatch.setattr(packets, "offload_payload", _racing_offload)
+    with SessionLocal() as db:
+        packet_id = CoupleService(db).store_packet(db.get(CoupleSession, session_id), payload, digest).id
+        db.commit()
+        rows = list(db.scalars(select(DecisionPacket.id).where(DecisionPacket.session_id == session_id)))
+
+    assert rows == [packet_id]
+
+
+def test_recompute_reuses_packet_and_offloads_payload(client, tmp_path, monkeypatch):
+    store = packets.PacketBlobStore(tmp_path / "packets")
+    monkeypatch.setattr(packets, "packet_blob_store", store)
+    session = _create_session(client)
+    session_id = session["session_id"]
+    token_a = session["participants"][0]["access_token"]
+    _submit_both(client, session)
+
+    digests = []
+    for _ in range(3):
+        compute = client.post(
+            f"/api/couples/sessions/{session_id}/compute",
+            json={"access_token": token_a},
+        )
+        assert compute.status_code == 200
+        digests.append(compute.json()["decision_packet"]["packet_sha256"])
+
+    # Force a full recompute; the identical packet is still reused.
+    with SessionLocal() as db:
+        db.execute(
+            update(CoupleResult).where(CoupleResult.session_id == session_id).values(input_fingerprint=None)
+        )
+        db.commit()
+    compute = client.post(
+        f"/api/couples/sessions/{session_id}/compute",
+        json={"access_token": token_a},
+    )
+    assert compute.status_code == 200
+    digests.append(compute.json()["decision_packet"]["packet_sha256"])
+
+    assert len(set(digests)) == 1
+    assert list(store.digests()) == digests[:1]
+
+    with SessionLocal() as db:
+        rows = list(db.scalars(select(DecisionPacket).where(DecisionPacket.session_id == session_id)))
+        assert len(rows) == 1
+        packet = rows[0]
+        assert packet.payload == {"format": packets.PACKET_FORMAT}
+        assert packet.storage_url.startswith("file://")
+
+        recorded = CoupleService(db).load_packet_payload(packet)
+        assert recorded["inputs"]["a_self"] == {
+            item["code"]: item["value"] for item in _answers()
+        }
+        assert set(recorded["outputs"]["deltas"]["items_a"]) == set(QUESTION_REGISTRY)
+        assert recorded["model_id"] == "core_scoring.v1"
+
+
+def test_packet_encoding_round_trips_and_is_compact():
+    codes = sorted(QUESTION_REGISTRY)
+    answers = {
+        key: {code: (idx + shift) % 11 for idx, code in enumerate(codes)}
+        for shift, key in enumerate(packets.ANSWER_KEYS)
+    }
+    outputs = {
+        "deltas": {"items_a": {code: 2.0 for code in codes}, "scales_a": {"CS": 2.0}},
+        "flags": [],
+    }
+    payload, digest = packets.encode_packet(
+        answers=answers,
+        k_state={"threshold": 3, "current": 5, "visible": True},
+        stage1_snapshot=None,
+        outputs=outputs,
+        code_ref="test",
+        model_id="core_scoring.v1",
+    )
+
+    assert payload["inputs"]["a_self"] == packets.pack_values(answers["a_self"], codes)
+    assert len(payload["inputs"]["a_self"]) == len(codes)
+    decoded = packets.decode_packet(payload)
+    for key in packets.ANSWER_KEYS:
+        assert decoded["inputs"][key] == answers[key]
+    assert decoded["outputs"]["deltas"]["items_a"] == outputs["deltas"]["items_a"]
+
+    # Insertion order of the source maps does not change the digest.
+    reordered = {key: dict(reversed(list(value.items()))) for key, value in answers.items()}
+    _, same_digest = packets.encode_packet(
+        answers=reordered,
+        k_state={"visible": True, "current": 5, "threshold": 3},
+        stage1_snapshot=None,
+        outputs=outputs,
+        code_ref="test",
+        model_id="core_scoring.v1",
+    )
+    assert same_digest == digest
+
+
+def test_compute_result_short_circuits_until_inputs_change(client, capture_sql):
+    session = _create_session(client)
+    session_id = session["session_id"]
+    token_a = session["participants"][0]["access_token"]
+    _submit_both(client, session)
+
+    def _compute() -> dict:
+        response = client.post(
+            f"/api/couples/sessions/{session_id}/compute",
+            json={"access_token": token_a},
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    with capture_sql() as statements:
+        first = _compute()
+        response_reads = [s.statement for s in statements if "FROM couple_responses" in s.statement]
+        # Recomputing reads every answer with its role in one joined query.
+        assert len(response_reads) == 1
+        assert "JOIN couple_participants" in response_reads[0]
+
+        statements.clear()
+        second = _compute()
+        assert not [s for s in statements if "couple_responses" in s.statement]
+        assert not [s for s in statements if s.is_write]
+
+    assert second == first
+
+    # New answers invalidate the stored result.
+    changed = client.put(
+        f"/api/couples/sessions/{session_id}/responses",
+        json={
+            "access_token": token_a,
+            "self_answers": _answers(offset=4),
+            "guess_answers": _answers(offset=1),
+            "stage": 3,
+        },
+    )
+    assert changed.status_code == 200
+    third = _compute()
+    assert third["decision_packet"]["packet_sha256"] != first["decision_packet"]["packet_sha256"]
+
+    # So does a new stage one snapshot, which the packet records.
+    stage1 = client.patch(
+        f"/api/couples/sessions/{session_id}/stage1",
+        json={"k": 6, "visible": True, "dimensions": {"CS": 3.0}},
+    )
+    assert stage1.status_code == 200
+    fourth = _compute()
+    assert fourth["decision_packet"]["packet_sha256"] != third["decision_packet"]["packet_sha256"]
+    assert fourth["k_state"]["current"] == 6
+
+
+def test_merge_autosave_writes_only_changed_codes(client, capture_sql):
+    session = _create_session(client)
+    session_id = session["session_id"]
+    token_a = session["participants"][0]["access_token"]
+    url = f"/api/couples/sessions/{session_id}/responses"
+    full_self, full_guess = _answers(), _answers(offset=1)
+
+    def _autosave(self_answers, guess_answers) -> dict:
+        response = client.put(
+            url,
+            json={
+                "access_token": token_a,
+                "self_answers": self_answers,
+                "guess_answers": guess_answers,
+                "stage": 2,
+                "mode": "merge",
+            },
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    # Two partial autosaves add up to the full answer set.
+    assert _autosave(full_self[:10], [])["self_completed"] is False
+    body = _autosave(full_self[10:], full_guess)
+    assert body["self_completed"] is True and body["guess_completed"] is True
+
+    with capture_sql() as statements:
+
+        def _writes() -> list[str]:
+            return [s.verb for s in statements if s.is_write and "couple_responses" in s.statement]
+
+        _autosave(full_self[:10], full_guess[:3])
+        assert _writes() == []
+        assert not [s for s in statements if s.verb == "INSERT"]
+
+        changed = dict(full_self[0], value=(full_self[0]["value"] + 1) % 5)
+        statements.clear()
+        _autosave([changed], [])
+        assert _writes() == ["UPDATE"]
+
+        statements.clear()
+        saved = client.get(url, params={"access_token": token_a})
+        assert saved.status_code == 200
+        reads = [s.statement for s in statements if s.verb == "SELECT"]
+        # One joined lookup for session and participant, one for both answer kinds.
+        assert len(reads) == 2
+        assert "JOIN couple_participants" in reads[0]
+
+    expected_self = {item["code"]: item["value"] for item in full_self}
+    expected_self[changed["code"]] = changed["value"]
+    assert saved.json()["self_answers"] == expected_self
+    assert saved.json()["guess_answers"] == {item["code"]: item["value"] for item in full_guess}
+
+    wrong_token = client.get(url, params={"access_token": "nope"})
+    assert wrong_token.status_code == 403
+    missing = client.get(
+        "/api/couples/sessions/missing/responses", params={"access_token": token_a}
+    )
+    assert missing.status_code == 404
@@ -0,0 +1,133 @@
+"""Connection pool settings and metrics tests."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.utils import db_pool
+from app.utils.db_pool import InstrumentedQueuePool, instrument_engine, pool_options
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(db_pool, "_REGISTRY", {})
+
+
+def test_pool_options_read_prefixed_environment(monkeypatch):
+    monkeypatch.setenv("CORE_DB_POOL_SIZE", "12")
+    monkeypatch.setenv("CORE_DB_MAX_OVERFLOW", "4")
+    monkeypatch.setenv("CORE_DB_POOL_TIMEOUT", "3")
+    monkeypatch.setenv("CORE_DB_POOL_RECYCLE", "1800")
+    monkeypatch.setenv("CORE_DB_POOL_PRE_PING", "true")
+
+    assert pool_options("CORE_DB") == {
+        "pool_pre_ping": True,
+        "pool_size": 12,
+        "max_overflow": 4,
+        "pool_timeout": 3,
+        "pool_recycle": 1800,
+    }
+    assert pool_options("DB") == {"pool_pre_ping": False}
+
+
+def test_pool_options_reject_non_integers(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "many")
+
+    with pytest.raises(ValueError):
+        pool_options("DB")
+
+
+def test_metrics_track_checkouts_overflow_and_waits(tmp_path, isolated_registry):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    metrics = instrument_engine("test", engine)
+
+    try:
+        first = engine.connect()
+        second = engine.connect()
+        first.execute(text("SELECT 1"))
+        snapshot = metrics.snapshot()
+        assert snapshot["checked_out"] == 2
+        assert snapshot["overflow"] == 1
+        assert snapshot["size"] == 1
+
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+        first.close()
+        second.close()
+        snapshot = metrics.snapshot()
+        assert snapshot["checked_out"] == 0
+        assert snapshot["peak_checked_out"] == 2
+        assert snapshot["checkouts"] == 2
+        assert snapshot["timeouts"] == 1
+        assert snapshot["wait_count"] == 3
+        assert snapshot["wait_max"] >= 0.05
+    finally:
+        engine.dispose()
+
+
+def test_metrics_survive_engine_dispose(tmp_path, isolated_registry):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool
+    )
+    metrics = instrument_engine("test", engine)
+    engine.dispose()
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert metrics.pool is engine.pool
+    assert metrics.snapshot()["wait_count"] == 1
+    engine.dispose()
+
+
+def test_metrics_endpoint_renders_prometheus_text(client):
+    assert client.get("/healthz").status_code == 200
+    client.get("/readyz")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE db_pool_checkouts_total counter" in body
+    assert 'db_pool_checkouts_total{engine="orm"}' in body
+    assert 'db_pool_checkouts_total{engine="core"}' in body
+    assert 'db_pool_checkout_wait_seconds_count{engine="orm"}' in body
+
+
+def test_concurrent_checkouts_are_counted_once(tmp_path, isolated_registry):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=4,
+        connect_args={"check_same_thread": False},
+    )
+    metrics = instrument_engine("test", engine)
+
+    def _work() -> None:
+        for _ in range(25):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+    threads = [threading.Thread(target=_work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["checkouts"] == 100
+    assert snapshot["checked_out"] == 0
+    assert snapshot["wait_count"] == 100
+    engine.dispose()
@@ -0,0 +1,42 @@
+"""Handlers that use the synchronous Session must not run on the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi.routing import APIRoute
+
+from app.main import app
+
+# Route paths served by handlers that query the database.
+DB_ROUTES = {
+    ("POST", "/api/sessions"),
+    ("POST", "/api/self/submit"),
+    ("POST", "/api/other/submit"),
+    ("GET", "/api/result/{invite_token}"),
+    ("GET", "/share/og/{invite_token}.png"),
+    ("POST", "/v1/participants/{invite_token}"),
+    ("POST", "/v1/answers/{participant_id}"),
+    ("GET", "/v1/invites/{invite_token}/status"),
+    ("POST", "/api/couples/sessions/{session_id}/compute"),
+}
+
+
+def _routes():
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        for method in route.methods:
+            if (method, route.path) in DB_ROUTES:
+                yield method, route.path, route.endpoint
+
+
+def test_all_db_routes_are_registered():
+    assert {(method, path) for method, path, _ in _routes()} == DB_ROUTES
+
+
+@pytest.mark.parametrize("method, path, endpoint", list(_routes()))
+def test_db_handlers_run_in_threadpool(method, path, endpoint):
+    # FastAPI runs plain ``def`` endpoints in its threadpool.
+    assert not asyncio.iscoroutinefunction(endpoint), f"{method} {path} blocks the event loop"
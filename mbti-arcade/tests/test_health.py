@@ -46,3 +46,13 @@ def test_readyz_succeeds_when_dependencies_are_healthy(client, monkeypatch):
     assert payload["status"] == "ready"
     assert payload["checks"]["redis"]["status"] == "ok"
     assert payload["checks"]["database"]["status"] == "ok"
+
+
+def test_readyz_reports_sqlite_journal_mode(client, monkeypatch):
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+    response = client.get("/readyz")
+
+    database = response.json()["checks"]["database"]
+    # The test suite runs on an in-memory database, which cannot use WAL.
+    assert database["journal_mode"] == "memory"
@@ -0,0 +1,116 @@
+"""Legacy Pair/Response database: shared-engine mode and data migration."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select
+from sqlmodel import Session as SQLModelSession, SQLModel
+
+from app.core.db import engine as core_engine
+from app.core.models_db import Friend, Pair, Response
+from scripts.migrate_legacy_db import migrate
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_shared_mode_uses_the_main_engine(tmp_path):
+    script = (
+        "import json, sqlalchemy as sa\n"
+        "import app.core.db as core, app.database as main\n"
+        "import app.core.models_db, app.models\n"
+        "core.init_db()\n"
+        "main.Base.metadata.create_all(main.engine)\n"
+        "print(json.dumps({'same': core.engine is main.engine,\n"
+        "    'tables': sorted(sa.inspect(main.engine).get_table_names())}))\n"
+    )
+    env = {
+        **os.environ,
+        "LEGACY_DB_MODE": "shared",
+        "DATABASE_URL": f"sqlite:///{tmp_path / 'main.db'}",
+        "PYTHONPATH": str(PROJECT_ROOT),
+    }
+    env.pop("PYTEST_CURRENT_TEST", None)
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    payload = json.loads(result.stdout.strip().splitlines()[-1])
+    assert payload["same"] is True
+    assert {"pair", "response", "friend", "sessions"} <= set(payload["tables"])
+
+
+def test_share_link_does_not_write_legacy_pair(client):
+    response = client.post(
+        "/share",
+        data={"display_name": "테스트 사용자", "mbti_value": "INTJ"},
+        follow_redirects=False,
+    )
+    assert response.status_code == 303
+
+    with SQLModelSession(core_engine) as session:
+        assert session.exec(select(func.count()).select_from(Pair)).one()[0] == 0
+
+
+def _seed_legacy(url: str) -> None:
+    engine = create_engine(url)
+    SQLModel.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    with SQLModelSession(engine) as session:
+        session.add(Friend(email="a@example.com", name="A", created_at=now))
+        session.add(Pair(id="p1", mode="friend", friend_email="a@example.com", my_name="A"))
+        session.add(Pair(id="p2", mode="self", friend_email=None, my_name="B"))
+        session.commit()
+        session.add(
+            Response(
+                pair_id="p1",
+                role="other",
+                answers="{}",
+                mbti_type="INTJ",
+                scores="{}",
+                raw_scores="{}",
+            )
+        )
+        session.commit()
+    engine.dispose()
+
+
+def test_migrate_copies_legacy_rows_once(tmp_path):
+    source_url = f"sqlite:///{tmp_path / 'mbti.db'}"
+    target_url = f"sqlite:///{tmp_path / 'main.db'}"
+    _seed_legacy(source_url)
+    source = create_engine(source_url)
+    target = create_engine(target_url)
+
+    try:
+        preview = migrate(source, target, dry_run=True)
+        assert preview["pair"] == {"copied": 2, "skipped": 0}
+
+        first = migrate(source, target, batch_size=1)
+        assert first == {
+            "friend": {"copied": 1, "skipped": 0},
+            "pair": {"copied": 2, "skipped": 0},
+            "response": {"copied": 1, "skipped": 0},
+        }
+
+        second = migrate(source, target)
+        assert all(entry["copied"] == 0 for entry in second.values())
+        assert second["pair"]["skipped"] == 2
+
+        with SQLModelSession(target) as session:
+            pair = session.get(Pair, "p1")
+            assert pair is not None and pair.my_name == "A"
+            assert session.exec(select(Response.pair_id)).all()[0][0] == "p1"
+    finally:
+        source.dispose()
+        target.dispose()
@@ -73,3 +73,213 @@ def test_og_image_after_unlock_includes_headers(client):
     assert response.headers["Cache-Control"].startswith("public")
     width, height = _extract_dimensions(response.content)
     assert (width, height) == (1200, 630)
+
+
+def _unlock(client, session: dict) -> None:
+    _submit_self(client, session["session_id"])
+    for suffix in range(3):
+        client.post(
+            "/api/other/submit",
+            json={
+                "invite_token": session["invite_token"],
+                "relation_tag": "friend",
+                "rater_key": f"r{suffix}",
+                "answers": _answers("basic"),
+            },
+        )
+
+
+def _forbid_rendering(monkeypatch) -> None:
+    from app.routers import og
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("share card should not be re-rendered")
+
+    monkeypatch.setattr(og, "render_share_card", _fail)
+
+
+def test_og_image_conditional_get_skips_rendering(client, monkeypatch):
+    session = _create_session(client)
+    _unlock(client, session)
+    url = f"/share/og/{session['invite_token']}.png"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    _forbid_rendering(monkeypatch)
+    revalidated = client.get(url, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+    assert revalidated.headers["X-Robots-Tag"] == NOINDEX_VALUE
+
+    cached = client.get(url)
+    assert cached.status_code == 200
+    assert cached.content == first.content
+
+
+def test_og_image_etag_changes_with_new_submission(client):
+    session = _create_session(client)
+    _unlock(client, session)
+    url = f"/share/og/{session['invite_token']}.png"
+    before = client.get(url).headers["ETag"]
+
+    client.post(
+        "/api/other/submit",
+        json={
+            "invite_token": session["invite_token"],
+            "relation_tag": "friend",
+            "rater_key": "r-late",
+            "answers": _answers("basic"),
+        },
+    )
+
+    response = client.get(url, headers={"If-None-Match": before})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != before
+
+
+def test_render_cache_evicts_by_byte_budget_and_reads_disk(tmp_path):
+    from app.og import RenderCache
+
+    cache = RenderCache(max_bytes=10, directory=tmp_path)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    assert cache.get("a") == b"12345"  # refresh "a" so "b" is least recent
+    cache.put("c", b"12345")
+    assert len(cache) == 2
+    assert cache.size == 10
+
+    memory_only = RenderCache(max_bytes=10)
+    memory_only.put("b", b"12345")
+    memory_only.put("c", b"12345")
+    memory_only.put("d", b"12345")
+    assert memory_only.get("b") is None
+
+    # Evicted from memory but still on disk.
+    assert cache.get("b") == b"12345"
+    fresh = RenderCache(max_bytes=10, directory=tmp_path)
+    assert fresh.get("c") == b"12345"
+
+
+def _reference_text(canvas, x, y, text, color, scale, spacing=1):
+    from app.og.font import FONT_5X7
+
+    cursor_x = x
+    for char in text.upper():
+        glyph = FONT_5X7.get(char)
+        if glyph is None:
+            cursor_x += 5 * scale + spacing * scale
+            continue
+        for gy, line in enumerate(glyph):
+            for gx, ch in enumerate(line):
+                if ch != "#":
+                    continue
+                for sy in range(scale):
+                    for sx in range(scale):
+                        canvas.set_pixel(cursor_x + gx * scale + sx, y + gy * scale + sy, color)
+        cursor_x += len(glyph[0]) * scale + spacing * scale
+
+
+def test_canvas_span_drawing_matches_per_pixel_reference():
+    from app.og.image import Canvas
+
+    color = (200, 10, 30, 255)
+    fast = Canvas(64, 24, (0, 0, 0, 255))
+    slow = Canvas(64, 24, (0, 0, 0, 255))
+
+    # Partially off-canvas on every side to exercise clipping.
+    fast.fill_rect(-5, -3, 20, 8, (1, 2, 3, 255))
+    for yy in range(-3, 5):
+        for xx in range(-5, 15):
+            slow.set_pixel(xx, yy, (1, 2, 3, 255))
+    fast.fill_rect(60, 20, 10, 10, (4, 5, 6, 255))
+    for yy in range(20, 30):
+        for xx in range(60, 70):
+            slow.set_pixel(xx, yy, (4, 5, 6, 255))
+
+    for x, y, scale in ((-7, 2, 2), (20, -4, 3), (50, 12, 2)):
+        fast.draw_text(x, y, "GAP 4.2 ?", color, scale=scale)
+        _reference_text(slow, x, y, "GAP 4.2 ?", color, scale)
+
+    assert [bytes(row) for row in fast.rows] == [bytes(row) for row in slow.rows]
+
+
+def _decode_png(data: bytes):
+    import zlib
+
+    assert data.startswith(b"\x89PNG\r\n\x1a\n")
+    offset = 8
+    chunks = []
+    while offset < len(data):
+        length = int.from_bytes(data[offset : offset + 4], "big")
+        chunk_type = data[offset + 4 : offset + 8]
+        body = data[offset + 8 : offset + 8 + length]
+        crc = int.from_bytes(data[offset + 8 + length : offset + 12 + length], "big")
+        assert zlib.crc32(chunk_type + body) == crc, chunk_type
+        chunks.append((chunk_type, body))
+        offset += 12 + length
+    assert chunks[0][0] == b"IHDR" and chunks[-1][0] == b"IEND"
+
+    ihdr = chunks[0][1]
+    width = int.from_bytes(ihdr[:4], "big")
+    height = int.from_bytes(ihdr[4:8], "big")
+    color_type = ihdr[9]
+    raw = zlib.decompress(b"".join(body for kind, body in chunks if kind == b"IDAT"))
+    bpp = 4 if color_type == 6 else 1
+    stride = width * bpp + 1
+    assert len(raw) == stride * height
+
+    palette = next((body for kind, body in chunks if kind == b"PLTE"), None)
+    alphas = next((body for kind, body in chunks if kind == b"tRNS"), b"")
+    rows = []
+    for y in range(height):
+        line = raw[y * stride : (y + 1) * stride]
+        assert line[0] == 0  # filter type None
+        pixels = line[1:]
+        if color_type == 3:
+            pixels = b"".join(
+                palette[i * 3 : i * 3 + 3] + bytes([alphas[i] if i < len(alphas) else 255])
+                for i in pixels
+            )
+        rows.append(pixels)
+    idat_count = sum(1 for kind, _ in chunks if kind == b"IDAT")
+    return color_type, rows, idat_count
+
+
+def test_canvas_png_round_trips_in_rgba_and_palette_modes():
+    from app.og.image import Canvas
+
+    canvas = Canvas(40, 70, (15, 23, 42, 255))
+    canvas.fill_rect(3, 4, 30, 20, (17, 99, 255, 255))
+    canvas.fill_rect(10, 30, 5, 5, (0, 0, 0, 128))
+    canvas.draw_text(2, 40, "OK 7", (236, 252, 255, 255), scale=2)
+    expected = [bytes(row) for row in canvas.rows]
+
+    color_type, rows, _ = _decode_png(canvas.to_png())
+    assert (color_type, rows) == (6, expected)
+
+    color_type, rows, _ = _decode_png(canvas.to_png(palette=True, compression_level=9))
+    assert (color_type, rows) == (3, expected)
+
+    _, rows, idat_count = _decode_png(canvas.to_png(compression_level=0, chunk_size=512))
+    assert idat_count > 1
+    assert rows == expected
+
+
+def test_canvas_palette_falls_back_to_rgba_past_256_colors():
+    from app.og.image import Canvas
+
+    canvas = Canvas(300, 2, (0, 0, 0, 255))
+    for x in range(300):
+        canvas.set_pixel(x, 0, (x % 256, x // 256, 7, 255))
+    assert canvas.palette is None
+
+    color_type, rows, _ = _decode_png(canvas.to_png(palette=True))
+    assert color_type == 6
+    assert rows == [bytes(row) for row in canvas.rows]
+
+    clone = canvas.clone()
+    clone.set_pixel(0, 1, (9, 9, 9, 255))
+    assert bytes(canvas.rows[1][:4]) == bytes((0, 0, 0, 255))
@@ -3,6 +3,7 @@ from collections import Counter
 import pytest
 
 from app.main import _build_questions
+from app.models import AppMetadata, Question
 from app.data.questionnaire_loader import get_question_seeds
 from app.data.questions import questions_for_mode, select_invite_other_questions
 
@@ -102,3 +103,56 @@ def test_build_questions_keeps_self_test_count_unchanged():
 @pytest.mark.parametrize("mode", ["friend", "work", "partner", "family"])
 def test_build_questions_invite_other_count_is_twenty(mode: str):
     assert len(_build_questions(mode, perspective="other")) == 20
+
+
+def test_question_index_survives_noop_reseed(client):
+    from app.data.loader import QUESTIONNAIRE_DIGEST_KEY, seed_questions
+    from app.data.question_index import get_question_index
+    from app.database import SessionLocal
+
+    with SessionLocal() as db:
+        index = get_question_index(db)
+        assert len(index) == len(get_question_seeds())
+
+        assert seed_questions(db) is False
+        assert get_question_index(db) is index
+
+        record = db.query(Question).filter(Question.code == get_question_seeds()[0].code).one()
+        record.sign = -record.sign
+        db.delete(db.get(AppMetadata, QUESTIONNAIRE_DIGEST_KEY))
+        db.commit()
+        assert seed_questions(db) is True
+        reloaded = get_question_index(db)
+        assert reloaded is not index
+        assert reloaded.digest == index.digest
+
+
+def test_seed_questions_skips_when_digest_matches(client, capture_sql):
+    from app.data.loader import seed_questions
+    from app.database import SessionLocal
+
+    with capture_sql() as statements:
+        with SessionLocal() as db:
+            assert seed_questions(db) is False
+
+    assert len(statements) == 1
+    assert "app_metadata" in statements[0].statement
+
+
+def test_seed_questions_restores_only_drifted_rows(client):
+    from app.data.loader import QUESTIONNAIRE_DIGEST_KEY, seed_questions
+    from app.database import SessionLocal
+
+    first, second = get_question_seeds()[:2]
+    with SessionLocal() as db:
+        db.delete(db.get(Question, first.id))
+        db.get(Question, second.id).prompt_self = "stale prompt"
+        db.delete(db.get(AppMetadata, QUESTIONNAIRE_DIGEST_KEY))
+        db.commit()
+
+        assert seed_questions(db) is True
+        db.expire_all()
+        assert db.get(Question, first.id).code == first.code
+        assert db.get(Question, second.id).prompt_self == second.prompt_self
+        assert db.query(Question).count() == len(get_question_seeds())
+        assert db.get(AppMetadata, QUESTIONNAIRE_DIGEST_KEY) is not None
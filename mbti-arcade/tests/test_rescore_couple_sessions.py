@@ -0,0 +1,100 @@
+"""Offline rescoring of couple sessions with scripts.rescore_couple_sessions."""
+
+from __future__ import annotations
+
+import json
+
+from sqlalchemy import func, select
+
+import app.core_scoring as core_scoring
+from app.couple.models import CoupleResult, DecisionPacket
+from app.couple.services import CoupleService
+from app.database import SessionLocal
+from scripts.rescore_couple_sessions import rescore_couple_sessions
+
+from .test_couple_flow import _create_session, _submit_both
+
+
+def _prepare_sessions(client) -> list[str]:
+    computed = _create_session(client)
+    _submit_both(client, computed)
+    response = client.post(
+        f"/api/couples/sessions/{computed['session_id']}/compute",
+        json={"access_token": computed["participants"][0]["access_token"]},
+    )
+    assert response.status_code == 200
+
+    never_computed = _create_session(client)
+    _submit_both(client, never_computed)
+
+    incomplete = _create_session(client)
+    return [computed["session_id"], never_computed["session_id"], incomplete["session_id"]]
+
+
+def _packet_count() -> int:
+    with SessionLocal() as db:
+        return db.scalar(select(func.count()).select_from(DecisionPacket))
+
+
+def test_dry_run_reports_rule_changes_without_writing(client, tmp_path, monkeypatch):
+    computed_id, fresh_id, _ = _prepare_sessions(client)
+    monkeypatch.setattr(core_scoring, "gap_grade", lambda delta: "rescored")
+    packets_before = _packet_count()
+
+    summary = rescore_couple_sessions(
+        workers=0, dry_run=True, checkpoint_path=tmp_path / "checkpoint.json"
+    )
+
+    assert summary["sessions_scored"] == 1
+    assert summary["results_written"] == 0
+    changed = {change["session_id"]: change for change in summary["changes"]}
+    assert set(changed) == {computed_id}
+    assert changed[computed_id]["grade"][1] == "rescored"
+    assert _packet_count() == packets_before
+    assert not (tmp_path / "checkpoint.json").exists()
+    with SessionLocal() as db:
+        assert db.get(CoupleResult, fresh_id) is None
+
+
+def test_rescore_writes_in_chunks_and_resumes(client, tmp_path, monkeypatch):
+    computed_id, fresh_id, _ = _prepare_sessions(client)
+    monkeypatch.setattr(core_scoring, "gap_grade", lambda delta: "rescored")
+    checkpoint = tmp_path / "checkpoint.json"
+
+    summary = rescore_couple_sessions(workers=0, chunk_size=1, checkpoint_path=checkpoint)
+
+    assert summary["sessions_scored"] == 1
+    assert summary["results_written"] == 1
+    assert json.loads(checkpoint.read_text())["last_session_id"] == computed_id
+    with SessionLocal() as db:
+        result = db.get(CoupleResult, computed_id)
+        assert result.gap_summary["grade"] == "rescored"
+        assert db.scalar(
+            select(DecisionPacket).where(
+                DecisionPacket.session_id == computed_id,
+                DecisionPacket.packet_sha256 == result.packet_sha256,
+            )
+        )
+        assert CoupleService(db).verify_chain(computed_id).ok
+        # Sessions that never called compute are left for compute to score.
+        assert db.get(CoupleResult, fresh_id) is None
+
+    # Everything up to the checkpoint is done; a full re-run finds no changes.
+    resumed = rescore_couple_sessions(workers=0, resume=True, checkpoint_path=checkpoint)
+    assert resumed["sessions_scored"] == 0
+    rerun = rescore_couple_sessions(workers=0, checkpoint_path=checkpoint)
+    assert rerun["results_unchanged"] == 1
+    assert rerun["packets_written"] == 0
+
+
+def test_rescore_in_process_pool_matches_api_result(client, tmp_path):
+    computed_id, _, _ = _prepare_sessions(client)
+    with SessionLocal() as db:
+        before = db.get(CoupleResult, computed_id).gap_summary
+
+    summary = rescore_couple_sessions(workers=2, checkpoint_path=tmp_path / "checkpoint.json")
+
+    assert summary["sessions_scored"] == 1
+    assert summary["results_unchanged"] == 1
+    with SessionLocal() as db:
+        assert db.get(CoupleResult, computed_id).gap_summary == before
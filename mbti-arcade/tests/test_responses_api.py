@@ -1,6 +1,8 @@
 # 파일: mbti-arcade/tests/test_responses_api.py
 
 from app.data.questions import questions_for_mode
+from app.database import SessionLocal
+from app.models import OtherResponse
 
 
 def _create_session(client, mode: str = "basic") -> dict:
@@ -129,3 +131,37 @@ def test_submit_other_unknown_invite_returns_problem_details(client):
     body = response.json()
     assert body["type"].endswith("/invite-not-found")
     assert body["title"] == "Invite Not Found"
+
+
+def test_submit_other_writes_answers_in_one_bulk_insert(client, capture_sql):
+    session = _create_session(client)
+    answers = _build_answers("basic")
+    client.post(
+        "/api/self/submit",
+        json={"session_id": session["session_id"], "answers": answers},
+    )
+
+    with capture_sql() as statements:
+        payload = {
+            "invite_token": session["invite_token"],
+            "answers": answers,
+            "relation_tag": "friend",
+            "rater_key": "bulk-rater",
+        }
+        assert client.post("/api/other/submit", json=payload).status_code == 201
+        # Resubmitting replaces the rater's rows instead of colliding with them.
+        assert client.post("/api/other/submit", json=payload).status_code == 201
+
+    inserts = [
+        s for s in statements if s.statement.lstrip().upper().startswith("INSERT INTO RESPONSES_OTHER")
+    ]
+    assert len(inserts) == 2
+    assert all(s.executemany for s in inserts)
+
+    with SessionLocal() as db:
+        stored = (
+            db.query(OtherResponse)
+            .filter(OtherResponse.session_id == session["session_id"])
+            .count()
+        )
+    assert stored == len(answers)
@@ -73,3 +73,45 @@ def test_fetch_result_enforces_k_threshold_before_and_after_unlock(client):
     assert unlocked_body["other_norm"] is not None
     assert unlocked_body["gap"] is not None
     assert unlocked_body["gap_score"] is not None
+
+
+def test_fetch_result_serves_current_aggregate_without_writes(client, capture_sql):
+    session = _create_session(client)
+    _submit_self(client, session["session_id"])
+    for key in ("r1", "r2", "r3"):
+        _submit_other(client, session["invite_token"], rater_key=key)
+
+    first = client.get(f"/api/result/{session['invite_token']}")
+    assert first.status_code == 200
+
+    with capture_sql() as statements:
+        second = client.get(f"/api/result/{session['invite_token']}")
+
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert [s.statement for s in statements if s.is_write] == []
+
+
+def test_fetch_result_rebuilds_stale_aggregate(client):
+    from app.database import SessionLocal
+    from app.models import Aggregate, Session as SessionModel
+
+    session = _create_session(client)
+    _submit_self(client, session["session_id"])
+    for key in ("r1", "r2", "r3"):
+        _submit_other(client, session["invite_token"], rater_key=key)
+
+    fresh = client.get(f"/api/result/{session['invite_token']}").json()
+
+    with SessionLocal() as db:
+        record = db.get(SessionModel, session["session_id"])
+        record.responses_version += 1
+        db.commit()
+        expected_version = record.responses_version
+
+    rebuilt = client.get(f"/api/result/{session['invite_token']}")
+    assert rebuilt.status_code == 200
+    assert rebuilt.json() == fresh
+
+    with SessionLocal() as db:
+        assert db.get(Aggregate, session["session_id"]).version == expected_version
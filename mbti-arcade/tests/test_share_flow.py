@@ -93,6 +93,12 @@ def test_share_flow(client):
     assert status_body["respondent_count"] == 1
     assert status_body["threshold"] == 3
 
+    # Re-submitting the same participant's form does not count twice.
+    resubmit = client.post("/mbti/result", data=quiz_data)
+    assert resubmit.status_code == 200
+    status = client.get(f"/v1/invites/{test_token}/status")
+    assert status.json()["respondent_count"] == 1
+
 
 def test_expired_token(client):
     """만료된 토큰 테스트"""
@@ -0,0 +1,77 @@
+"""SQLite connection pragma profile tests."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.utils.sqlite_pragmas import install_sqlite_pragmas, journal_mode, resolve_pragmas
+
+
+def _pragma(connection, name: str):
+    return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_production_profile_applies_to_every_pooled_connection(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}", pool_size=2)
+    install_sqlite_pragmas(engine, profile="production", overrides="")
+
+    try:
+        with engine.connect() as first, engine.connect() as second:
+            for connection in (first, second):
+                assert journal_mode(connection) == "wal"
+                assert _pragma(connection, "synchronous") == 1  # NORMAL
+                assert _pragma(connection, "busy_timeout") == 5000
+                assert _pragma(connection, "cache_size") == -20000
+                assert _pragma(connection, "temp_store") == 2  # MEMORY
+    finally:
+        engine.dispose()
+
+
+def test_overrides_replace_profile_entries(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    install_sqlite_pragmas(engine, profile="production", overrides="busy_timeout=250, synchronous=FULL")
+
+    try:
+        with engine.connect() as connection:
+            assert _pragma(connection, "busy_timeout") == 250
+            assert _pragma(connection, "synchronous") == 2  # FULL
+    finally:
+        engine.dispose()
+
+
+def test_off_profile_keeps_rollback_journal(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    assert install_sqlite_pragmas(engine, profile="off", overrides="") == {}
+
+    try:
+        with engine.connect() as connection:
+            assert journal_mode(connection) == "delete"
+    finally:
+        engine.dispose()
+
+
+def test_in_memory_database_skips_wal():
+    engine = create_engine("sqlite://")
+    pragmas = install_sqlite_pragmas(engine, profile="production", overrides="")
+
+    assert "journal_mode" not in pragmas
+    with engine.connect() as connection:
+        assert journal_mode(connection) == "memory"
+        assert _pragma(connection, "busy_timeout") == 5000
+
+
+def test_profile_selected_from_environment(monkeypatch):
+    monkeypatch.setenv("SQLITE_PRAGMA_PROFILE", "default")
+    monkeypatch.setenv("SQLITE_PRAGMAS", "cache_size=-4000")
+
+    assert resolve_pragmas() == {"busy_timeout": "5000", "cache_size": "-4000"}
+
+
+@pytest.mark.parametrize(
+    "profile, overrides",
+    [("turbo", ""), ("production", "journal_mode"), ("production", "1=2")],
+)
+def test_invalid_configuration_is_rejected(profile, overrides):
+    with pytest.raises(ValueError):
+        resolve_pragmas(profile, overrides)
@@ -0,0 +1,125 @@
+"""Import cost and the fast-start path of application startup."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+from sqlalchemy import Column, Integer, MetaData, Table
+
+import app.main as main_module
+from app.routers import owner, quiz
+from app.utils import startup_marker
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+# Self time of app-owned modules while importing app.main (about 0.5 s here);
+# override with IMPORT_TIME_BUDGET_MS on slower machines.
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1500"))
+
+
+def _app_import_self_ms(stderr: str) -> dict[str, float]:
+    modules: dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:") :].split("|")
+        name = name.strip()
+        if name == "app" or name.startswith("app."):
+            modules[name] = int(self_us) / 1000
+    return modules
+
+
+def test_import_stays_lazy_and_within_budget():
+    script = (
+        "import json, app.main\n"
+        "from app.data.questionnaire_loader import get_questionnaire\n"
+        "from app.og.renderer import _base_template\n"
+        "print(json.dumps({'questionnaire': get_questionnaire.cache_info().currsize,\n"
+        "    'og_template': _base_template.cache_info().currsize}))\n"
+    )
+    env = {
+        **os.environ,
+        "DATABASE_URL": "sqlite+pysqlite:///:memory:",
+        "PYTHONPATH": str(PROJECT_ROOT),
+    }
+    env.pop("PYTEST_CURRENT_TEST", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    assert loaded == {"questionnaire": 0, "og_template": 0}
+
+    modules = _app_import_self_ms(result.stderr)
+    assert "app.main" in modules
+    total = sum(modules.values())
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:5]
+    assert total < IMPORT_TIME_BUDGET_MS, f"app import took {total:.0f} ms: {slowest}"
+
+
+def test_html_routers_share_one_template_environment():
+    assert owner.templates is main_module.templates
+    assert quiz.templates is main_module.templates
+    assert "escapejs" in main_module.templates.env.filters
+
+
+def _make_db(path: Path) -> None:
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+
+
+def test_marker_tracks_schema_questionnaire_and_database(tmp_path, monkeypatch):
+    metadata = MetaData()
+    Table("t", metadata, Column("id", Integer, primary_key=True))
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    assert startup_marker.startup_state([url], [metadata]) is None
+
+    _make_db(tmp_path / "app.db")
+    marker = startup_marker.marker_path(url)
+    assert marker == tmp_path / "app.db.startup.json"
+    state = startup_marker.startup_state([url], [metadata])
+    startup_marker.write_marker(marker, state)
+    assert startup_marker.marker_is_current(marker, startup_marker.startup_state([url], [metadata]))
+
+    # A model change, a questionnaire edit or a schema change on disk each
+    # invalidate the marker.
+    Table("u", metadata, Column("id", Integer, primary_key=True))
+    assert not startup_marker.marker_is_current(marker, startup_marker.startup_state([url], [metadata]))
+    metadata.remove(metadata.tables["u"])
+
+    monkeypatch.setattr(startup_marker, "get_questionnaire_file_digest", lambda: "edited")
+    assert not startup_marker.marker_is_current(marker, startup_marker.startup_state([url], [metadata]))
+    monkeypatch.undo()
+
+    with sqlite3.connect(tmp_path / "app.db") as conn:
+        conn.execute("ALTER TABLE t ADD COLUMN extra TEXT")
+    assert not startup_marker.marker_is_current(marker, startup_marker.startup_state([url], [metadata]))
+
+
+def test_startup_skips_repair_when_marker_is_current(tmp_path, monkeypatch):
+    marker = tmp_path / "startup.json"
+    repairs: list[str] = []
+    monkeypatch.setattr(startup_marker, "marker_path", lambda url: marker)
+    monkeypatch.setattr(main_module, "_startup_state", lambda: {"schema": "s", "databases": {}})
+    monkeypatch.setattr(main_module, "repair_sqlite_schema_for_url", repairs.append)
+
+    asyncio.run(main_module.startup_event())
+    assert repairs and marker.exists()
+
+    repairs.clear()
+    asyncio.run(main_module.startup_event())
+    assert repairs == []
+
+    monkeypatch.setenv("FAST_START", "0")
+    asyncio.run(main_module.startup_event())
+    assert repairs
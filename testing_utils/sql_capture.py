@@ -0,0 +1,44 @@
+"""Record the SQL an engine sends, for query-count and no-write assertions."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Iterator, List, NamedTuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+WRITE_VERBS = frozenset({"INSERT", "UPDATE", "DELETE"})
+
+
+class CapturedStatement(NamedTuple):
+    statement: str
+    parameters: Any
+    executemany: bool
+
+    @property
+    def verb(self) -> str:
+        return self.statement.lstrip().split(None, 1)[0].upper()
+
+    @property
+    def is_write(self) -> bool:
+        return self.verb in WRITE_VERBS
+
+
+@contextmanager
+def capture_statements(engine: Engine) -> Iterator[List[CapturedStatement]]:
+    """Collect every statement ``engine`` executes inside the ``with`` block."""
+
+    statements: List[CapturedStatement] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(CapturedStatement(statement, parameters, executemany))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+__all__ = ["CapturedStatement", "WRITE_VERBS", "capture_statements"]